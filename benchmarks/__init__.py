@@ -0,0 +1,10 @@
+"""
+    benchmarks
+    ~~~~~~~~~~
+
+    Benchmarks de desempenho do python-cartolafc, executados contra um servidor local que simula a API do Cartola FC.
+
+    Uso:
+        $ python -m benchmarks
+        $ python -m benchmarks --save-baseline
+"""
@@ -0,0 +1,177 @@
+import socket
+import threading
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from .stub_server import load_testdata_routes
+
+
+def _h2() -> Any:
+    try:
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+    except ImportError:
+        raise RuntimeError(
+            "O servidor HTTP/2 requer o pacote h2: pip install Python-CartolaFC[http2]"
+        )
+    return h2
+
+
+class _Conexao(object):
+    def __init__(self, h2: Any, sock: socket.socket) -> None:
+        self.sock = sock
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.lock = threading.Lock()
+        self.pendentes: Dict[int, bytes] = {}
+
+
+class H2StubServer(object):
+    """Servidor HTTP/2 local (h2c, sem TLS) que simula a API do Cartola FC, para comparar os transportes com o
+    benchmarks.stub_server.StubServer. Cada requisição é respondida em uma thread própria após a latência, de modo que
+    as requisições de uma mesma conexão são atendidas de forma multiplexada.
+
+    Exemplo de uso:
+        >>> with H2StubServer(load_testdata_routes(), latency=0.005) as server:
+        ...     api = cartolafc.Api(transport=HttpxTransport(prior_knowledge=True))
+        ...     api._api_url = server.url
+        ...     api.mercado()
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Mapping[str, bytes]] = None,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._h2 = _h2()
+        self.routes = routes if routes is not None else load_testdata_routes()
+        self.latency = latency
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._sock = socket.create_server((host, port))
+        self._thread: Optional[threading.Thread] = None
+        self._ativo = False
+
+    @property
+    def url(self) -> str:
+        host, port = self._sock.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "H2StubServer":
+        self._ativo = True
+        self._thread = threading.Thread(target=self._aceitar, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._ativo = False
+        # close() não interrompe um accept() em andamento em outra thread; shutdown() sim.
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "H2StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _aceitar(self) -> None:
+        while self._ativo:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(target=self._atender, args=(sock,), daemon=True).start()
+
+    def _atender(self, sock: socket.socket) -> None:
+        eventos_h2 = self._h2.events
+        conexao = _Conexao(self._h2, sock)
+        with conexao.lock:
+            conexao.conn.initiate_connection()
+            sock.sendall(conexao.conn.data_to_send())
+        try:
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                with conexao.lock:
+                    eventos = conexao.conn.receive_data(data)
+                    for evento in eventos:
+                        if isinstance(evento, eventos_h2.RequestReceived):
+                            caminho = dict(evento.headers)[":path"]
+                            threading.Timer(
+                                self.latency,
+                                self._responder,
+                                args=(conexao, evento.stream_id, caminho),
+                            ).start()
+                        elif isinstance(evento, eventos_h2.StreamReset):
+                            conexao.pendentes.pop(evento.stream_id, None)
+                        elif isinstance(evento, eventos_h2.ConnectionTerminated):
+                            return
+                    # Janelas de controle de fluxo podem ter sido liberadas (WindowUpdated).
+                    self._enviar(conexao)
+        except (OSError, self._h2.exceptions.ProtocolError):
+            return
+        finally:
+            sock.close()
+
+    def _responder(self, conexao: _Conexao, stream_id: int, caminho: str) -> None:
+        with self._lock:
+            self.requests += 1
+        body = self.routes.get(urlsplit(caminho).path)
+        status = 200
+        if body is None:
+            status, body = 404, b'{"mensagem": "Recurso nao encontrado"}'
+        with conexao.lock:
+            try:
+                conexao.conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", str(status)),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(body))),
+                    ],
+                )
+                conexao.pendentes[stream_id] = body
+                self._enviar(conexao)
+            except (OSError, self._h2.exceptions.ProtocolError):
+                pass
+
+    def _enviar(self, conexao: _Conexao) -> None:
+        """Envia o corpo das respostas pendentes até onde as janelas de controle de fluxo permitem."""
+
+        conn = conexao.conn
+        for stream_id, body in list(conexao.pendentes.items()):
+            try:
+                while body:
+                    janela = min(
+                        conn.local_flow_control_window(stream_id),
+                        conn.max_outbound_frame_size,
+                    )
+                    if janela <= 0:
+                        break
+                    conn.send_data(stream_id, body[:janela])
+                    body = body[janela:]
+                if body:
+                    conexao.pendentes[stream_id] = body
+                else:
+                    conn.end_stream(stream_id)
+                    del conexao.pendentes[stream_id]
+            except self._h2.exceptions.StreamClosedError:
+                del conexao.pendentes[stream_id]
+        dados = conn.data_to_send()
+        if dados:
+            conexao.sock.sendall(dados)
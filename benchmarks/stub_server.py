@@ -0,0 +1,164 @@
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Mapping, MutableMapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+TESTDATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "testdata"
+)
+
+_rotas_testdata = {
+    "/atletas/mercado": "mercado_atletas.json",
+    "/atletas/pontuados": "parciais.json",
+    "/clubes": "clubes.json",
+    "/ligas": "ligas.json",
+    "/mercado/destaques": "mercado_destaques.json",
+    "/mercado/destaques/reservas": "mercado_destaques_reservas.json",
+    "/mercado/status": "mercado_status_fechado.json",
+    "/partidas": "partidas.json",
+    "/patrocinadores": "patrocinadores.json",
+    "/pos-rodada/destaques": "pos_rodada_destaques.json",
+    "/time/id/471815": "time.json",
+    "/times": "times.json",
+}
+
+_pagina_sobrecarga = (
+    b"<html><body><h1>503 Service Unavailable</h1>"
+    b"Globo.com - Desculpe-nos, nossos servidores estao sobrecarregados.</body></html>"
+)
+
+Latency = Union[float, Tuple[float, float]]
+
+
+def load_testdata(nome: str) -> bytes:
+    with open(os.path.join(TESTDATA_DIR, nome), "rb") as f:
+        return f.read()
+
+
+def load_testdata_routes() -> Dict[str, bytes]:
+    """Mapeia os caminhos da API do Cartola FC para o conteúdo dos arquivos em tests/testdata.
+
+    Returns:
+        Um dicionário, onde a key é o caminho (ex.: /atletas/mercado) e o valor é o corpo da resposta.
+    """
+
+    return {rota: load_testdata(arquivo) for rota, arquivo in _rotas_testdata.items()}
+
+
+class StubServer(object):
+    """Servidor HTTP local que simula a API do Cartola FC, com injeção de latência e de falhas.
+
+    Exemplo de uso:
+        >>> with StubServer(load_testdata_routes(), latency=0.005) as server:
+        ...     api = cartolafc.Api()
+        ...     api._api_url = server.url
+        ...     api.mercado()
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Mapping[str, bytes]] = None,
+        latency: Latency = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Instancia um novo servidor, que só começa a responder após start().
+
+        Args:
+            routes (Mapping): Corpo das respostas por caminho. Se não for informado, são usados os dados de testes.
+            latency (float | tuple): Latência fixa, ou intervalo (mínima, máxima), em segundos, de cada resposta.
+            failure_rate (float): Fração das requisições (0 a 1) respondidas com uma página de sobrecarga (503).
+            seed (int): Semente do gerador aleatório de latência e de falhas.
+            host (str): Endereço onde o servidor escutará.
+            port (int): Porta onde o servidor escutará. 0 escolhe uma porta livre.
+        """
+
+        self.routes: MutableMapping[str, bytes] = (
+            routes if routes is not None else load_testdata_routes()
+        )
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.failures = 0
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _sortear(self) -> Tuple[float, bool]:
+        with self._lock:
+            self.requests += 1
+            if isinstance(self.latency, tuple):
+                latency = self._random.uniform(*self.latency)
+            else:
+                latency = self.latency
+            falhou = self._random.random() < self.failure_rate
+            self.failures += 1 if falhou else 0
+        return latency, falhou
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self) -> None:
+                latency, falhou = server._sortear()
+                if latency:
+                    time.sleep(latency)
+
+                body = server.routes.get(urlsplit(self.path).path)
+                if falhou:
+                    self._responder(503, _pagina_sobrecarga, "text/html")
+                elif body is None:
+                    self._responder(404, b'{"mensagem": "Recurso nao encontrado"}')
+                else:
+                    self._responder(200, body)
+
+            def _responder(
+                self, status: int, body: bytes, content_type: str = "application/json"
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
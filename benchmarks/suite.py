@@ -0,0 +1,654 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import cartolafc
+from cartolafc import CartolaFCError, serialization, wire
+from cartolafc.batch import parse_times
+from cartolafc.live import LiveScoreServer
+from cartolafc.market import MarketIndex
+from cartolafc.optimizer import LineupOptimizer
+from cartolafc.util import json_default
+from cartolafc.transports import (
+    HttpxTransport,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+)
+from cartolafc.models import (
+    Atleta,
+    AtletaDestaque,
+    Clube,
+    DestaqueRodada,
+    Liga,
+    Mercado,
+    Partida,
+    Patrocinador,
+    Time,
+    TimeInfo,
+)
+
+from .h2_server import H2StubServer
+from .stub_server import StubServer, load_testdata, load_testdata_routes
+from .synthetic import SyntheticCartola
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+Result = Dict[str, float]
+
+# Orçamento, em milissegundos, do tempo de `import cartolafc`, verificado em tests/test_benchmarks.py.
+IMPORT_BUDGET_MS = 50.0
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int = 2) -> Result:
+    """Executa func repetidas vezes e resume a latência de cada chamada.
+
+    Args:
+        func (callable): Função a ser medida, sem argumentos.
+        repeat (int): Quantidade de execuções medidas.
+        warmup (int): Quantidade de execuções descartadas antes da medição.
+
+    Returns:
+        Um dicionário com a latência média, p50 e p95 (em milissegundos) e a vazão (operações por segundo).
+    """
+
+    for _ in range(warmup):
+        func()
+
+    amostras = []
+    inicio = time.perf_counter()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        amostras.append(time.perf_counter() - t0)
+    total = time.perf_counter() - inicio
+
+    amostras.sort()
+    return dict(
+        mean_ms=statistics.mean(amostras) * 1000,
+        p50_ms=amostras[len(amostras) // 2] * 1000,
+        p95_ms=amostras[min(len(amostras) - 1, int(len(amostras) * 0.95))] * 1000,
+        ops=repeat / total if total else float("inf"),
+    )
+
+
+def import_time(module: str = "cartolafc") -> float:
+    """Tempo, em milissegundos, da importação de um módulo (incluindo as suas dependências) em um novo interpretador,
+    segundo o `python -X importtime`."""
+
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    # Formato: "import time: <próprio us> | <cumulativo us> | <módulo>", com o módulo importado por último.
+    for linha in reversed(saida.splitlines()):
+        partes = linha.split("|")
+        if len(partes) == 3 and partes[2].strip() == module:
+            return int(partes[1]) / 1000
+    raise CartolaFCError(f"Tempo de importação de {module} não encontrado")
+
+
+def import_benchmarks(repeat: int) -> Dict[str, Result]:
+    resultados = {}
+    for module in ("cartolafc", "cartolafc.api"):
+        amostras = [import_time(module) for _ in range(repeat)]
+        resultados[f"import {module}"] = _resumo(amostras)
+    return resultados
+
+
+def _resumo(amostras_ms: List[float]) -> Result:
+    """Resume amostras já medidas, em milissegundos, no mesmo formato de measure()."""
+
+    amostras = sorted(amostras_ms)
+    return dict(
+        mean_ms=statistics.mean(amostras),
+        p50_ms=amostras[len(amostras) // 2],
+        p95_ms=amostras[min(len(amostras) - 1, int(len(amostras) * 0.95))],
+        ops=1000 / statistics.mean(amostras),
+    )
+
+
+def live_benchmarks(
+    repeat: int, clients: int = 1000, teams: int = 100
+) -> Dict[str, Result]:
+    """Mede o fan-out do cartolafc.live.LiveScoreServer: o tempo entre o início de uma consulta às parciais e a
+    entrega da nova pontuação a todos os clientes SSE conectados, com um servidor local como upstream.
+    """
+
+    dados = SyntheticCartola(times=teams)
+    routes = dados.routes()
+
+    def rodada(numero: int) -> None:
+        routes["/atletas/pontuados"] = json.dumps(dados.pontuados(numero)).encode()
+
+    async def executar(server: LiveScoreServer) -> List[float]:
+        host, port = server.url[len("http://") :].split(":")
+        conexoes = []
+        for indice in range(clients):
+            reader, writer = await asyncio.open_connection(host, int(port))
+            time_id = dados.time_ids[indice % teams]
+            writer.write(f"GET /times/{time_id}/stream HTTP/1.1\r\n\r\n".encode())
+            await reader.readuntil(b"\r\n\r\n")
+            await reader.readuntil(b"\n\n")
+            conexoes.append((reader, writer))
+
+        amostras = []
+        for numero in range(repeat):
+            rodada(numero % dados.rodada_atual + 1)
+            inicio = time.perf_counter()
+            await server.poll_once()
+            await asyncio.gather(*(reader.readuntil(b"\n\n") for reader, _ in conexoes))
+            amostras.append((time.perf_counter() - inicio) * 1000)
+        for _, writer in conexoes:
+            writer.close()
+        return amostras
+
+    async def principal() -> List[float]:
+        with StubServer(routes) as upstream:
+            api = cartolafc.Api()
+            api._api_url = upstream.url
+            rodada(dados.rodada_atual)
+            async with LiveScoreServer(api, poll_interval=0) as server:
+                await server.poll_once()
+                return await executar(server)
+
+    resultado = _resumo(asyncio.run(principal()))
+    resultado["clients"] = clients
+    return {f"LiveScoreServer[{clients} clientes, {teams} times]": resultado}
+
+
+def _json(nome: str) -> dict:
+    return json.loads(load_testdata(nome))
+
+
+def _time_com_atletas() -> dict:
+    """O time.json dos testes não possui atletas escalados, então os 12 primeiros atletas pontuados são usados."""
+
+    data = _json("time.json")
+    parciais = _json("parciais.json")["atletas"]
+    atletas = []
+    for atleta_id, atleta in list(parciais.items())[:12]:
+        atletas.append(
+            dict(
+                atleta,
+                atleta_id=int(atleta_id),
+                pontos_num=atleta["pontuacao"],
+                status_id=7,
+            )
+        )
+    data["atletas"] = atletas
+    data["capitao_id"] = atletas[-1]["atleta_id"]
+    return data
+
+
+def micro_benchmarks(repeat: int) -> Dict[str, Result]:
+    resultados = {}
+
+    for nome in (
+        "clubes.json",
+        "mercado_atletas.json",
+        "parciais.json",
+        "partidas.json",
+        "time.json",
+    ):
+        raw = load_testdata(nome).decode("utf-8")
+        resultados[f"json.loads[{nome}]"] = measure(lambda: json.loads(raw), repeat)
+
+    clubes_data = _json("clubes.json")
+    clubes = {int(c): Clube.from_dict(clube) for c, clube in clubes_data.items()}
+    mercado_atletas = _json("mercado_atletas.json")
+    parciais = _json("parciais.json")
+    partidas = _json("partidas.json")
+    time_data = _time_com_atletas()
+    ligas = _json("ligas.json")
+    times = _json("times.json")
+    patrocinadores = _json("patrocinadores.json")
+    destaques = _json("mercado_destaques.json")
+    pos_rodada = _json("pos_rodada_destaques.json")
+    mercado = _json("mercado_status_fechado.json")
+
+    casos = {
+        "Clube.from_dict": lambda: [Clube.from_dict(c) for c in clubes_data.values()],
+        "Atleta.from_dict[mercado]": lambda: [
+            Atleta.from_dict(a, clubes=clubes) for a in mercado_atletas["atletas"]
+        ],
+        "Atleta.from_dict[parciais]": lambda: [
+            Atleta.from_dict(a, clubes=clubes, atleta_id=int(i))
+            for i, a in parciais["atletas"].items()
+        ],
+        "AtletaDestaque.from_dict": lambda: [
+            AtletaDestaque.from_dict(d) for d in destaques
+        ],
+        "DestaqueRodada.from_dict": lambda: DestaqueRodada.from_dict(pos_rodada),
+        "Liga.from_dict": lambda: [Liga.from_dict(liga) for liga in ligas],
+        "Mercado.from_dict": lambda: Mercado.from_dict(mercado),
+        "Partida.from_dict": lambda: [
+            Partida.from_dict(p, clubes=clubes) for p in partidas["partidas"]
+        ],
+        "Patrocinador.from_dict": lambda: [
+            Patrocinador.from_dict(p) for p in patrocinadores.values()
+        ],
+        "Time.from_dict": lambda: Time.from_dict(
+            time_data, clubes=clubes, capitao=time_data["capitao_id"]
+        ),
+        "TimeInfo.from_dict": lambda: [TimeInfo.from_dict(t) for t in times],
+    }
+    for nome, func in casos.items():
+        resultados[nome] = measure(func, repeat)
+
+    mapa_parciais = {
+        int(i): Atleta.from_dict(a, clubes=clubes, atleta_id=int(i))
+        for i, a in parciais["atletas"].items()
+    }
+    dados_pickle = pickle.dumps(mapa_parciais)
+    time_ = Time.from_dict(time_data, clubes=clubes, capitao=time_data["capitao_id"])
+    resultados["Api._calculate_parcial"] = measure(
+        lambda: cartolafc.Api._calculate_parcial(time_, mapa_parciais), repeat
+    )
+
+    # Na primeira rodada as médias do fixture são zero: usa uma pontuação esperada determinística qualquer.
+    atletas_mercado = [
+        Atleta.from_dict(a, clubes=clubes) for a in mercado_atletas["atletas"]
+    ]
+    resultados["LineupOptimizer.solve[mercado]"] = measure(
+        lambda: LineupOptimizer(
+            atletas_mercado, pontuacao=lambda atleta: atleta.id % 97 / 10
+        ).solve(100),
+        repeat,
+    )
+
+    resultados["pickle.loads[parciais]"] = measure(
+        lambda: pickle.loads(dados_pickle), repeat
+    )
+    try:
+        dados_msgpack = serialization.dumps(mapa_parciais)
+    except CartolaFCError:
+        return resultados
+    resultados["serialization.loads[parciais]"] = measure(
+        lambda: serialization.loads(dados_msgpack), repeat
+    )
+    return resultados
+
+
+def wire_benchmarks(repeat: int) -> Dict[str, Result]:
+    """Compara o JSON (feito com json_default) com cartolafc.wire, em um snapshot completo e em um delta com 10% dos
+    atletas alterados. Inclui o tamanho, em bytes, de cada formato."""
+
+    clubes = {
+        int(c): Clube.from_dict(clube) for c, clube in _json("clubes.json").items()
+    }
+    parciais = {
+        int(i): Atleta.from_dict(a, clubes=clubes, atleta_id=int(i))
+        for i, a in _json("parciais.json")["atletas"].items()
+    }
+    atualizadas = dict(parciais)
+    for atleta_id in sorted(parciais)[::10]:
+        atleta = parciais[atleta_id]
+        atualizadas[atleta_id] = Atleta(
+            atleta_id,
+            atleta.apelido,
+            atleta.pontos + 1.5,
+            atleta.scout + {"FS": 1},
+            atleta.posicao.id,
+            atleta.clube,
+            atleta.status.id if atleta.status else None,
+        )
+
+    dados_json = json.dumps(atualizadas, default=json_default).encode("utf-8")
+    completo = wire.encode_snapshot(atualizadas, 2)
+    base = wire.WireSnapshot(1, parciais)
+    delta = wire.encode_delta(parciais, atualizadas, 2, 1)
+
+    casos = {
+        "json.dumps[parciais]": (
+            lambda: json.dumps(atualizadas, default=json_default).encode("utf-8"),
+            dados_json,
+        ),
+        "json.loads[parciais]": (lambda: json.loads(dados_json), dados_json),
+        "wire.encode_snapshot": (
+            lambda: wire.encode_snapshot(atualizadas, 2),
+            completo,
+        ),
+        "wire.decode_snapshot": (lambda: wire.decode_snapshot(completo), completo),
+        "wire.encode_delta": (
+            lambda: wire.encode_delta(parciais, atualizadas, 2, 1),
+            delta,
+        ),
+        "wire.decode_snapshot[delta]": (
+            lambda: wire.decode_snapshot(delta, base),
+            delta,
+        ),
+    }
+    resultados = {}
+    for nome, (func, dados) in casos.items():
+        resultados[nome] = measure(func, repeat)
+        resultados[nome]["bytes"] = len(dados)
+    print(
+        f"bytes: json {len(dados_json)}, wire {len(completo)}, delta {len(delta)}",
+        file=sys.stderr,
+    )
+    return resultados
+
+
+def market_benchmarks(repeat: int) -> Dict[str, Result]:
+    """Compara a mesma consulta ao mercado (meias e atacantes prováveis até C$ 12, top 5 pela média) feita com uma
+    varredura de mercado_atletas() e com um cartolafc.market.MarketIndex, além do custo de construir o índice.
+    """
+
+    data = _json("mercado_atletas.json")
+    clubes = {clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()}
+    atletas = [Atleta.from_dict(atleta, clubes=clubes) for atleta in data["atletas"]]
+    index = MarketIndex(atletas)
+
+    def varredura():
+        return sorted(
+            (
+                atleta
+                for atleta in atletas
+                if atleta.posicao.id in (4, 5)
+                and atleta.status is not None
+                and atleta.status.id == 7
+                and atleta.preco is not None
+                and atleta.preco <= 12
+            ),
+            key=lambda atleta: (-atleta.media, atleta.id),
+        )[:5]
+
+    def consulta():
+        return (
+            index.query()
+            .where(posicao=[4, 5], status=7)
+            .between("preco", maximo=12)
+            .top(5, "media")
+        )
+
+    return {
+        "market.scan[top5]": measure(varredura, repeat),
+        "market.index[top5]": measure(consulta, repeat),
+        "market.index[build]": measure(lambda: MarketIndex(atletas), repeat),
+    }
+
+
+def batch_benchmarks(repeat: int, teams: int = 2000) -> Dict[str, Result]:
+    """Mede a conversão de um lote de respostas de /time/id/{time_id} com diferentes quantidades de processos."""
+
+    clubes = {
+        int(c): Clube.from_dict(clube) for c, clube in _json("clubes.json").items()
+    }
+    payloads = [json.dumps(_time_com_atletas()).encode("utf-8")] * teams
+
+    resultados = {}
+    for workers in sorted({0, 1, os.cpu_count() or 1}):
+        resultados[f"parse_times[{teams} times, workers={workers}]"] = measure(
+            lambda: parse_times(payloads, clubes, workers=workers, chunksize=256),
+            repeat,
+            warmup=1,
+        )
+    return resultados
+
+
+def scale_benchmarks(
+    repeat: int, teams: int = 10000, seed: int = 0
+) -> Dict[str, Result]:
+    """Mede a conversão dos times, o cálculo das parciais e o ranking de uma liga com dados sintéticos."""
+
+    dados = SyntheticCartola(seed=seed, times=teams, ligas=1, rodada_atual=10)
+    clubes = {int(c): Clube.from_dict(clube) for c, clube in dados.clubes().items()}
+    parciais_data = dados.pontuados()
+    parciais = {
+        int(i): Atleta.from_dict(a, clubes=clubes, atleta_id=int(i))
+        for i, a in parciais_data["atletas"].items()
+    }
+    payloads = list(dados.iter_times())
+    times_ = [
+        Time.from_dict(data, clubes=clubes, capitao=data["capitao_id"])
+        for data in payloads
+    ]
+    liga = dados.liga(dados.liga_ids[0])
+
+    def ranking() -> List[TimeInfo]:
+        times_liga = Liga.from_dict(liga, ranking="campeonato").times
+        return sorted(times_liga, key=lambda time: time.pontos, reverse=True)
+
+    return {
+        f"Time.from_dict[{teams} times]": measure(
+            lambda: [
+                Time.from_dict(data, clubes=clubes, capitao=data["capitao_id"])
+                for data in payloads
+            ],
+            repeat,
+            warmup=1,
+        ),
+        f"Api._calculate_parcial[{teams} times]": measure(
+            lambda: [cartolafc.Api._calculate_parcial(t, parciais) for t in times_],
+            repeat,
+            warmup=1,
+        ),
+        f"Liga ranking[{teams} times]": measure(ranking, repeat, warmup=1),
+    }
+
+
+def http2_benchmarks(
+    repeat: int, teams: int = 300, workers: int = 32, latency: float = 0.01
+) -> Dict[str, Result]:
+    """Compara o transporte padrão (HTTP/1.1) com o cartolafc.transports.HttpxTransport em HTTP/2 ao obter muitos
+    times em paralelo, cada um contra o seu servidor local. Inclui a quantidade de conexões abertas no servidor.
+    """
+
+    # O httpx registra cada requisição em INFO.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    dados = SyntheticCartola(times=teams)
+    casos: List[tuple] = [
+        ("http1.1", StubServer, lambda: None),
+        ("http2", H2StubServer, lambda: HttpxTransport(prior_knowledge=True)),
+    ]
+
+    resultados = {}
+    for protocolo, servidor, transporte in casos:
+        try:
+            server = servidor(dados.routes(), latency=latency)
+            transport: Optional[Transport] = transporte()
+        except (CartolaFCError, RuntimeError) as error:
+            print(f"{protocolo}: {error}", file=sys.stderr)
+            continue
+        with server:
+            api = cartolafc.Api(transport=transport)
+            api._api_url = server.url
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                resultado = measure(
+                    lambda: list(executor.map(api.time, dados.time_ids)),
+                    repeat,
+                    warmup=1,
+                )
+            resultado["connections"] = server.connections
+            print(f"{protocolo}: {server.connections} conexões", file=sys.stderr)
+            resultados[f"Api.time[{protocolo}, {teams} times]"] = resultado
+            api._transport.close()
+    return resultados
+
+
+def end_to_end_benchmarks(
+    repeat: int,
+    latency: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+) -> Dict[str, Result]:
+    """Mede cada método da cartolafc.Api contra o servidor local.
+
+    Args:
+        record (str): Se informado, grava todas as respostas neste arquivo, para uma execução posterior com replay.
+        replay (str): Se informado, nenhum servidor é iniciado e as respostas são servidas, na velocidade máxima, a
+            partir deste arquivo gravado com o mesmo número de repetições.
+    """
+
+    rotas = load_testdata_routes()
+    aberto = rotas["/mercado/status"].replace(
+        b'"status_mercado": 2', b'"status_mercado": 1'
+    )
+    fechado = rotas["/mercado/status"]
+    rotas["/partidas/1"] = rotas["/partidas"]
+    rotas["/time/id/471815"] = json.dumps(_time_com_atletas()).encode("utf-8")
+
+    attempts = 5 if failure_rate else 1
+    casos = [
+        ("clubes", fechado, lambda api: api.clubes()),
+        ("ligas", fechado, lambda api: api.ligas("premiere")),
+        ("patrocinadores", fechado, lambda api: api.patrocinadores()),
+        ("mercado", fechado, lambda api: api.mercado()),
+        ("mercado_atletas", fechado, lambda api: api.mercado_atletas()),
+        ("parciais", fechado, lambda api: api.parciais()),
+        ("partidas", fechado, lambda api: api.partidas(1)),
+        ("destaques", fechado, lambda api: api.destaques()),
+        ("destaques_reservas", fechado, lambda api: api.destaques_reservas()),
+        ("pos_rodada_destaques", aberto, lambda api: api.pos_rodada_destaques()),
+        ("time", fechado, lambda api: api.time(471815)),
+        ("time_parcial", fechado, lambda api: api.time_parcial(471815)),
+        ("times", fechado, lambda api: api.times("falydos")),
+    ]
+
+    resultados = {}
+    if replay:
+        api = cartolafc.Api(attempts=attempts, transport=ReplayTransport(replay))
+        for nome, _, chamada in casos:
+            resultados[f"Api.{nome}"] = measure(lambda: chamada(api), repeat)
+        return resultados
+
+    with StubServer(
+        rotas, latency=latency, failure_rate=failure_rate, seed=seed
+    ) as server:
+        transport = RecordingTransport(record) if record else None
+        api = cartolafc.Api(attempts=attempts, transport=transport)
+        api._api_url = server.url
+        for nome, status, chamada in casos:
+            server.routes["/mercado/status"] = status
+            resultados[f"Api.{nome}"] = measure(lambda: chamada(api), repeat)
+        if transport:
+            transport.close()
+    return resultados
+
+
+def compare(
+    resultados: Dict[str, Result], baseline: Dict[str, Result], tolerance: float
+) -> List[str]:
+    """Compara a latência p50 de cada benchmark com a baseline.
+
+    Returns:
+        Uma lista com o nome dos benchmarks cuja latência piorou além da tolerância.
+    """
+
+    regressoes = []
+    for nome, resultado in resultados.items():
+        if nome not in baseline:
+            continue
+        razao = resultado["p50_ms"] / max(baseline[nome]["p50_ms"], 1e-9)
+        if razao > 1 + tolerance:
+            regressoes.append(nome)
+    return regressoes
+
+
+def _report(
+    resultados: Dict[str, Result], baseline: Optional[Dict[str, Result]]
+) -> None:
+    print(
+        f"{'benchmark':<36} {'p50 ms':>10} {'p95 ms':>10} {'ops/s':>10} {'vs base':>9}"
+    )
+    for nome, r in resultados.items():
+        base = ""
+        if baseline and nome in baseline:
+            base = f"{r['p50_ms'] / max(baseline[nome]['p50_ms'], 1e-9):.2f}x"
+        print(
+            f"{nome:<36} {r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} {r['ops']:>10.0f} {base:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="segundos")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only",
+        choices=[
+            "micro",
+            "e2e",
+            "batch",
+            "scale",
+            "http2",
+            "import",
+            "wire",
+            "live",
+            "market",
+        ],
+    )
+    parser.add_argument("--teams", type=int, default=10000)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--record", metavar="ARQUIVO")
+    parser.add_argument("--replay", metavar="ARQUIVO")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    if args.only in (None, "micro"):
+        resultados.update(micro_benchmarks(args.repeat))
+    if args.only == "batch":
+        resultados.update(batch_benchmarks(max(args.repeat // 10, 1)))
+    if args.only == "live":
+        resultados.update(live_benchmarks(max(args.repeat // 5, 1)))
+    if args.only == "wire":
+        resultados.update(wire_benchmarks(args.repeat))
+    if args.only == "market":
+        resultados.update(market_benchmarks(args.repeat))
+    if args.only == "import":
+        resultados.update(import_benchmarks(max(args.repeat // 10, 1)))
+    if args.only == "http2":
+        resultados.update(http2_benchmarks(max(args.repeat // 10, 1)))
+    if args.only == "scale":
+        resultados.update(
+            scale_benchmarks(max(args.repeat // 10, 1), args.teams, args.seed)
+        )
+    if args.only in (None, "e2e"):
+        resultados.update(
+            end_to_end_benchmarks(
+                args.repeat,
+                args.latency,
+                args.failure_rate,
+                args.seed,
+                args.record,
+                args.replay,
+            )
+        )
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(resultados, f, indent=2, sort_keys=True)
+            f.write("\n")
+        _report(resultados, None)
+        return 0
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    _report(resultados, baseline)
+
+    regressoes = compare(resultados, baseline or {}, args.tolerance)
+    for nome in regressoes:
+        print(f"REGRESSÃO: {nome}", file=sys.stderr)
+    return 1 if regressoes else 0
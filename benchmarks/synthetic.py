@@ -0,0 +1,505 @@
+import json
+import random
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .stub_server import load_testdata
+
+# Pontuação de cada scout no Cartola FC, utilizada para que a pontuação gerada seja coerente com os scouts.
+PESOS = {
+    "G": 8.0,
+    "A": 5.0,
+    "FT": 3.0,
+    "FD": 1.2,
+    "FF": 0.8,
+    "FS": 0.5,
+    "PS": 1.0,
+    "I": -0.1,
+    "PP": -4.0,
+    "DS": 1.2,
+    "SG": 5.0,
+    "DE": 1.0,
+    "DP": 7.0,
+    "GC": -3.0,
+    "GS": -1.0,
+    "CV": -3.0,
+    "CA": -1.0,
+    "FC": -0.3,
+    "PC": -1.0,
+}
+
+# Taxa média (por partida) de cada scout, por posição: goleiro, lateral, zagueiro, meia e atacante.
+_TAXAS = {
+    1: {"DE": 3.0, "GS": 1.2, "SG": 0.3, "DP": 0.05, "CA": 0.05},
+    2: {"DS": 1.5, "FC": 1.0, "FS": 0.8, "A": 0.1, "FF": 0.3, "SG": 0.3, "CA": 0.2},
+    3: {"DS": 1.2, "FC": 1.2, "FS": 0.4, "G": 0.05, "SG": 0.3, "CA": 0.25},
+    4: {"DS": 1.0, "FC": 1.0, "FS": 1.0, "A": 0.2, "G": 0.1, "FF": 0.6, "FD": 0.4},
+    5: {"G": 0.35, "A": 0.15, "FF": 0.8, "FD": 0.6, "FT": 0.1, "FS": 1.0, "I": 0.4},
+}
+
+# Atletas de cada posição em um elenco: goleiros, laterais, zagueiros, meias, atacantes e o técnico.
+_ELENCO = ((1, 3), (2, 4), (3, 5), (4, 10), (5, 7), (6, 1))
+
+# Esquema 4-3-3: um goleiro, dois laterais, dois zagueiros, três meias, três atacantes e o técnico.
+_ESQUEMA = ((1, 1), (2, 2), (3, 2), (4, 3), (5, 3), (6, 1))
+
+_SILABAS = (
+    "ba ca da fa ga la ma na pa ra sa ta va za be ce de fe le me ne pe re se te "
+    "vi bi di li mi ni ri si ti bo co do go lo mo no po ro so to bu du lu mu nu ru tu"
+).split()
+
+_PRIMEIRO_ATLETA_ID = 100000
+_PRIMEIRO_TIME_ID = 1000000
+_PRIMEIRA_LIGA_ID = 5000000
+_INICIO_TEMPORADA = datetime(2023, 4, 15, 16, 0)
+
+
+def _nome(aleatorio: random.Random, silabas: int) -> str:
+    return "".join(aleatorio.choice(_SILABAS) for _ in range(silabas)).capitalize()
+
+
+def _poisson(aleatorio: random.Random, taxa: float) -> int:
+    # Algoritmo de Knuth: suficiente para as taxas pequenas dos scouts.
+    limite, quantidade, produto = 2.718281828459045**-taxa, 0, aleatorio.random()
+    while produto > limite:
+        quantidade += 1
+        produto *= aleatorio.random()
+    return quantidade
+
+
+def _timestamp(data: datetime) -> int:
+    # As datas da API estão no horário de Brasília (UTC-3), independente do fuso da máquina.
+    return int((data - datetime(1970, 1, 1)).total_seconds()) + 3 * 3600
+
+
+def _dumps(data: object) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class SyntheticCartola(object):
+    """Gera respostas da API do Cartola FC em qualquer escala, de forma determinística a partir de uma semente.
+
+    Os atletas, times, ligas e partidas seguem o formato das respostas reais (e dos arquivos em tests/testdata) e são
+    gerados sob demanda: cada time ou rodada depende apenas da semente e do seu id, de modo que 100 mil times podem ser
+    servidos ou percorridos sem que todos fiquem na memória.
+
+    Exemplo de uso:
+        >>> dados = SyntheticCartola(seed=7, times=100000)
+        >>> with StubServer(dados.routes()) as server:
+        ...     api = cartolafc.Api()
+        ...     api._api_url = server.url
+        ...     api.time(dados.time_ids[-1], rodada=38)
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        times: int = 1000,
+        rodadas: int = 38,
+        rodada_atual: Optional[int] = None,
+        ligas: int = 10,
+    ) -> None:
+        """
+        Args:
+            seed (int): Semente de todos os dados gerados.
+            times (int): Quantidade de times (ids consecutivos, veja time_ids).
+            rodadas (int): Quantidade de rodadas da temporada.
+            rodada_atual (int): Rodada em andamento. As anteriores têm placares e pontuações. Por padrão, a última.
+            ligas (int): Quantidade de ligas, com os times distribuídos entre elas.
+        """
+
+        self.seed = seed
+        self.rodadas = rodadas
+        self.rodada_atual = rodada_atual if rodada_atual is not None else rodadas
+        self.time_ids = range(_PRIMEIRO_TIME_ID, _PRIMEIRO_TIME_ID + times)
+        self.liga_ids = range(_PRIMEIRA_LIGA_ID, _PRIMEIRA_LIGA_ID + ligas)
+
+        mercado = json.loads(load_testdata("mercado_atletas.json"))
+        self._clubes: Dict[str, dict] = mercado["clubes"]
+        self._posicoes: Dict[str, dict] = mercado["posicoes"]
+        self._status: Dict[str, dict] = mercado["status"]
+        self._atletas = self._gerar_atletas()
+        self._por_posicao: Dict[int, List[dict]] = {}
+        for atleta in self._atletas:
+            self._por_posicao.setdefault(atleta["posicao_id"], []).append(atleta)
+        self._atletas_por_id = {atleta["atleta_id"]: atleta for atleta in self._atletas}
+        self._pontuacoes: Dict[int, Dict[int, Tuple[float, Dict[str, int]]]] = {}
+
+    def _random(self, *chave: object) -> random.Random:
+        return random.Random(":".join(map(str, (self.seed,) + chave)))
+
+    def _gerar_atletas(self) -> List[dict]:
+        aleatorio = self._random("atletas")
+        atletas = []
+        for clube_id in sorted(int(clube_id) for clube_id in self._clubes):
+            for posicao_id, quantidade in _ELENCO:
+                for _ in range(quantidade):
+                    apelido = _nome(aleatorio, aleatorio.randint(2, 3))
+                    atletas.append(
+                        dict(
+                            atleta_id=_PRIMEIRO_ATLETA_ID + len(atletas),
+                            apelido=apelido,
+                            slug=apelido.lower(),
+                            clube_id=clube_id,
+                            posicao_id=posicao_id,
+                            status_id=aleatorio.choice((7, 7, 7, 7, 2, 5, 3, 6)),
+                            preco_num=round(aleatorio.uniform(2.0, 25.0), 2),
+                            media_num=round(aleatorio.uniform(-1.0, 9.0), 2),
+                        )
+                    )
+        return atletas
+
+    @property
+    def atleta_ids(self) -> List[int]:
+        return [atleta["atleta_id"] for atleta in self._atletas]
+
+    def clubes(self) -> Dict[str, dict]:
+        """Resposta de /clubes."""
+
+        return self._clubes
+
+    def mercado_status(self, status_mercado: int = 2) -> dict:
+        """Resposta de /mercado/status, por padrão com o mercado fechado."""
+
+        fechamento = _INICIO_TEMPORADA + timedelta(weeks=self.rodada_atual - 1)
+        return dict(
+            rodada_atual=self.rodada_atual,
+            status_mercado=status_mercado,
+            temporada=fechamento.year,
+            game_over=False,
+            times_escalados=len(self.time_ids),
+            fechamento=dict(
+                dia=fechamento.day,
+                mes=fechamento.month,
+                ano=fechamento.year,
+                hora=fechamento.hour,
+                minuto=fechamento.minute,
+                timestamp=_timestamp(fechamento),
+            ),
+        )
+
+    def mercado_atletas(self) -> dict:
+        """Resposta de /atletas/mercado, com todos os atletas da temporada."""
+
+        atletas = []
+        for atleta in self._atletas:
+            scout = self._scout(atleta, self.rodada_atual - 1)
+            atletas.append(
+                dict(
+                    atleta,
+                    scout=scout,
+                    rodada_id=self.rodada_atual,
+                    pontos_num=self._pontuacao(scout),
+                    variacao_num=0,
+                    jogos_num=self.rodada_atual - 1,
+                    nome=atleta["apelido"],
+                    apelido_abreviado=atleta["apelido"],
+                    foto="",
+                )
+            )
+        return dict(
+            clubes=self._clubes,
+            posicoes=self._posicoes,
+            status=self._status,
+            atletas=atletas,
+        )
+
+    def _scout(self, atleta: dict, rodada: int) -> Dict[str, int]:
+        if rodada < 1 or atleta["posicao_id"] not in _TAXAS:
+            return {}
+        aleatorio = self._random("scout", rodada, atleta["atleta_id"])
+        scout = {}
+        for codigo, taxa in _TAXAS[atleta["posicao_id"]].items():
+            quantidade = _poisson(aleatorio, taxa)
+            if quantidade:
+                scout[codigo] = quantidade
+        return scout
+
+    @staticmethod
+    def _pontuacao(scout: Dict[str, int]) -> float:
+        return round(
+            sum(
+                PESOS.get(codigo, 0.0) * quantidade
+                for codigo, quantidade in scout.items()
+            ),
+            2,
+        )
+
+    def _jogou(self, atleta: dict, rodada: int) -> bool:
+        return self._random("jogou", rodada, atleta["atleta_id"]).random() < 0.55
+
+    def pontuacoes(self, rodada: int) -> Dict[int, Tuple[float, Dict[str, int]]]:
+        """Pontuação e scouts de cada atleta que jogou a rodada."""
+
+        if rodada in self._pontuacoes:
+            return self._pontuacoes[rodada]
+        pontuacoes = {}
+        for atleta in self._atletas:
+            if atleta["posicao_id"] == 6 or self._jogou(atleta, rodada):
+                scout = self._scout(atleta, rodada)
+                if atleta["posicao_id"] == 6:
+                    pontuacao = round(
+                        self._random("tecnico", rodada, atleta["atleta_id"]).uniform(
+                            -2, 8
+                        ),
+                        2,
+                    )
+                else:
+                    pontuacao = self._pontuacao(scout)
+                pontuacoes[atleta["atleta_id"]] = (pontuacao, scout)
+        self._pontuacoes[rodada] = pontuacoes
+        return pontuacoes
+
+    def pontuados(self, rodada: Optional[int] = None) -> dict:
+        """Resposta de /atletas/pontuados, por padrão da rodada atual."""
+
+        rodada = rodada or self.rodada_atual
+        atletas = {}
+        for atleta_id, (pontuacao, scout) in self.pontuacoes(rodada).items():
+            atleta = self._atletas_por_id[atleta_id]
+            atletas[str(atleta_id)] = dict(
+                apelido=atleta["apelido"],
+                pontuacao=pontuacao,
+                scout=scout,
+                foto="",
+                posicao_id=atleta["posicao_id"],
+                clube_id=atleta["clube_id"],
+            )
+        return dict(
+            rodada=rodada,
+            atletas=atletas,
+            clubes=self._clubes,
+            posicoes=self._posicoes,
+            total_atletas=len(atletas),
+        )
+
+    def _confrontos(self, rodada: int) -> List[Tuple[int, int]]:
+        # Método do círculo: todos os clubes jogam uma vez por rodada, com o returno invertendo os mandos.
+        clubes = sorted(int(clube_id) for clube_id in self._clubes)
+        turno = len(clubes) - 1
+        indice = (rodada - 1) % turno
+        rotacao = clubes[1:]
+        rotacao = rotacao[indice:] + rotacao[:indice]
+        ordem = [clubes[0]] + rotacao
+        metade = len(ordem) // 2
+        confrontos = list(zip(ordem[:metade], reversed(ordem[metade:])))
+        if ((rodada - 1) // turno) % 2 == 1:
+            confrontos = [(visitante, casa) for casa, visitante in confrontos]
+        return confrontos
+
+    def partidas(self, rodada: Optional[int] = None) -> dict:
+        """Resposta de /partidas/{rodada}, por padrão da rodada atual."""
+
+        rodada = rodada or self.rodada_atual
+        aleatorio = self._random("partidas", rodada)
+        inicio = _INICIO_TEMPORADA + timedelta(weeks=rodada - 1)
+        partidas = []
+        for indice, (casa, visitante) in enumerate(self._confrontos(rodada)):
+            data = inicio + timedelta(days=indice // 5, hours=2 * (indice % 5))
+            encerrada = rodada < self.rodada_atual
+            partidas.append(
+                dict(
+                    partida_id=rodada * 1000 + indice,
+                    clube_casa_id=casa,
+                    clube_visitante_id=visitante,
+                    partida_data=data.strftime("%Y-%m-%d %H:%M:%S"),
+                    timestamp=_timestamp(data),
+                    local=self._clubes[str(casa)]["nome"],
+                    valida=True,
+                    placar_oficial_mandante=_poisson(aleatorio, 1.4)
+                    if encerrada
+                    else None,
+                    placar_oficial_visitante=_poisson(aleatorio, 1.1)
+                    if encerrada
+                    else None,
+                )
+            )
+        return dict(clubes=self._clubes, partidas=partidas, rodada=rodada)
+
+    def _time_info(self, time_id: int) -> dict:
+        aleatorio = self._random("time", time_id)
+        nome = f"{_nome(aleatorio, 3)} FC"
+        return dict(
+            time_id=time_id,
+            nome=nome,
+            nome_cartola=f"{_nome(aleatorio, 2)} {_nome(aleatorio, 3)}",
+            slug=nome.lower().replace(" ", "-"),
+            assinante=aleatorio.random() < 0.3,
+            facebook_id=None,
+            foto_perfil="",
+            url_escudo_png="",
+            url_escudo_svg="",
+            lgpd_removido=False,
+            lgpd_quarentena=False,
+        )
+
+    def _escalacao(self, time_id: int, rodada: int) -> List[dict]:
+        aleatorio = self._random("escalacao", time_id, rodada)
+        escalados = []
+        for posicao_id, quantidade in _ESQUEMA:
+            escalados.extend(
+                aleatorio.sample(self._por_posicao[posicao_id], quantidade)
+            )
+        return escalados
+
+    def time(self, time_id: int, rodada: Optional[int] = None) -> Optional[dict]:
+        """Resposta de /time/id/{time_id}/{rodada}, por padrão da rodada atual, ou None se o time não existir."""
+
+        if time_id not in self.time_ids:
+            return None
+        rodada = rodada or self.rodada_atual
+        escalados = self._escalacao(time_id, rodada)
+        pontuacoes = self.pontuacoes(rodada) if rodada < self.rodada_atual else {}
+        atletas = []
+        for atleta in escalados:
+            pontuacao, scout = pontuacoes.get(atleta["atleta_id"], (0, {}))
+            atletas.append(
+                dict(atleta, scout=scout, pontos_num=pontuacao, rodada_id=rodada)
+            )
+        capitao = self._random("capitao", time_id, rodada).choice(escalados[:-1])
+        return dict(
+            time=self._time_info(time_id),
+            atletas=atletas,
+            capitao_id=capitao["atleta_id"],
+            esquema_id=3,
+            rodada_atual=rodada,
+            patrimonio=round(sum(atleta["preco_num"] for atleta in escalados) + 5, 2),
+            valor_time=round(sum(atleta["preco_num"] for atleta in escalados), 2),
+            pontos=round(sum(atleta["pontos_num"] for atleta in atletas), 2)
+            if pontuacoes
+            else None,
+            pontos_campeonato=None,
+        )
+
+    def iter_times(self, rodada: Optional[int] = None) -> Iterator[dict]:
+        """Percorre as respostas de todos os times, geradas uma a uma."""
+
+        for time_id in self.time_ids:
+            yield self.time(time_id, rodada)
+
+    def times(self, query: str = "", limit: int = 20) -> List[dict]:
+        """Resposta de /times?q={query}: até limit times, escolhidos de forma determinística a partir da busca."""
+
+        if not self.time_ids:
+            return []
+        aleatorio = self._random("busca", query)
+        quantidade = min(limit, len(self.time_ids))
+        return [
+            self._time_info(time_id)
+            for time_id in aleatorio.sample(self.time_ids, quantidade)
+        ]
+
+    def _liga_info(self, liga_id: int) -> dict:
+        aleatorio = self._random("liga", liga_id)
+        nome = f"Liga {_nome(aleatorio, 3)}"
+        return dict(
+            liga_id=liga_id,
+            nome=nome,
+            slug=nome.lower().replace(" ", "-"),
+            descricao="",
+            tipo="Fechada",
+            imagem="",
+            criacao="2023-03-10 13:08:26",
+            quantidade_times=len(self._times_da_liga(liga_id)),
+            vagas_restantes=None,
+            mata_mata=False,
+            sem_capitao=False,
+        )
+
+    def _times_da_liga(self, liga_id: int) -> range:
+        indice = liga_id - _PRIMEIRA_LIGA_ID
+        return self.time_ids[indice :: len(self.liga_ids)]
+
+    def ligas(self, query: str = "") -> List[dict]:
+        """Resposta de /ligas?q={query}, com todas as ligas geradas."""
+
+        return [self._liga_info(liga_id) for liga_id in self.liga_ids]
+
+    def liga(self, liga_id: int) -> Optional[dict]:
+        """Uma liga e os seus times, com os pontos de cada ranking, no formato lido por cartolafc.Liga.from_dict."""
+
+        if liga_id not in self.liga_ids:
+            return None
+        times = []
+        for time_id in self._times_da_liga(liga_id):
+            aleatorio = self._random("ranking", time_id)
+            rodada = round(aleatorio.uniform(20, 110), 2)
+            campeonato = round(
+                rodada * max(self.rodada_atual - 1, 1) * aleatorio.uniform(0.8, 1.2), 2
+            )
+            times.append(
+                dict(
+                    self._time_info(time_id),
+                    pontos=dict(
+                        campeonato=campeonato, rodada=rodada, mes=None, turno=None
+                    ),
+                )
+            )
+        return dict(liga=self._liga_info(liga_id), times=times)
+
+    def routes(self) -> "SyntheticRoutes":
+        """Rotas para o benchmarks.stub_server.StubServer, geradas sob demanda."""
+
+        return SyntheticRoutes(self)
+
+
+class SyntheticRoutes(object):
+    """Rotas de um benchmarks.stub_server.StubServer que geram o corpo das respostas de um SyntheticCartola apenas
+    quando requisitadas. As respostas das rotas compartilhadas (mercado, pontuados e partidas) ficam guardadas; as
+    dos times, não. Rotas atribuídas diretamente (routes[caminho] = corpo) têm precedência sobre as geradas.
+    """
+
+    def __init__(self, dados: SyntheticCartola) -> None:
+        self._dados = dados
+        self._fixas: Dict[str, bytes] = {}
+        self._gerar = lru_cache(maxsize=128)(self._gerar_rota)
+
+    def _gerar_rota(self, caminho: str) -> Optional[bytes]:
+        dados = self._dados
+        partes = caminho.strip("/").split("/")
+        if caminho == "/clubes":
+            return _dumps(dados.clubes())
+        if caminho == "/mercado/status":
+            return _dumps(dados.mercado_status())
+        if caminho == "/atletas/mercado":
+            return _dumps(dados.mercado_atletas())
+        if caminho == "/atletas/pontuados":
+            return _dumps(dados.pontuados())
+        if caminho == "/times":
+            return _dumps(dados.times())
+        if caminho == "/ligas":
+            return _dumps(dados.ligas())
+        if partes[0] == "partidas" and len(partes) <= 2:
+            rodada = int(partes[1]) if len(partes) == 2 else None
+            return _dumps(dados.partidas(rodada))
+        return None
+
+    def get(self, caminho: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        if caminho in self._fixas:
+            return self._fixas[caminho]
+        partes = caminho.strip("/").split("/")
+        try:
+            if partes[:2] == ["time", "id"] and 3 <= len(partes) <= 4:
+                rodada = int(partes[3]) if len(partes) == 4 else None
+                time = self._dados.time(int(partes[2]), rodada)
+                return _dumps(time) if time is not None else default
+            if partes[0] == "liga" and len(partes) == 2:
+                liga = self._dados.liga(int(partes[1]))
+                return _dumps(liga) if liga is not None else default
+            corpo = self._gerar(caminho)
+        except ValueError:
+            return default
+        return corpo if corpo is not None else default
+
+    def __getitem__(self, caminho: str) -> bytes:
+        corpo = self.get(caminho)
+        if corpo is None:
+            raise KeyError(caminho)
+        return corpo
+
+    def __setitem__(self, caminho: str, corpo: bytes) -> None:
+        self._fixas[caminho] = corpo
+
+    def __contains__(self, caminho: object) -> bool:
+        return isinstance(caminho, str) and self.get(caminho) is not None
@@ -8,12 +8,41 @@
     :license: MIT, veja LICENSE para mais detalhes.
 """
 
-from .api import Api
-from .errors import CartolaFCError, CartolaFCGameOverError, CartolaFCOverloadError
+from typing import TYPE_CHECKING, Any, List
+
+from .errors import (
+    CartolaFCCircuitOpenError,
+    CartolaFCError,
+    CartolaFCGameOverError,
+    CartolaFCHTTPError,
+    CartolaFCMalformedResponseError,
+    CartolaFCOverloadError,
+)
 
 __all__ = [
     "Api",
+    "CartolaFCCircuitOpenError",
     "CartolaFCError",
     "CartolaFCGameOverError",
+    "CartolaFCHTTPError",
+    "CartolaFCMalformedResponseError",
     "CartolaFCOverloadError",
 ]
+
+# A cartolafc.Api (e, com ela, os modelos e o requests) só é importada no primeiro acesso a cartolafc.Api, para que
+# `import cartolafc` seja rápido em funções serverless e processos de curta duração (PEP 562).
+if TYPE_CHECKING:  # pragma: no cover
+    from .api import Api
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Api":
+        from .api import Api
+
+        globals()["Api"] = Api
+        return Api
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
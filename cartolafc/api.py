@@ -1,10 +1,12 @@
 import logging
-from typing import Any, Dict, List, Optional
-
-import requests
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
 
+from .circuit import CircuitBreaker
 from .constants import MERCADO_ABERTO, MERCADO_FECHADO
 from .errors import CartolaFCError, CartolaFCOverloadError
+from .metrics import Hooks
 from .models import (
     Atleta,
     AtletaDestaque,
@@ -16,11 +18,22 @@ from .models import (
     Partida,
 )
 from .models import Time, TimeInfo
+from .refresh import WarmCache
+from .scout import EMPTY_SCOUT
+from .search import LIGAS, TIMES, SearchIndex
+from .transports import RequestsTransport, Response, Transport, request_key
 from .util import parse_and_check_cartolafc
 
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
-)
+# Como toda biblioteca, a cartolafc não configura o logging da aplicação; sem handlers configurados, as mensagens dos
+# loggers "cartolafc.*" são descartadas.
+logging.getLogger("cartolafc").addHandler(logging.NullHandler())
+
+
+def _parse(response: Response) -> dict:
+    headers = response.headers or {}
+    return parse_and_check_cartolafc(
+        response.content, response.status_code, headers.get("Content-Type")
+    )
 
 
 class Api(object):
@@ -39,24 +52,62 @@ class Api(object):
             >>> api.mercado()
             >>> api.time(123)
             >>> api.times('termo')
+
+        Uma mesma instância pode ser compartilhada por várias threads (ex.: um ThreadPoolExecutor obtendo muitos
+        times): a cartolafc.Api não guarda estado mutável próprio, o transporte padrão utiliza uma sessão HTTP por
+        thread, e o cache, o circuit breaker, o índice de busca e o cartolafc.metrics.MetricsCollector são
+        thread-safe.
+            >>> with ThreadPoolExecutor(max_workers=64) as executor:
+            ...     times = list(executor.map(api.time, time_ids))
     """
 
-    def __init__(self, attempts: int = 1) -> None:
+    def __init__(
+        self,
+        attempts: int = 1,
+        hooks: Optional[Hooks] = None,
+        transport: Optional[Transport] = None,
+        search_index: Optional[SearchIndex] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[WarmCache] = None,
+    ) -> None:
         """Instancia um novo objeto de cartolafc.Api.
 
         Args:
             attempts (int): Quantidade de tentativas que serão efetuadas se os servidores estiverem sobrecarregados.
+            hooks (cartolafc.metrics.Hooks): Instrumentação notificada a cada requisição, decode e construção dos
+                modelos, como um cartolafc.metrics.MetricsCollector. Se não for informado, nada é medido.
+            transport (cartolafc.transports.Transport): Camada de transporte das requisições, como um
+                cartolafc.transports.ReplayTransport. Se não for informado, será utilizada a biblioteca requests.
+            search_index (cartolafc.search.SearchIndex): Índice local alimentado com os times e ligas obtidos, que
+                responde às buscas de times() e ligas() sem acessar a API quando possível.
+            circuit_breaker (cartolafc.circuit.CircuitBreaker): Circuit breaker por endpoint, que deixa de acessar a
+                API após sucessivas sobrecargas e utiliza as últimas respostas válidas enquanto isso.
+            cache (cartolafc.refresh.WarmCache): Cache das respostas obtidas com antecedência por um
+                cartolafc.refresh.RefreshAheadScheduler, que também agrupa requisições iguais e simultâneas.
         """
 
         self._api_url = "https://api.cartola.globo.com"
         self._attempts = attempts if attempts > 0 else 1
+        self._hooks = hooks
+        self._transport = transport or RequestsTransport()
+        self._search_index = search_index
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+
+    @property
+    def last_response_stale(self) -> bool:
+        """Se a última requisição feita nesta thread utilizou uma resposta antiga, por estar com o circuito aberto."""
+
+        return self._circuit_breaker is not None and self._circuit_breaker.stale
 
     def clubes(self) -> Dict[int, Clube]:
         url = f"{self._api_url}/clubes"
-        data = self._request(url)
-        return {
-            int(clube_id): Clube.from_dict(clube) for clube_id, clube in data.items()
-        }
+        data = self._request(url, endpoint="clubes")
+        with self._build("clubes"):
+            return {
+                int(clube_id): Clube.from_dict(clube)
+                for clube_id, clube in data.items()
+            }
 
     def ligas(self, query: str) -> List[Liga]:
         """Retorna o resultado da busca ao Cartola por um determinado termo de pesquisa.
@@ -68,17 +119,26 @@ class Api(object):
             Uma lista de instâncias de cartolafc.Liga, uma para cada liga contento o termo utilizado na busca.
         """
 
+        locais = self._search(LIGAS, query)
+        if locais is not None:
+            return locais
+
         url = f"{self._api_url}/ligas"
-        data = self._request(url, params=dict(q=query))
-        return [Liga.from_dict(liga_info) for liga_info in data]
+        data = self._request(url, params=dict(q=query), endpoint="ligas")
+        with self._build("ligas"):
+            ligas = [Liga.from_dict(liga_info) for liga_info in data]
+        if self._search_index is not None:
+            self._search_index.record_query(LIGAS, query, ligas)
+        return ligas
 
     def patrocinadores(self) -> Dict[int, Patrocinador]:
         url = f"{self._api_url}/patrocinadores"
-        data = self._request(url)
-        return {
-            int(patrocinador_id): Patrocinador.from_dict(patrocinador)
-            for patrocinador_id, patrocinador in data.items()
-        }
+        data = self._request(url, endpoint="patrocinadores")
+        with self._build("patrocinadores"):
+            return {
+                int(patrocinador_id): Patrocinador.from_dict(patrocinador)
+                for patrocinador_id, patrocinador in data.items()
+            }
 
     def mercado(self) -> Mercado:
         """Obtém o status do mercado na rodada atual.
@@ -88,16 +148,20 @@ class Api(object):
         """
 
         url = f"{self._api_url}/mercado/status"
-        data = self._request(url)
-        return Mercado.from_dict(data)
+        data = self._request(url, endpoint="mercado")
+        with self._build("mercado"):
+            return Mercado.from_dict(data)
 
     def mercado_atletas(self) -> List[Atleta]:
         url = f"{self._api_url}/atletas/mercado"
-        data = self._request(url)
-        clubes = {
-            clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()
-        }
-        return [Atleta.from_dict(atleta, clubes=clubes) for atleta in data["atletas"]]
+        data = self._request(url, endpoint="mercado_atletas")
+        with self._build("mercado_atletas"):
+            clubes = {
+                clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()
+            }
+            return [
+                Atleta.from_dict(atleta, clubes=clubes) for atleta in data["atletas"]
+            ]
 
     def parciais(self) -> Dict[int, Atleta]:
         """Obtém um mapa com todos os atletas que já pontuaram na rodada atual (aberta).
@@ -111,17 +175,19 @@ class Api(object):
 
         if self.mercado().status.id == MERCADO_FECHADO:
             url = f"{self._api_url}/atletas/pontuados"
-            data = self._request(url)
-            clubes = {
-                clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()
-            }
-            return {
-                int(atleta_id): Atleta.from_dict(
-                    atleta, clubes=clubes, atleta_id=int(atleta_id)
-                )
-                for atleta_id, atleta in data["atletas"].items()
-                if atleta["clube_id"] > 0
-            }
+            data = self._request(url, endpoint="parciais")
+            with self._build("parciais"):
+                clubes = {
+                    clube["id"]: Clube.from_dict(clube)
+                    for clube in data["clubes"].values()
+                }
+                return {
+                    int(atleta_id): Atleta.from_dict(
+                        atleta, clubes=clubes, atleta_id=int(atleta_id)
+                    )
+                    for atleta_id, atleta in data["atletas"].items()
+                    if atleta["clube_id"] > 0
+                }
 
         raise CartolaFCError(
             "As pontuações parciais só ficam disponíveis com o mercado fechado."
@@ -132,14 +198,18 @@ class Api(object):
         if rodada:
             url += f"/{rodada}"
 
-        data = self._request(url)
-        clubes = {
-            clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()
-        }
-        return sorted(
-            [Partida.from_dict(partida, clubes=clubes) for partida in data["partidas"]],
-            key=lambda p: p.data,
-        )
+        data = self._request(url, endpoint="partidas")
+        with self._build("partidas"):
+            clubes = {
+                clube["id"]: Clube.from_dict(clube) for clube in data["clubes"].values()
+            }
+            return sorted(
+                [
+                    Partida.from_dict(partida, clubes=clubes, rodada=data.get("rodada"))
+                    for partida in data["partidas"]
+                ],
+                key=lambda p: p.data,
+            )
 
     def destaques(self) -> List[AtletaDestaque]:
         """Obtém os destaques do mercado na rodada atual.
@@ -149,8 +219,9 @@ class Api(object):
         """
 
         url = f"{self._api_url}/mercado/destaques"
-        data = self._request(url)
-        return [AtletaDestaque.from_dict(destaque) for destaque in data]
+        data = self._request(url, endpoint="destaques")
+        with self._build("destaques"):
+            return [AtletaDestaque.from_dict(destaque) for destaque in data]
 
     def destaques_reservas(self) -> List[AtletaDestaque]:
         """Obtém os destaques resservas do mercado na rodada atual.
@@ -160,8 +231,9 @@ class Api(object):
         """
 
         url = f"{self._api_url}/mercado/destaques/reservas"
-        data = self._request(url)
-        return [AtletaDestaque.from_dict(destaque) for destaque in data]
+        data = self._request(url, endpoint="destaques_reservas")
+        with self._build("destaques_reservas"):
+            return [AtletaDestaque.from_dict(destaque) for destaque in data]
 
     def pos_rodada_destaques(self) -> DestaqueRodada:
         mercado = self.mercado()
@@ -172,8 +244,9 @@ class Api(object):
 
         if mercado.status.id == MERCADO_ABERTO:
             url = f"{self._api_url}/pos-rodada/destaques"
-            data = self._request(url)
-            return DestaqueRodada.from_dict(data)
+            data = self._request(url, endpoint="pos_rodada_destaques")
+            with self._build("pos_rodada_destaques"):
+                return DestaqueRodada.from_dict(data)
 
         raise CartolaFCError(
             "Os destaques de pós-rodada só ficam disponíveis com o mercado aberto."
@@ -194,12 +267,27 @@ class Api(object):
             cartolafc.CartolaFCError: Se algum erro aconteceu, como por exemplo: Nenhum time foi encontrado.
         """
 
+        return self._time(time_id, rodada)
+
+    def _time(
+        self,
+        time_id: int,
+        rodada: Optional[int] = 0,
+        clubes: Optional[Dict[int, Clube]] = None,
+    ) -> Time:
+        # Quem obtém vários times pode informar os clubes, para não obtê-los novamente a cada time.
         url = f"{self._api_url}/time/id/{time_id}"
         if rodada:
             url += f"/{rodada}"
 
-        data = self._request(url)
-        return Time.from_dict(data, clubes=self.clubes(), capitao=data["capitao_id"])
+        data = self._request(url, endpoint="time")
+        if clubes is None:
+            clubes = self.clubes()
+        with self._build("time"):
+            time = Time.from_dict(data, clubes=clubes, capitao=data["capitao_id"])
+        if self._search_index is not None:
+            self._search_index.add_time(time.info)
+        return time
 
     def time_parcial(
         self,
@@ -213,7 +301,8 @@ class Api(object):
 
         parciais = parciais if isinstance(parciais, dict) else self.parciais()
         time = self.time(time_id)
-        return self._calculate_parcial(time, parciais)
+        with self._build("time_parcial"):
+            return self._calculate_parcial(time, parciais)
 
     def times(self, query: str) -> List[TimeInfo]:
         """Retorna o resultado da busca ao Cartola por um determinado termo de pesquisa.
@@ -224,9 +313,26 @@ class Api(object):
         Returns:
             Uma lista de instâncias de cartolafc.TimeInfo, uma para cada time contento o termo utilizado na busca.
         """
+
+        locais = self._search(TIMES, query)
+        if locais is not None:
+            return locais
+
         url = f"{self._api_url}/times"
-        data = self._request(url, params=dict(q=query))
-        return [TimeInfo.from_dict(time_info) for time_info in data]
+        data = self._request(url, params=dict(q=query), endpoint="times")
+        with self._build("times"):
+            times = [TimeInfo.from_dict(time_info) for time_info in data]
+        if self._search_index is not None:
+            self._search_index.record_query(TIMES, query, times)
+        return times
+
+    def _search(self, tipo: str, query: str) -> Optional[list]:
+        if self._search_index is None:
+            return None
+        locais = self._search_index.lookup(tipo, query)
+        if locais is not None and self._hooks is not None:
+            self._hooks.on_cache_hit(tipo)
+        return locais
 
     @staticmethod
     def _calculate_parcial(time: Time, parciais: Dict[int, Atleta]) -> Time:
@@ -243,7 +349,7 @@ class Api(object):
             tem_parcial = isinstance(atleta_parcial, Atleta)
 
             atleta.pontos = atleta_parcial.pontos if tem_parcial else 0
-            atleta.scout = atleta_parcial.scout if tem_parcial else {}
+            atleta.scout = atleta_parcial.scout if tem_parcial else EMPTY_SCOUT
             time.jogados += 1 if tem_parcial else 0
 
             if atleta.is_capitao:
@@ -253,13 +359,82 @@ class Api(object):
 
         return time
 
-    def _request(self, url: str, params: Optional[Dict[str, Any]] = None) -> dict:
+    @contextmanager
+    def _build(self, endpoint: str) -> Iterator[None]:
+        if self._hooks is None:
+            yield
+            return
+
+        inicio = perf_counter()
+        yield
+        self._hooks.on_build(endpoint, perf_counter() - inicio)
+
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> dict:
+        if self._cache is not None and use_cache:
+            return self._cache.load(
+                request_key(url, params),
+                lambda: self._protected_fetch(url, params, endpoint),
+                self._hooks,
+                endpoint,
+            )
+        return self._protected_fetch(url, params, endpoint)
+
+    def _protected_fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+    ) -> dict:
+        if self._circuit_breaker is not None:
+            return self._circuit_breaker.call(
+                endpoint or url,
+                request_key(url, params),
+                lambda: self._fetch(url, params, endpoint),
+                self._hooks,
+            )
+        return self._fetch(url, params, endpoint)
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+    ) -> dict:
+        hooks = self._hooks
         attempts = self._attempts
         while attempts:
             try:
-                response = requests.get(url, params=params)
-                return parse_and_check_cartolafc(response.content.decode("utf-8"))
+                if hooks is None:
+                    return _parse(self._transport.get(url, params=params))
+                return self._instrumented_request(endpoint, url, params)
             except CartolaFCOverloadError as error:
                 attempts -= 1
                 if not attempts:
                     raise error
+                if hooks is not None:
+                    hooks.on_retry(endpoint, self._attempts - attempts, error)
+
+    def _instrumented_request(
+        self, endpoint: str, url: str, params: Optional[Dict[str, Any]]
+    ) -> dict:
+        hooks = self._hooks
+        hooks.on_request_start(endpoint, url)
+        inicio = perf_counter()
+        try:
+            response = self._transport.get(url, params=params)
+        except Exception as error:
+            hooks.on_request_end(endpoint, perf_counter() - inicio, 0, error)
+            raise
+        hooks.on_request_end(endpoint, perf_counter() - inicio, len(response.content))
+
+        inicio = perf_counter()
+        try:
+            return _parse(response)
+        finally:
+            hooks.on_decode(endpoint, perf_counter() - inicio)
@@ -0,0 +1,217 @@
+import os
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .models import Atleta, Clube, Time, TimeInfo
+from .util import parse_and_check_cartolafc
+
+TimeCompacto = namedtuple(
+    "TimeCompacto",
+    [
+        "time_id",
+        "nome",
+        "nome_cartola",
+        "slug",
+        "assinante",
+        "patrimonio",
+        "valor_time",
+        "ultima_pontuacao",
+        "capitao_id",
+        "atletas",
+    ],
+)
+"""Forma compacta e picklable de um time. Os atletas são tuplas (atleta_id, apelido, pontos, scout, posicao_id,
+clube_id, status_id, preco, media), já ordenadas pela posição."""
+
+
+def parse_time_compacto(payload: Union[bytes, str]) -> TimeCompacto:
+    """Converte o corpo de uma resposta de /time/id/{time_id} em um cartolafc.batch.TimeCompacto."""
+
+    data = parse_and_check_cartolafc(payload)
+    info = data["time"]
+    atletas = tuple(
+        sorted(
+            (
+                (
+                    atleta["atleta_id"],
+                    atleta["apelido"],
+                    atleta["pontos_num"]
+                    if "pontos_num" in atleta
+                    else atleta["pontuacao"],
+                    atleta["scout"],
+                    atleta["posicao_id"],
+                    atleta["clube_id"],
+                    atleta.get("status_id"),
+                    atleta.get("preco_num"),
+                    atleta.get("media_num"),
+                )
+                for atleta in data["atletas"]
+            ),
+            key=lambda atleta: atleta[4],
+        )
+    )
+    return TimeCompacto(
+        info["time_id"],
+        info["nome"],
+        info["nome_cartola"],
+        info["slug"],
+        info["assinante"],
+        data["patrimonio"],
+        data["valor_time"],
+        data["pontos"],
+        data["capitao_id"],
+        atletas,
+    )
+
+
+def time_from_compacto(compacto: TimeCompacto, clubes: Dict[int, Clube]) -> Time:
+    """Constrói um cartolafc.Time a partir de sua forma compacta, compartilhando as instâncias de Clube."""
+
+    sem_clube = None
+    atletas = []
+    for (
+        atleta_id,
+        apelido,
+        pontos,
+        scout,
+        posicao_id,
+        clube_id,
+        status_id,
+        preco,
+        media,
+    ) in compacto.atletas:
+        clube = clubes.get(clube_id)
+        if clube is None:
+            sem_clube = sem_clube or Clube(0, "Sem Clube", "Sem Clube")
+            clube = sem_clube
+        atletas.append(
+            Atleta(
+                atleta_id,
+                apelido,
+                pontos,
+                scout,
+                posicao_id,
+                clube,
+                status_id,
+                atleta_id == compacto.capitao_id,
+                preco=preco,
+                media=media,
+            )
+        )
+    info = TimeInfo(
+        compacto.time_id,
+        compacto.nome,
+        compacto.nome_cartola,
+        compacto.slug,
+        compacto.assinante,
+        None,
+    )
+    return Time(
+        compacto.patrimonio,
+        compacto.valor_time,
+        compacto.ultima_pontuacao,
+        atletas,
+        info,
+    )
+
+
+def _parse_chunk(chunk: Sequence[Union[bytes, str]]) -> List[TimeCompacto]:
+    return [parse_time_compacto(payload) for payload in chunk]
+
+
+def _chunks(
+    payloads: Iterable[Union[bytes, str]], chunksize: int
+) -> Iterator[List[Union[bytes, str]]]:
+    chunk = []
+    for payload in payloads:
+        chunk.append(payload)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class TimeParser(object):
+    """Converte grandes lotes de respostas de /time/id/{time_id} em paralelo, em um pool de processos.
+
+    Os bytes de cada resposta são enviados aos processos em lotes, e cada processo devolve apenas tuplas compactas
+    (cartolafc.batch.TimeCompacto), reduzindo o custo de comunicação. O json.loads, que é limitado pelo GIL, passa a
+    escalar com a quantidade de núcleos.
+
+    Exemplo de uso:
+        >>> clubes = api.clubes()
+        >>> with TimeParser(clubes, workers=8) as parser:
+        ...     times = parser.parse(payloads)
+    """
+
+    def __init__(
+        self,
+        clubes: Optional[Dict[int, Clube]] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+    ) -> None:
+        """
+        Args:
+            clubes (dict): Clubes utilizados na construção dos cartolafc.Time. Necessário apenas para parse().
+            workers (int): Quantidade de processos. Se não for informado, um por núcleo. 0 executa no próprio
+                processo, sem pool.
+            chunksize (int): Quantidade de respostas enviadas a um processo de cada vez.
+        """
+
+        self._clubes = clubes or {}
+        self._workers = (os.cpu_count() or 1) if workers is None else workers
+        self._chunksize = max(chunksize, 1)
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "TimeParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def parse_compact(
+        self, payloads: Iterable[Union[bytes, str]]
+    ) -> Iterator[TimeCompacto]:
+        """Converte as respostas em cartolafc.batch.TimeCompacto, preservando a ordem."""
+
+        chunks = _chunks(payloads, self._chunksize)
+        if not self._workers:
+            resultados = map(_parse_chunk, chunks)
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            resultados = self._executor.map(_parse_chunk, chunks)
+
+        for resultado in resultados:
+            yield from resultado
+
+    def parse(self, payloads: Iterable[Union[bytes, str]]) -> List[Time]:
+        """Converte as respostas em instâncias de cartolafc.Time, preservando a ordem.
+
+        Raises:
+            cartolafc.CartolaFCError: Se alguma das respostas for inválida.
+        """
+
+        return [
+            time_from_compacto(compacto, self._clubes)
+            for compacto in self.parse_compact(payloads)
+        ]
+
+
+def parse_times(
+    payloads: Iterable[Union[bytes, str]],
+    clubes: Dict[int, Clube],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+) -> List[Time]:
+    """Atalho para converter um único lote com um cartolafc.batch.TimeParser temporário."""
+
+    with TimeParser(clubes, workers=workers, chunksize=chunksize) as parser:
+        return parser.parse(payloads)
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .errors import CartolaFCCircuitOpenError, CartolaFCOverloadError
+from .metrics import Hooks
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuito(object):
+    __slots__ = ("estado", "falhas", "aberto_em", "sondando")
+
+    def __init__(self) -> None:
+        self.estado = CLOSED
+        self.falhas = 0
+        self.aberto_em = 0.0
+        self.sondando = False
+
+
+class CircuitBreaker(object):
+    """Circuit breaker por endpoint, com stale-while-revalidate, para os períodos de sobrecarga do Cartola.
+
+    Após failure_threshold erros de sobrecarga seguidos em um endpoint, o circuito abre: as chamadas deixam de acessar
+    a API e utilizam a última resposta válida da mesma requisição, marcada como antiga (veja
+    cartolafc.Api.last_response_stale), ou falham imediatamente com cartolafc.CartolaFCCircuitOpenError se não houver
+    nenhuma. Passados reset_timeout segundos, uma única requisição de teste é feita, em segundo plano se houver uma
+    resposta antiga a ser servida enquanto isso; se ela tiver sucesso, o circuito fecha.
+
+    Exemplo de uso:
+        >>> api = cartolafc.Api(attempts=3, circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=30))
+        >>> mercado = api.mercado()
+        >>> api.last_response_stale
+        False
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        stale_ttl: Optional[float] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            failure_threshold (int): Quantidade de erros de sobrecarga seguidos que abre o circuito de um endpoint.
+            reset_timeout (float): Segundos com o circuito aberto até a próxima requisição de teste.
+            stale_ttl (float): Idade máxima, em segundos, de uma resposta antiga para que ela ainda seja utilizada.
+                Por padrão, sem limite.
+            max_entries (int): Quantidade máxima de respostas guardadas; as menos usadas são descartadas.
+            clock (callable): Relógio monotônico, em segundos.
+        """
+
+        self._failure_threshold = max(failure_threshold, 1)
+        self._reset_timeout = reset_timeout
+        self._stale_ttl = stale_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuitos: Dict[str, _Circuito] = {}
+        self._respostas: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._local = threading.local()
+
+    @property
+    def stale(self) -> bool:
+        """Se a última resposta obtida nesta thread foi uma resposta antiga."""
+
+        return getattr(self._local, "stale", False)
+
+    def state(self, endpoint: str) -> str:
+        with self._lock:
+            circuito = self._circuitos.get(endpoint)
+            return circuito.estado if circuito else CLOSED
+
+    def _mudar_estado(
+        self, endpoint: str, circuito: _Circuito, estado: str, hooks: Optional[Hooks]
+    ) -> None:
+        if circuito.estado != estado:
+            circuito.estado = estado
+            if hooks is not None:
+                hooks.on_circuit_state(endpoint, estado)
+
+    def _resposta_antiga(self, chave: str) -> Optional[Tuple[float, Any]]:
+        resposta = self._respostas.get(chave)
+        if resposta is None:
+            return None
+        if (
+            self._stale_ttl is not None
+            and self._clock() - resposta[0] > self._stale_ttl
+        ):
+            return None
+        self._respostas.move_to_end(chave)
+        return resposta
+
+    def _sucesso(
+        self, endpoint: str, chave: str, data: Any, hooks: Optional[Hooks]
+    ) -> None:
+        with self._lock:
+            circuito = self._circuitos.setdefault(endpoint, _Circuito())
+            circuito.falhas = 0
+            circuito.sondando = False
+            self._mudar_estado(endpoint, circuito, CLOSED, hooks)
+            self._respostas[chave] = (self._clock(), data)
+            self._respostas.move_to_end(chave)
+            while len(self._respostas) > self._max_entries:
+                self._respostas.popitem(last=False)
+
+    def _falha(self, endpoint: str, hooks: Optional[Hooks]) -> None:
+        with self._lock:
+            circuito = self._circuitos.setdefault(endpoint, _Circuito())
+            circuito.falhas += 1
+            circuito.sondando = False
+            if (
+                circuito.estado == HALF_OPEN
+                or circuito.falhas >= self._failure_threshold
+            ):
+                circuito.aberto_em = self._clock()
+                self._mudar_estado(endpoint, circuito, OPEN, hooks)
+
+    def _executar(
+        self,
+        endpoint: str,
+        chave: str,
+        fetch: Callable[[], Any],
+        hooks: Optional[Hooks],
+    ) -> Any:
+        try:
+            data = fetch()
+        except CartolaFCOverloadError:
+            self._falha(endpoint, hooks)
+            raise
+        except BaseException:
+            # Outros erros (ex.: time inexistente) não indicam sobrecarga, mas liberam a requisição de teste.
+            with self._lock:
+                self._circuitos.setdefault(endpoint, _Circuito()).sondando = False
+            raise
+        self._sucesso(endpoint, chave, data, hooks)
+        return data
+
+    def _revalidar(
+        self,
+        endpoint: str,
+        chave: str,
+        fetch: Callable[[], Any],
+        hooks: Optional[Hooks],
+    ) -> None:
+        try:
+            self._executar(endpoint, chave, fetch, hooks)
+        except Exception:
+            pass
+
+    def call(
+        self,
+        endpoint: str,
+        chave: str,
+        fetch: Callable[[], Any],
+        hooks: Optional[Hooks] = None,
+    ) -> Any:
+        """Executa fetch protegido pelo circuito do endpoint.
+
+        Args:
+            endpoint (str): Nome do circuito (ex.: o nome do método da cartolafc.Api).
+            chave (str): Identificador da requisição, para guardar e reutilizar a sua última resposta válida.
+            fetch (callable): Função que faz a requisição e retorna os dados decodificados.
+            hooks (cartolafc.metrics.Hooks): Notificados das mudanças de estado e das respostas antigas utilizadas.
+
+        Raises:
+            cartolafc.CartolaFCCircuitOpenError: Se o circuito estiver aberto e não houver uma resposta antiga.
+            cartolafc.CartolaFCOverloadError: Se a requisição falhar por sobrecarga e não houver uma resposta antiga.
+        """
+
+        self._local.stale = False
+        with self._lock:
+            circuito = self._circuitos.setdefault(endpoint, _Circuito())
+            antiga = None
+            sondar = False
+            fechado = circuito.estado == CLOSED
+            if not fechado:
+                antiga = self._resposta_antiga(chave)
+                expirado = self._clock() - circuito.aberto_em >= self._reset_timeout
+                if expirado and not circuito.sondando:
+                    circuito.sondando = sondar = True
+                    self._mudar_estado(endpoint, circuito, HALF_OPEN, hooks)
+
+        if fechado or (sondar and antiga is None):
+            try:
+                return self._executar(endpoint, chave, fetch, hooks)
+            except CartolaFCOverloadError:
+                with self._lock:
+                    antiga = self._resposta_antiga(chave)
+                if antiga is None:
+                    raise
+        elif sondar:
+            threading.Thread(
+                target=self._revalidar,
+                args=(endpoint, chave, fetch, hooks),
+                name=f"cartolafc-revalidate-{endpoint}",
+                daemon=True,
+            ).start()
+
+        if antiga is None:
+            raise CartolaFCCircuitOpenError(
+                f"O circuito de {endpoint} está aberto após sucessivas sobrecargas dos servidores."
+            )
+        self._local.stale = True
+        if hooks is not None:
+            hooks.on_stale(endpoint)
+        return antiga[1]
@@ -0,0 +1,502 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .api import Api
+from .errors import CartolaFCError
+from .models import Atleta, Clube, Liga
+from .scout import SCOUTS
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+Record = Dict[str, Any]
+Column = Tuple[str, str]
+
+_COLUNAS_ATLETA: List[Column] = [
+    ("atleta_id", "int"),
+    ("apelido", "str"),
+    ("posicao_id", "int"),
+    ("clube_id", "int"),
+    ("status_id", "int"),
+    ("pontos", "float"),
+    ("preco", "float"),
+    ("media", "float"),
+] + [(f"scout_{codigo}", "int") for codigo in SCOUTS]
+
+COLUMNS: Dict[str, List[Column]] = {
+    "mercado": _COLUNAS_ATLETA,
+    "parciais": [("rodada", "int")] + _COLUNAS_ATLETA,
+    "partidas": [
+        ("rodada", "int"),
+        ("data", "str"),
+        ("local", "str"),
+        ("clube_casa_id", "int"),
+        ("clube_casa", "str"),
+        ("placar_casa", "int"),
+        ("clube_visitante_id", "int"),
+        ("clube_visitante", "str"),
+        ("placar_visitante", "int"),
+    ],
+    "times": [
+        ("time_id", "int"),
+        ("nome", "str"),
+        ("rodada", "int"),
+        ("patrimonio", "float"),
+        ("valor_time", "float"),
+        ("ultima_pontuacao", "float"),
+        ("is_capitao", "bool"),
+    ]
+    + _COLUNAS_ATLETA,
+}
+"""Colunas (nome, tipo) dos registros exportados por cada comando."""
+
+
+def atleta_record(atleta: Atleta) -> Record:
+    """Converte um cartolafc.Atleta em um registro plano, com uma coluna por scout."""
+
+    record = dict(
+        atleta_id=atleta.id,
+        apelido=atleta.apelido,
+        posicao_id=atleta.posicao.id,
+        clube_id=atleta.clube.id,
+        status_id=atleta.status.id if atleta.status else None,
+        pontos=atleta.pontos,
+        preco=atleta.preco,
+        media=atleta.media,
+    )
+    for codigo, quantidade in zip(SCOUTS, atleta.scout.values_array.tolist()):
+        record[f"scout_{codigo}"] = quantidade
+    return record
+
+
+class _NdjsonWriter(object):
+    def __init__(self, stream: IO[str], colunas: List[Column]) -> None:
+        self._stream = stream
+
+    def write(self, record: Record) -> None:
+        self._stream.write(json.dumps(record, ensure_ascii=False))
+        self._stream.write("\n")
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+
+class _CsvWriter(_NdjsonWriter):
+    def __init__(
+        self, stream: IO[str], colunas: List[Column], header: bool = True
+    ) -> None:
+        super(_CsvWriter, self).__init__(stream, colunas)
+        self._writer = csv.DictWriter(stream, [nome for nome, _ in colunas])
+        if header:
+            self._writer.writeheader()
+
+    def write(self, record: Record) -> None:
+        self._writer.writerow(record)
+
+
+class _ParquetWriter(object):
+    def __init__(self, path: str, colunas: List[Column], batch_size: int) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise CartolaFCError(
+                "A exportação em Parquet requer o pacote pyarrow: pip install Python-CartolaFC[parquet]"
+            )
+        tipos = dict(
+            int=pyarrow.int64(),
+            float=pyarrow.float64(),
+            str=pyarrow.string(),
+            bool=pyarrow.bool_(),
+        )
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(nome, tipos[tipo]) for nome, tipo in colunas])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._batch_size = batch_size
+        self._pendentes: List[Record] = []
+
+    def write(self, record: Record) -> None:
+        self._pendentes.append(record)
+        if len(self._pendentes) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pendentes:
+            tabela = self._pyarrow.Table.from_pylist(self._pendentes, self._schema)
+            self._writer.write_table(tabela)
+            self._pendentes = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
+class _Checkpoint(object):
+    """Arquivo com a quantidade de itens (rodadas ou times) já processados, os que falharam (tentados novamente ao
+    retomar a exportação) e o tamanho da saída naquele momento."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, **estado: Any) -> None:
+        temporario = f"{self.path}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(estado, f)
+        os.replace(temporario, self.path)
+
+
+class _Progresso(object):
+    def __init__(self, nome: str, intervalo: float, stream: IO[str]) -> None:
+        self._nome = nome
+        self._intervalo = intervalo
+        self._stream = stream
+        self._inicio = self._ultimo = time.monotonic()
+        self.itens = 0
+        self.registros = 0
+        self.falhas = 0
+
+    def _linha(self, agora: float) -> str:
+        decorrido = max(agora - self._inicio, 1e-9)
+        return (
+            f"{self._nome}: {self.itens} itens, {self.registros} registros, {self.falhas} falhas "
+            f"em {decorrido:.1f}s ({self.itens / decorrido:.1f} itens/s, "
+            f"{self.registros / decorrido:.0f} registros/s)"
+        )
+
+    def update(self, registros: int, falhou: bool = False) -> None:
+        self.itens += 1
+        self.registros += registros
+        self.falhas += falhou
+        agora = time.monotonic()
+        if self._intervalo and agora - self._ultimo >= self._intervalo:
+            self._ultimo = agora
+            print(self._linha(agora), file=self._stream)
+
+    def finish(self) -> None:
+        print(self._linha(time.monotonic()), file=self._stream)
+
+
+def _em_ordem(
+    itens: Iterable[Any], buscar: Callable[[Any], Any], workers: int
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Executa buscar para cada item em até `workers` threads, com no máximo 2 * workers itens em andamento, e
+    retorna os resultados na ordem dos itens. Qualquer erro de um item (inclusive de rede, que a cartolafc.Api não
+    converte em cartolafc.CartolaFCError) é retornado junto com ele, sem interromper os demais.
+    """
+
+    if workers <= 1:
+        for item in itens:
+            try:
+                yield item, buscar(item), None
+            except Exception as error:
+                yield item, None, error
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pendentes: "deque[Tuple[Any, Any]]" = deque()
+
+        def proximo() -> Tuple[Any, Any, Optional[Exception]]:
+            item, futuro = pendentes.popleft()
+            try:
+                return item, futuro.result(), None
+            except Exception as error:
+                return item, None, error
+
+        for item in itens:
+            pendentes.append((item, executor.submit(buscar, item)))
+            if len(pendentes) >= 2 * workers:
+                yield proximo()
+        while pendentes:
+            yield proximo()
+
+
+def _rodadas(texto: str) -> List[int]:
+    rodadas: List[int] = []
+    for parte in texto.split(","):
+        inicio, _, fim = parte.partition("-")
+        rodadas.extend(range(int(inicio), int(fim or inicio) + 1))
+    return rodadas
+
+
+def _ids_do_arquivo(path: str) -> Iterator[int]:
+    with open(path, "r", encoding="utf-8") as f:
+        for linha in f:
+            linha = linha.split("#", 1)[0].strip()
+            if linha:
+                yield int(linha)
+
+
+def _ids_da_liga(path: str) -> Iterator[int]:
+    with open(path, "rb") as f:
+        liga = Liga.from_dict(json.loads(f.read().decode("utf-8")))
+    for time_info in liga.times or ():
+        yield time_info.id
+
+
+class _Exportador(object):
+    def __init__(self, api: Api, args: argparse.Namespace) -> None:
+        self._api = api
+        self._args = args
+        self._clubes: Optional[Dict[int, Clube]] = None
+        self._rodada: Optional[int] = None
+
+    def itens(self) -> Iterable[Any]:
+        comando = self._args.command
+        if comando == "partidas":
+            return _rodadas(self._args.rodadas)
+        if comando == "times":
+            self._clubes = self._api.clubes()
+            # Sem --rodada, a API retorna os times na rodada atual.
+            self._rodada = self._args.rodada or self._api.mercado().rodada_atual
+            if self._args.liga:
+                return _ids_da_liga(self._args.liga)
+            return _ids_do_arquivo(self._args.ids)
+        return [comando]
+
+    def buscar(self, item: Any) -> List[Record]:
+        return getattr(self, f"_{self._args.command}")(item)
+
+    def _mercado(self, _: Any) -> List[Record]:
+        return [atleta_record(atleta) for atleta in self._api.mercado_atletas()]
+
+    def _parciais(self, _: Any) -> List[Record]:
+        rodada = self._api.mercado().rodada_atual
+        return [
+            dict(rodada=rodada, **atleta_record(atleta))
+            for atleta in self._api.parciais().values()
+        ]
+
+    def _partidas(self, rodada: int) -> List[Record]:
+        return [
+            dict(
+                rodada=rodada,
+                data=partida.data.isoformat(),
+                local=partida.local,
+                clube_casa_id=partida.clube_casa.id,
+                clube_casa=partida.clube_casa.nome,
+                placar_casa=partida.placar_casa,
+                clube_visitante_id=partida.clube_visitante.id,
+                clube_visitante=partida.clube_visitante.nome,
+                placar_visitante=partida.placar_visitante,
+            )
+            for partida in self._api.partidas(rodada)
+        ]
+
+    def _times(self, time_id: int) -> List[Record]:
+        # Os clubes são obtidos uma única vez, e não novamente para cada time como em cartolafc.Api.time().
+        time_ = self._api._time(time_id, self._args.rodada, clubes=self._clubes)
+        time_registro = dict(
+            time_id=time_.info.id,
+            nome=time_.info.nome,
+            rodada=self._rodada,
+            patrimonio=time_.patrimonio,
+            valor_time=time_.valor_time,
+            ultima_pontuacao=time_.ultima_pontuacao,
+        )
+        return [
+            dict(
+                time_registro,
+                is_capitao=bool(atleta.is_capitao),
+                **atleta_record(atleta),
+            )
+            for atleta in time_.atletas
+        ]
+
+
+_EXTENSOES = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+
+def _formato(args: argparse.Namespace) -> str:
+    if args.format:
+        return args.format
+    extensao = os.path.splitext(args.output or "")[1].lower()
+    return _EXTENSOES.get(extensao, "ndjson")
+
+
+def export(
+    args: argparse.Namespace, api: Optional[Api] = None, stderr: IO[str] = sys.stderr
+) -> int:
+    """Executa um dos comandos de exportação, gravando os registros à medida que são obtidos.
+
+    Returns:
+        A quantidade de registros exportados.
+    """
+
+    formato = _formato(args)
+    colunas = COLUMNS[args.command]
+    para_stdout = args.output in (None, "-")
+    if para_stdout and formato == "parquet":
+        raise CartolaFCError("A exportação em Parquet requer um arquivo de saída (-o).")
+
+    checkpoint = _Checkpoint(args.checkpoint) if args.checkpoint else None
+    estado = checkpoint.load() if checkpoint else None
+    if checkpoint and (para_stdout or formato == "parquet"):
+        raise CartolaFCError("O checkpoint requer a saída em um arquivo NDJSON ou CSV.")
+    if estado and (estado.get("command"), estado.get("output")) != (
+        args.command,
+        args.output,
+    ):
+        raise CartolaFCError(f"O checkpoint {args.checkpoint} é de outra exportação.")
+    feitos = estado["done"] if estado else 0
+    # Itens que falharam antes do checkpoint: são tentados novamente, antes dos demais, ao retomar.
+    anteriores: List[Any] = estado.get("failed", []) if estado else []
+
+    if api is None:
+        api = Api(attempts=args.attempts)
+    if args.api_url:
+        api._api_url = args.api_url.rstrip("/")
+    exportador = _Exportador(api, args)
+
+    stream: Optional[IO[str]] = None
+    if formato == "parquet":
+        escritor: Any = _ParquetWriter(args.output, colunas, args.batch_size)
+    else:
+        if para_stdout:
+            stream = sys.stdout
+        else:
+            stream = open(
+                args.output, "a" if estado else "w", encoding="utf-8", newline=""
+            )
+            if estado:
+                # Descarta o que foi gravado depois do último checkpoint.
+                stream.truncate(estado["offset"])
+        if formato == "csv":
+            escritor = _CsvWriter(stream, colunas, header=not estado)
+        else:
+            escritor = _NdjsonWriter(stream, colunas)
+
+    progresso = _Progresso(args.command, args.progress, stderr)
+    novos = repetidos = 0
+    falhas: List[Any] = []
+
+    def salvar_checkpoint() -> None:
+        escritor.flush()
+        checkpoint.save(
+            command=args.command,
+            output=args.output,
+            done=feitos + novos,
+            failed=anteriores[repetidos:] + falhas,
+            offset=stream.tell(),
+        )
+
+    try:
+        itens = chain(
+            ((True, item) for item in anteriores),
+            ((False, item) for item in islice(exportador.itens(), feitos, None)),
+        )
+        for (repetido, item), registros, erro in _em_ordem(
+            itens, lambda par: exportador.buscar(par[1]), args.workers
+        ):
+            if repetido:
+                repetidos += 1
+            else:
+                novos += 1
+            if erro is not None:
+                if args.command in ("mercado", "parciais"):
+                    raise erro
+                logger.warning("Não foi possível exportar %s: %s", item, erro)
+                falhas.append(item)
+            for registro in registros or ():
+                escritor.write(registro)
+            progresso.update(len(registros or ()), erro is not None)
+            if checkpoint and progresso.itens % args.checkpoint_every == 0:
+                salvar_checkpoint()
+        escritor.flush()
+        if checkpoint:
+            salvar_checkpoint()
+    finally:
+        escritor.close()
+        if stream is not None and not para_stdout:
+            stream.close()
+    progresso.finish()
+    return progresso.registros
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cartolafc",
+        description="Exporta os dados do Cartola FC em NDJSON, CSV ou Parquet.",
+    )
+    comuns = argparse.ArgumentParser(add_help=False)
+    comuns.add_argument("-o", "--output", help="arquivo de saída (padrão: stdout)")
+    comuns.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        help="padrão: pela extensão da saída, ou ndjson",
+    )
+    comuns.add_argument(
+        "-w", "--workers", type=int, default=8, help="requisições em paralelo"
+    )
+    comuns.add_argument("--attempts", type=int, default=3)
+    comuns.add_argument(
+        "--checkpoint",
+        metavar="ARQUIVO",
+        help="permite retomar uma exportação interrompida",
+    )
+    comuns.add_argument("--checkpoint-every", type=int, default=100, metavar="ITENS")
+    comuns.add_argument(
+        "--progress", type=float, default=5.0, metavar="SEGUNDOS", help="0 desativa"
+    )
+    comuns.add_argument(
+        "--batch-size", type=int, default=10000, help="linhas por row group no Parquet"
+    )
+    comuns.add_argument("--api-url", help="URL base da API (ex.: um servidor local)")
+
+    comandos = parser.add_subparsers(dest="command", required=True)
+    comandos.add_parser("mercado", parents=[comuns], help="atletas do mercado")
+    comandos.add_parser(
+        "parciais", parents=[comuns], help="pontuações parciais da rodada atual"
+    )
+    partidas = comandos.add_parser(
+        "partidas", parents=[comuns], help="partidas por rodada"
+    )
+    partidas.add_argument("--rodadas", default="1-38", help="ex.: 1-38 ou 1,5,10-12")
+    times = comandos.add_parser(
+        "times", parents=[comuns], help="atletas escalados por cada time"
+    )
+    origem = times.add_mutually_exclusive_group(required=True)
+    origem.add_argument("--ids", metavar="ARQUIVO", help="um id de time por linha")
+    origem.add_argument(
+        "--liga", metavar="ARQUIVO", help="resposta JSON de uma liga, com os seus times"
+    )
+    times.add_argument("--rodada", type=int, default=0, help="padrão: a última rodada")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        export(args)
+    except KeyboardInterrupt:
+        return 130
+    except Exception as error:
+        # Inclusive os erros de rede, que a cartolafc.Api não converte em cartolafc.CartolaFCError.
+        logger.debug("Falha na exportação", exc_info=True)
+        print(f"cartolafc: {error}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,236 @@
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .errors import CartolaFCError
+from .models import Atleta, Clube
+from .scout import SCOUTS, Scout
+
+_MAGIC = b"CFCC"
+_HEADER = struct.Struct("<4sIII")
+_SCOUTS = len(SCOUTS)
+_SEM_CLUBE = Clube(0, "Sem Clube", "Sem Clube")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _alinhar(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _secoes(quantidade: int, tamanho_apelidos: int) -> List[Tuple[str, str, int, int]]:
+    """Retorna (nome, typecode, offset, tamanho em bytes) de cada coluna de um bloco com `quantidade` atletas."""
+
+    colunas = [
+        ("pontos", "d", 8 * quantidade),
+        ("ids", "i", 4 * quantidade),
+        ("clube_ids", "i", 4 * quantidade),
+        ("posicao_ids", "h", 2 * quantidade),
+        ("status_ids", "h", 2 * quantidade),
+        ("scouts", "h", 2 * _SCOUTS * quantidade),
+        ("fim_apelidos", "i", 4 * quantidade),
+        ("apelidos", "B", tamanho_apelidos),
+    ]
+    secoes = []
+    offset = _alinhar(_HEADER.size)
+    for nome, typecode, tamanho in colunas:
+        secoes.append((nome, typecode, offset, tamanho))
+        offset = _alinhar(offset + tamanho)
+    return secoes
+
+
+def pack_parciais(parciais: Mapping[int, Atleta]) -> bytes:
+    """Serializa as parciais (como retornadas por cartolafc.Api.parciais()) em um bloco colunar compacto.
+
+    Os atletas são ordenados pelo id, e cada atributo numérico ocupa uma coluna de tamanho fixo (pontos em float64,
+    scouts em uma matriz int16 na ordem de cartolafc.scout.SCOUTS). Os apelidos e os clubes vão ao final do bloco.
+    Scouts com códigos desconhecidos (Scout.extras) não são incluídos.
+
+    Returns:
+        Os bytes do bloco, que podem ser lidos sem cópia por cartolafc.columnar.ParciaisColumns.
+    """
+
+    atletas = [parciais[atleta_id] for atleta_id in sorted(parciais)]
+    quantidade = len(atletas)
+
+    apelidos = bytearray()
+    fim_apelidos = []
+    clubes: Dict[int, Tuple[str, str]] = {}
+    for atleta in atletas:
+        apelidos += atleta.apelido.encode("utf-8")
+        fim_apelidos.append(len(apelidos))
+        if atleta.clube.id:
+            clubes[atleta.clube.id] = (atleta.clube.nome, atleta.clube.abreviacao)
+    meta = json.dumps({"clubes": clubes}, separators=(",", ":")).encode("utf-8")
+
+    secoes = _secoes(quantidade, len(apelidos))
+    _, _, offset_final, tamanho_final = secoes[-1]
+    inicio_meta = _alinhar(offset_final + tamanho_final)
+    bloco = bytearray(inicio_meta + len(meta))
+    _HEADER.pack_into(bloco, 0, _MAGIC, quantidade, len(apelidos), len(meta))
+
+    valores = {
+        "pontos": [atleta.pontos or 0.0 for atleta in atletas],
+        "ids": [atleta.id for atleta in atletas],
+        "clube_ids": [atleta.clube.id for atleta in atletas],
+        "posicao_ids": [atleta.posicao.id for atleta in atletas],
+        "status_ids": [atleta.status.id if atleta.status else 0 for atleta in atletas],
+        "fim_apelidos": fim_apelidos,
+    }
+    for nome, typecode, offset, tamanho in secoes:
+        if nome == "scouts":
+            for indice, atleta in enumerate(atletas):
+                inicio = offset + 2 * _SCOUTS * indice
+                bloco[
+                    inicio : inicio + 2 * _SCOUTS
+                ] = atleta.scout.values_array.tobytes()
+        elif nome == "apelidos":
+            bloco[offset : offset + tamanho] = apelidos
+        else:
+            bloco[offset : offset + tamanho] = array(typecode, valores[nome]).tobytes()
+    bloco[inicio_meta:] = meta
+    return bytes(bloco)
+
+
+class ParciaisColumns(object):
+    """Leitura sem cópia de um bloco gerado por cartolafc.columnar.pack_parciais.
+
+    As colunas são memoryviews sobre o buffer original (bytes, mmap ou memória compartilhada), na ordem dos ids dos
+    atletas. Apenas os atletas consultados com atleta() ou to_dict() são convertidos em instâncias de cartolafc.Atleta.
+
+    Exemplo de uso:
+        >>> colunas = ParciaisColumns(pack_parciais(api.parciais()))
+        >>> colunas.pontos_of(37656), colunas.scout_of(37656)["G"]
+        >>> sum(colunas.pontos) / len(colunas)
+    """
+
+    def __init__(self, buffer: Buffer) -> None:
+        buffer = memoryview(buffer).cast("B")
+        magica, quantidade, tamanho_apelidos, tamanho_meta = _HEADER.unpack_from(
+            buffer, 0
+        )
+        if magica != _MAGIC:
+            raise CartolaFCError("O buffer não contém um bloco de parciais.")
+
+        self._buffer = buffer
+        self._quantidade = quantidade
+        colunas: Dict[str, memoryview] = {}
+        fim = _HEADER.size
+        for nome, typecode, offset, tamanho in _secoes(quantidade, tamanho_apelidos):
+            colunas[nome] = buffer[offset : offset + tamanho].cast(typecode)
+            fim = offset + tamanho
+        inicio_meta = _alinhar(fim)
+        self._meta = buffer[inicio_meta : inicio_meta + tamanho_meta]
+        self._clubes: Optional[Dict[int, Clube]] = None
+
+        self.ids: memoryview = colunas["ids"]
+        self.pontos: memoryview = colunas["pontos"]
+        self.clube_ids: memoryview = colunas["clube_ids"]
+        self.posicao_ids: memoryview = colunas["posicao_ids"]
+        self.status_ids: memoryview = colunas["status_ids"]
+        self.scouts: memoryview = (
+            colunas["scouts"].cast("B").cast("h", [quantidade, _SCOUTS])
+            if quantidade
+            else colunas["scouts"]
+        )
+        """Matriz (atletas x cartolafc.scout.SCOUTS) com as quantidades de cada scout."""
+        self._scouts_bytes = colunas["scouts"].cast("B")
+        self._fim_apelidos = colunas["fim_apelidos"]
+        self._apelidos = colunas["apelidos"]
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __contains__(self, atleta_id: object) -> bool:
+        return self.row(atleta_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def row(self, atleta_id: Any) -> Optional[int]:
+        """Posição do atleta nas colunas (busca binária nos ids), ou None se ele não estiver no bloco."""
+
+        indice = bisect_left(self.ids, atleta_id)
+        if indice < self._quantidade and self.ids[indice] == atleta_id:
+            return indice
+        return None
+
+    def _row(self, atleta_id: int) -> int:
+        indice = self.row(atleta_id)
+        if indice is None:
+            raise KeyError(atleta_id)
+        return indice
+
+    def pontos_of(self, atleta_id: int) -> float:
+        return self.pontos[self._row(atleta_id)]
+
+    def status_of(self, atleta_id: int) -> Optional[int]:
+        return self.status_ids[self._row(atleta_id)] or None
+
+    def scout_of(self, atleta_id: int) -> Scout:
+        return self._scout(self._row(atleta_id))
+
+    def _scout(self, indice: int) -> Scout:
+        inicio = 2 * _SCOUTS * indice
+        return Scout.from_values(
+            self._scouts_bytes[inicio : inicio + 2 * _SCOUTS].cast("h")
+        )
+
+    def apelido(self, indice: int) -> str:
+        inicio = self._fim_apelidos[indice - 1] if indice else 0
+        return bytes(self._apelidos[inicio : self._fim_apelidos[indice]]).decode(
+            "utf-8"
+        )
+
+    @property
+    def clubes(self) -> Dict[int, Clube]:
+        if self._clubes is None:
+            meta = json.loads(bytes(self._meta).decode("utf-8"))
+            self._clubes = {
+                int(clube_id): Clube(int(clube_id), nome, abreviacao)
+                for clube_id, (nome, abreviacao) in meta["clubes"].items()
+            }
+        return self._clubes
+
+    def atleta(self, atleta_id: int) -> Atleta:
+        """Constrói o cartolafc.Atleta de um atleta do bloco."""
+
+        indice = self._row(atleta_id)
+        return self._atleta(indice)
+
+    def _atleta(self, indice: int) -> Atleta:
+        clube_id = self.clube_ids[indice]
+        return Atleta(
+            self.ids[indice],
+            self.apelido(indice),
+            self.pontos[indice],
+            self._scout(indice),
+            self.posicao_ids[indice],
+            self.clubes.get(clube_id, _SEM_CLUBE),
+            self.status_ids[indice] or None,
+        )
+
+    def to_dict(self) -> Dict[int, Atleta]:
+        """Constrói o mesmo mapa retornado por cartolafc.Api.parciais()."""
+
+        return {self.ids[indice]: self._atleta(indice) for indice in range(len(self))}
+
+    def release(self) -> None:
+        """Libera as memoryviews sobre o buffer (necessário antes de fechar uma memória compartilhada)."""
+
+        for view in (
+            self.ids,
+            self.pontos,
+            self.clube_ids,
+            self.posicao_ids,
+            self.status_ids,
+            self.scouts,
+            self._scouts_bytes,
+            self._fim_apelidos,
+            self._apelidos,
+            self._meta,
+        ):
+            view.release()
+        self._buffer.release()
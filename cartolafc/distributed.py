@@ -0,0 +1,483 @@
+import heapq
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .api import Api
+from .columnar import ParciaisColumns, pack_parciais
+from .errors import CartolaFCError, CartolaFCOverloadError
+from .models import Atleta
+
+logger = logging.getLogger(__name__)
+
+RankingEntry = namedtuple("RankingEntry", ["time_id", "nome", "pontos", "jogados"])
+"""Posição de um time em um ranking de parciais."""
+
+Shard = namedtuple("Shard", ["tick", "shard_id", "time_ids", "attempts"])
+"""Lote de times de um tick, entregue a um único worker por vez."""
+
+ShardResult = namedtuple("ShardResult", ["ranking", "missing"])
+"""Resultado de um shard: o ranking parcial, já ordenado, e os times que não puderam ser obtidos."""
+
+
+def _ordem(entrada: RankingEntry) -> Tuple[float, int]:
+    return -entrada.pontos, entrada.time_id
+
+
+def merge_rankings(rankings: Iterable[Sequence[RankingEntry]]) -> List[RankingEntry]:
+    """Intercala rankings parciais, cada um já ordenado por pontos (decrescente) e time_id, em um ranking global."""
+
+    return list(heapq.merge(*rankings, key=_ordem))
+
+
+class ShardQueue(object):
+    """Fila de shards compartilhada entre o coordenador e os workers, que podem estar em outros processos ou hosts.
+
+    Cada shard entregue por claim() fica reservado ao worker até o fim do lease. Se o worker falhar (fail()) ou o
+    lease expirar sem que o shard seja concluído, ele volta à fila, até esgotar as tentativas.
+    """
+
+    def publish(self, snapshot: bytes, shards: Sequence[Sequence[int]]) -> int:
+        """Cria um novo tick com o snapshot das parciais e os seus shards, e retorna o número do tick."""
+
+        raise NotImplementedError
+
+    def snapshot(self, tick: int) -> bytes:
+        raise NotImplementedError
+
+    def claim(self, worker: str, lease: float) -> Optional[Shard]:
+        """Reserva o próximo shard disponível para o worker, ou retorna None se não houver nenhum."""
+
+        raise NotImplementedError
+
+    def complete(self, shard: Shard, result: ShardResult) -> None:
+        raise NotImplementedError
+
+    def fail(self, shard: Shard, error: str) -> None:
+        raise NotImplementedError
+
+    def progress(self, tick: int) -> Tuple[int, int, int]:
+        """Retorna a quantidade de shards pendentes (incluindo os reservados), concluídos e falhos do tick."""
+
+        raise NotImplementedError
+
+    def results(self, tick: int) -> List[ShardResult]:
+        raise NotImplementedError
+
+    def purge(self, tick: int) -> None:
+        """Remove o snapshot e os shards de um tick."""
+
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ShardQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SQLiteShardQueue(ShardQueue):
+    """cartolafc.distributed.ShardQueue em um arquivo SQLite local, que pode ser compartilhado pelos processos de um
+    mesmo host (ex.: workers iniciados com multiprocessing). Cada thread e processo utiliza a sua própria conexão, e
+    as reservas são feitas em transações exclusivas.
+
+    Exemplo de uso:
+        >>> queue = SQLiteShardQueue("parciais.sqlite3")
+        >>> for _ in range(4):
+        ...     multiprocessing.Process(target=ScoringWorker(queue).run, kwargs=dict(idle_timeout=60)).start()
+        >>> ranking = ScoringCoordinator(queue).tick(time_ids)
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshots (tick INTEGER PRIMARY KEY, payload BLOB NOT NULL);
+        CREATE TABLE IF NOT EXISTS shards (
+            tick INTEGER NOT NULL,
+            shard_id INTEGER NOT NULL,
+            time_ids TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker TEXT,
+            lease_until REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            result TEXT,
+            error TEXT,
+            PRIMARY KEY (tick, shard_id)
+        );
+    """
+
+    def __init__(
+        self, path: str, max_attempts: int = 3, clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            path (str): Caminho do arquivo SQLite.
+            max_attempts (int): Quantidade máxima de vezes que um shard é entregue a um worker antes de ser
+                considerado falho.
+            clock (callable): Relógio dos leases, compartilhado por todos os processos.
+        """
+
+        self.path = path
+        self.max_attempts = max(max_attempts, 1)
+        self._clock = clock
+        self._local = threading.local()
+        self._conexao().executescript(self._SCHEMA)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        estado = self.__dict__.copy()
+        del estado["_local"]
+        return estado
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        self.__dict__.update(estado)
+        self._local = threading.local()
+
+    def _conexao(self) -> sqlite3.Connection:
+        # Conexões SQLite não podem ser compartilhadas entre processos (fork) nem, por padrão, entre threads.
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None or self._local.pid != os.getpid():
+            conexao = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            self._local.conexao, self._local.pid = conexao, os.getpid()
+        return conexao
+
+    def _transacao(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        conexao = self._conexao()
+        conexao.execute("BEGIN IMMEDIATE")
+        try:
+            resultado = func(conexao)
+        except BaseException:
+            conexao.execute("ROLLBACK")
+            raise
+        conexao.execute("COMMIT")
+        return resultado
+
+    def _expirar(self, conexao: sqlite3.Connection) -> None:
+        """Devolve à fila os shards com lease expirado, ou os marca como falhos se esgotaram as tentativas."""
+
+        conexao.execute(
+            "UPDATE shards SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = 'lease expirado' WHERE status = 'leased' AND lease_until < ?",
+            (self.max_attempts, self._clock()),
+        )
+
+    def publish(self, snapshot: bytes, shards: Sequence[Sequence[int]]) -> int:
+        def publicar(conexao: sqlite3.Connection) -> int:
+            cursor = conexao.execute(
+                "INSERT INTO snapshots (payload) VALUES (?)", (snapshot,)
+            )
+            tick = cursor.lastrowid
+            conexao.executemany(
+                "INSERT INTO shards (tick, shard_id, time_ids) VALUES (?, ?, ?)",
+                (
+                    (tick, shard_id, json.dumps(list(time_ids)))
+                    for shard_id, time_ids in enumerate(shards)
+                ),
+            )
+            return tick
+
+        return self._transacao(publicar)
+
+    def snapshot(self, tick: int) -> bytes:
+        linha = (
+            self._conexao()
+            .execute("SELECT payload FROM snapshots WHERE tick = ?", (tick,))
+            .fetchone()
+        )
+        if linha is None:
+            raise CartolaFCError(f"O tick {tick} não existe.")
+        return bytes(linha[0])
+
+    def claim(self, worker: str, lease: float) -> Optional[Shard]:
+        def reservar(conexao: sqlite3.Connection) -> Optional[Shard]:
+            self._expirar(conexao)
+            linha = conexao.execute(
+                "SELECT tick, shard_id, time_ids, attempts FROM shards WHERE status = 'pending' "
+                "ORDER BY tick, shard_id LIMIT 1"
+            ).fetchone()
+            if linha is None:
+                return None
+            tick, shard_id, time_ids, attempts = linha
+            conexao.execute(
+                "UPDATE shards SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 "
+                "WHERE tick = ? AND shard_id = ?",
+                (worker, self._clock() + lease, tick, shard_id),
+            )
+            return Shard(tick, shard_id, json.loads(time_ids), attempts + 1)
+
+        return self._transacao(reservar)
+
+    def complete(self, shard: Shard, result: ShardResult) -> None:
+        # Um worker cujo lease expirou ainda pode concluir o shard; a primeira conclusão prevalece.
+        self._conexao().execute(
+            "UPDATE shards SET status = 'done', result = ?, error = NULL "
+            "WHERE tick = ? AND shard_id = ? AND status != 'done'",
+            (
+                json.dumps([result.ranking, result.missing]),
+                shard.tick,
+                shard.shard_id,
+            ),
+        )
+
+    def fail(self, shard: Shard, error: str) -> None:
+        # Ignorado se o lease já expirou e o shard foi reservado novamente.
+        self._conexao().execute(
+            "UPDATE shards SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, error = ? "
+            "WHERE tick = ? AND shard_id = ? AND status = 'leased' AND attempts = ?",
+            (self.max_attempts, error, shard.tick, shard.shard_id, shard.attempts),
+        )
+
+    def progress(self, tick: int) -> Tuple[int, int, int]:
+        def contar(conexao: sqlite3.Connection) -> Tuple[int, int, int]:
+            self._expirar(conexao)
+            contagem = dict(
+                conexao.execute(
+                    "SELECT status, COUNT(*) FROM shards WHERE tick = ? GROUP BY status",
+                    (tick,),
+                ).fetchall()
+            )
+            return (
+                contagem.get("pending", 0) + contagem.get("leased", 0),
+                contagem.get("done", 0),
+                contagem.get("failed", 0),
+            )
+
+        return self._transacao(contar)
+
+    def results(self, tick: int) -> List[ShardResult]:
+        linhas = (
+            self._conexao()
+            .execute(
+                "SELECT result FROM shards WHERE tick = ? AND status = 'done' ORDER BY shard_id",
+                (tick,),
+            )
+            .fetchall()
+        )
+        resultados = []
+        for (result,) in linhas:
+            ranking, missing = json.loads(result)
+            resultados.append(
+                ShardResult([RankingEntry(*entrada) for entrada in ranking], missing)
+            )
+        return resultados
+
+    def purge(self, tick: int) -> None:
+        def remover(conexao: sqlite3.Connection) -> None:
+            conexao.execute("DELETE FROM shards WHERE tick = ?", (tick,))
+            conexao.execute("DELETE FROM snapshots WHERE tick = ?", (tick,))
+
+        self._transacao(remover)
+
+    def close(self) -> None:
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is not None and self._local.pid == os.getpid():
+            conexao.close()
+        self._local = threading.local()
+
+
+class ScoringWorker(object):
+    """Worker que reserva shards de uma cartolafc.distributed.ShardQueue, obtém os times com cartolafc.Api.time e
+    calcula as parciais de cada um a partir do snapshot publicado pelo coordenador para o tick.
+
+    Um time inexistente é apenas reportado ao coordenador; já uma sobrecarga da API, ou qualquer outro erro, devolve
+    o shard inteiro à fila, para que seja processado novamente por este ou por outro worker.
+    """
+
+    def __init__(
+        self,
+        queue: ShardQueue,
+        api: Optional[Api] = None,
+        worker_id: Optional[str] = None,
+        lease: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            queue (cartolafc.distributed.ShardQueue): Fila de shards.
+            api (cartolafc.Api): API utilizada para obter os times. Se não for informada, uma nova é criada.
+            worker_id (str): Identificação do worker. Se não for informada, são utilizados o host e o pid.
+            lease (float): Tempo, em segundos, que um shard fica reservado a este worker.
+        """
+
+        self._queue = queue
+        self._api = api or Api()
+        self._worker_id = worker_id
+        self._lease = lease
+        self._tick: Optional[int] = None
+        self._parciais: Dict[int, Atleta] = {}
+
+    @property
+    def worker_id(self) -> str:
+        # Calculado sob demanda, pois o worker pode ser criado antes do fork dos processos.
+        return self._worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+    def _snapshot(self, tick: int) -> Dict[int, Atleta]:
+        if tick != self._tick:
+            self._parciais = ParciaisColumns(self._queue.snapshot(tick)).to_dict()
+            self._tick = tick
+        return self._parciais
+
+    def score(self, shard: Shard) -> ShardResult:
+        """Calcula o ranking parcial dos times de um shard."""
+
+        parciais = self._snapshot(shard.tick)
+        clubes = self._api.clubes()
+        ranking, missing = [], []
+        for time_id in shard.time_ids:
+            try:
+                time = self._api._time(time_id, clubes=clubes)
+            except CartolaFCOverloadError:
+                raise
+            except CartolaFCError as error:
+                logger.warning("Time %s não encontrado: %s", time_id, error)
+                missing.append(time_id)
+                continue
+            time = Api._calculate_parcial(time, parciais)
+            ranking.append(
+                RankingEntry(time_id, time.info.nome, time.pontos, time.jogados)
+            )
+        ranking.sort(key=_ordem)
+        return ShardResult(ranking, missing)
+
+    def run_once(self) -> bool:
+        """Processa um shard, se houver algum disponível, e retorna se algum foi processado."""
+
+        shard = self._queue.claim(self.worker_id, self._lease)
+        if shard is None:
+            return False
+        try:
+            resultado = self.score(shard)
+        except Exception as error:
+            logger.warning(
+                "Shard %s do tick %s falhou (tentativa %s): %r",
+                shard.shard_id,
+                shard.tick,
+                shard.attempts,
+                error,
+            )
+            self._queue.fail(shard, repr(error))
+        else:
+            self._queue.complete(shard, resultado)
+        return True
+
+    def run(
+        self,
+        idle_timeout: Optional[float] = 0.0,
+        poll_interval: float = 0.1,
+        stop: Optional[threading.Event] = None,
+    ) -> int:
+        """Processa shards até que a fila fique vazia por idle_timeout segundos (None para não parar por ociosidade), ou
+        até que stop seja sinalizado.
+
+        Returns:
+            A quantidade de shards processados.
+        """
+
+        processados = 0
+        ocioso_desde = time.monotonic()
+        while stop is None or not stop.is_set():
+            if self.run_once():
+                processados += 1
+                ocioso_desde = time.monotonic()
+            elif (
+                idle_timeout is not None
+                and time.monotonic() - ocioso_desde >= idle_timeout
+            ):
+                break
+            else:
+                time.sleep(poll_interval)
+        return processados
+
+
+class ScoringCoordinator(object):
+    """Coordena o cálculo das parciais de muitos times entre vários workers.
+
+    A cada tick, obtém as parciais uma única vez, publica o snapshot na fila junto com os times divididos em shards e
+    aguarda os workers, intercalando os rankings parciais de cada shard em um ranking global.
+
+    Exemplo de uso:
+        >>> coordinator = ScoringCoordinator(SQLiteShardQueue("parciais.sqlite3"), shard_size=200)
+        >>> ranking = coordinator.tick(time_ids)
+        >>> print(ranking[0].nome, ranking[0].pontos)
+    """
+
+    def __init__(
+        self,
+        queue: ShardQueue,
+        api: Optional[Api] = None,
+        shard_size: int = 500,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Args:
+            queue (cartolafc.distributed.ShardQueue): Fila de shards.
+            api (cartolafc.Api): API utilizada para obter as parciais. Se não for informada, uma nova é criada.
+            shard_size (int): Quantidade de times por shard.
+            timeout (float): Tempo máximo, em segundos, de espera pelos workers em cada tick. None para não limitar.
+            poll_interval (float): Intervalo, em segundos, entre as verificações do progresso dos workers.
+        """
+
+        self._queue = queue
+        self._api = api or Api()
+        self._shard_size = max(shard_size, 1)
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self.missing: List[int] = []
+
+    def tick(
+        self, time_ids: Sequence[int], parciais: Optional[Dict[int, Atleta]] = None
+    ) -> List[RankingEntry]:
+        """Calcula o ranking das parciais dos times.
+
+        Args:
+            time_ids (list): Ids dos times.
+            parciais (dict): Parciais a serem utilizadas. Se não forem informadas, são obtidas com
+                cartolafc.Api.parciais().
+
+        Returns:
+            Uma lista de cartolafc.distributed.RankingEntry, ordenada por pontos (decrescente). Os times que não
+            puderam ser obtidos ficam em ScoringCoordinator.missing.
+
+        Raises:
+            cartolafc.CartolaFCError: Se algum shard esgotou as tentativas, ou se o tempo máximo foi atingido.
+        """
+
+        parciais = self._api.parciais() if parciais is None else parciais
+        shards = [
+            time_ids[inicio : inicio + self._shard_size]
+            for inicio in range(0, len(time_ids), self._shard_size)
+        ]
+        tick = self._queue.publish(pack_parciais(parciais), shards)
+        try:
+            self._aguardar(tick)
+            resultados = self._queue.results(tick)
+        finally:
+            self._queue.purge(tick)
+
+        self.missing = sorted(
+            time_id for resultado in resultados for time_id in resultado.missing
+        )
+        return merge_rankings(resultado.ranking for resultado in resultados)
+
+    def _aguardar(self, tick: int) -> None:
+        inicio = time.monotonic()
+        while True:
+            pendentes, _, falhos = self._queue.progress(tick)
+            if falhos:
+                raise CartolaFCError(
+                    f"{falhos} shards do tick {tick} esgotaram as tentativas."
+                )
+            if not pendentes:
+                return
+            if self._timeout is not None and time.monotonic() - inicio > self._timeout:
+                raise CartolaFCError(
+                    f"Tempo esgotado aguardando {pendentes} shards do tick {tick}."
+                )
+            time.sleep(self._poll_interval)
@@ -1,7 +1,26 @@
+from typing import Optional
+
+
 class CartolaFCError(Exception):
-    """Classe base para os erros da API do Cartola FC"""
+    """Classe base para os erros da API do Cartola FC
 
-    pass
+    Os erros causados por uma resposta inválida trazem um diagnóstico resumido: o status HTTP, o Content-Type, o
+    tamanho e o início do corpo da resposta (nunca o corpo inteiro).
+    """
+
+    def __init__(
+        self,
+        *args,
+        status_code: Optional[int] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        preview: Optional[str] = None,
+    ) -> None:
+        super().__init__(*args)
+        self.status_code = status_code
+        self.content_type = content_type
+        self.size = size
+        self.preview = preview
 
 
 class CartolaFCOverloadError(CartolaFCError):
@@ -11,6 +30,26 @@ class CartolaFCOverloadError(CartolaFCError):
     pass
 
 
+class CartolaFCMalformedResponseError(CartolaFCOverloadError):
+    """Erro lançado quando a resposta não é um JSON válido (ex.: um corpo truncado). Como costuma ser transitório,
+    também é tratado como sobrecarga, e a requisição é repetida"""
+
+    pass
+
+
+class CartolaFCHTTPError(CartolaFCError):
+    """Erro lançado quando a API responde com um status HTTP de erro que não indica sobrecarga (ex.: 404)"""
+
+    pass
+
+
+class CartolaFCCircuitOpenError(CartolaFCOverloadError):
+    """Erro lançado quando o circuito de um endpoint está aberto, após sucessivas sobrecargas, e não há uma resposta
+    anterior que possa ser utilizada"""
+
+    pass
+
+
 class CartolaFCGameOverError(CartolaFCError):
     """Erro lançado quando o jogo termina e a biblioteca não consegue obter os dados requisitados"""
 
@@ -0,0 +1,322 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .errors import CartolaFCError
+from .models import Atleta
+from .scout import SCOUTS
+
+_ROWS = "rows.bin"
+_META = "meta.json"
+_VERSAO = 1
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise CartolaFCError(
+            "O histórico da temporada requer o pacote numpy: pip install Python-CartolaFC[numpy]"
+        )
+    return numpy
+
+
+def _dtype(np: Any) -> Any:
+    return np.dtype(
+        [
+            ("indice", "<i4"),
+            ("atleta_id", "<i4"),
+            ("clube_id", "<i4"),
+            ("posicao_id", "<i2"),
+            ("status_id", "<i2"),
+            ("pontos", "<f8"),
+            ("scout", "<i2", (len(SCOUTS),)),
+        ]
+    )
+
+
+class SeasonHistory(object):
+    """Arquivo em disco com as pontuações e scouts de cada atleta em cada rodada da temporada.
+
+    Cada rodada é acrescentada ao final de um arquivo de registros de tamanho fixo, lido com numpy.memmap: as consultas
+    acessam apenas as rodadas envolvidas, sem carregar a temporada inteira na memória nem criar instâncias de
+    cartolafc.Atleta. Os resultados são mapas onde a key é o id do atleta (ou do clube ou da posição).
+
+    Exemplo de uso:
+        >>> historico = SeasonHistory("historico-2023")
+        >>> historico.append(rodada, api.parciais())  # Ao final de cada rodada
+        >>> historico.mean(rodadas=range(30, 39))
+        >>> historico.rolling_mean(5)[37656]
+        >>> historico.mean_by_clube()
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Diretório do arquivo. É criado se não existir.
+        """
+
+        self._np = _numpy()
+        self._dtype = _dtype(self._np)
+        self._path = path
+        os.makedirs(path, exist_ok=True)
+        self._rows_path = os.path.join(path, _ROWS)
+        self._meta_path = os.path.join(path, _META)
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("versao") != _VERSAO or meta.get("scouts") != list(SCOUTS):
+                raise CartolaFCError(f"{path} não é um histórico compatível.")
+        else:
+            meta = {"atletas": [], "rodadas": {}}
+        # Intervalo [inicio, fim) dos registros de cada rodada no arquivo.
+        self._rodadas: Dict[int, Tuple[int, int]] = {
+            int(rodada): (inicio, fim)
+            for rodada, (inicio, fim) in meta["rodadas"].items()
+        }
+        self._atleta_ids: List[int] = meta["atletas"]
+        self._indices = {
+            atleta_id: indice for indice, atleta_id in enumerate(self._atleta_ids)
+        }
+        self._mapa: Any = None
+
+    @property
+    def rodadas(self) -> List[int]:
+        return sorted(self._rodadas)
+
+    @property
+    def atleta_ids(self) -> List[int]:
+        return list(self._atleta_ids)
+
+    def __len__(self) -> int:
+        return sum(fim - inicio for inicio, fim in self._rodadas.values())
+
+    def __contains__(self, rodada: object) -> bool:
+        return rodada in self._rodadas
+
+    def _salvar_meta(self) -> None:
+        meta = {
+            "versao": _VERSAO,
+            "scouts": list(SCOUTS),
+            "atletas": self._atleta_ids,
+            "rodadas": {
+                str(rodada): list(intervalo)
+                for rodada, intervalo in self._rodadas.items()
+            },
+        }
+        temporario = f"{self._meta_path}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(meta, f, separators=(",", ":"))
+        os.replace(temporario, self._meta_path)
+
+    def append(self, rodada: int, parciais: Mapping[int, Atleta]) -> int:
+        """Acrescenta as pontuações de uma rodada (ex.: o resultado de cartolafc.Api.parciais() ao final dela).
+
+        Returns:
+            A quantidade de atletas acrescentados.
+
+        Raises:
+            cartolafc.CartolaFCError: Se a rodada já estiver no histórico.
+        """
+
+        if rodada in self._rodadas:
+            raise CartolaFCError(f"A rodada {rodada} já está no histórico.")
+
+        atletas = list(parciais.values())
+        for atleta in atletas:
+            if atleta.id not in self._indices:
+                self._indices[atleta.id] = len(self._atleta_ids)
+                self._atleta_ids.append(atleta.id)
+
+        registros = self._np.zeros(len(atletas), dtype=self._dtype)
+        registros["indice"] = [self._indices[atleta.id] for atleta in atletas]
+        registros["atleta_id"] = [atleta.id for atleta in atletas]
+        registros["clube_id"] = [atleta.clube.id for atleta in atletas]
+        registros["posicao_id"] = [atleta.posicao.id for atleta in atletas]
+        registros["status_id"] = [
+            atleta.status.id if atleta.status else 0 for atleta in atletas
+        ]
+        registros["pontos"] = [atleta.pontos or 0.0 for atleta in atletas]
+        for linha, atleta in enumerate(atletas):
+            registros["scout"][linha] = atleta.scout.values_array
+
+        # Os registros são gravados antes dos metadados: bytes deixados no final por uma gravação interrompida não
+        # fazem parte de nenhuma rodada e são descartados aqui.
+        inicio = max((fim for _, fim in self._rodadas.values()), default=0)
+        with open(self._rows_path, "ab") as f:
+            f.truncate(inicio * self._dtype.itemsize)
+            f.write(registros.tobytes())
+        self._rodadas[rodada] = (inicio, inicio + len(registros))
+        self._salvar_meta()
+        self._mapa = None
+        return len(registros)
+
+    def _registros(self, rodadas: Optional[Iterable[int]] = None) -> Any:
+        np = self._np
+        if self._mapa is None:
+            total = max((fim for _, fim in self._rodadas.values()), default=0)
+            if not total:
+                return np.zeros(0, dtype=self._dtype)
+            self._mapa = np.memmap(
+                self._rows_path, dtype=self._dtype, mode="r", shape=(total,)
+            )
+        if rodadas is None:
+            intervalos = sorted(self._rodadas.values())
+        else:
+            intervalos = sorted(self._rodadas[r] for r in rodadas if r in self._rodadas)
+        # Rodadas vizinhas no arquivo (ex.: a temporada inteira) são lidas como uma única fatia, sem cópia.
+        contiguos: List[List[int]] = []
+        for inicio, fim in intervalos:
+            if contiguos and contiguos[-1][1] == inicio:
+                contiguos[-1][1] = fim
+            else:
+                contiguos.append([inicio, fim])
+        if not contiguos:
+            return np.zeros(0, dtype=self._dtype)
+        if len(contiguos) == 1:
+            inicio, fim = contiguos[0]
+            return self._mapa[inicio:fim]
+        return np.concatenate([self._mapa[inicio:fim] for inicio, fim in contiguos])
+
+    def _por_atleta(self, valores: Any, registros: Any) -> Dict[int, float]:
+        np = self._np
+        quantidade = len(self._atleta_ids)
+        jogos = np.bincount(registros["indice"], minlength=quantidade)
+        somas = np.bincount(registros["indice"], weights=valores, minlength=quantidade)
+        jogaram = np.flatnonzero(jogos)
+        return dict(
+            zip(
+                np.asarray(self._atleta_ids)[jogaram].tolist(),
+                (somas[jogaram] / jogos[jogaram]).tolist(),
+            )
+        )
+
+    def mean(
+        self,
+        rodadas: Optional[Iterable[int]] = None,
+        posicao_id: Optional[int] = None,
+        clube_id: Optional[int] = None,
+    ) -> Dict[int, float]:
+        """Média de pontos de cada atleta nas rodadas em que pontuou.
+
+        Args:
+            rodadas (list): Rodadas consideradas. Por padrão, todas as do histórico.
+            posicao_id (int): Apenas os atletas desta posição.
+            clube_id (int): Apenas as rodadas em que o atleta jogou por este clube.
+        """
+
+        registros = self._registros(rodadas)
+        if posicao_id is not None:
+            registros = registros[registros["posicao_id"] == posicao_id]
+        if clube_id is not None:
+            registros = registros[registros["clube_id"] == clube_id]
+        return self._por_atleta(registros["pontos"], registros)
+
+    def scout_totals(
+        self, rodadas: Optional[Iterable[int]] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """Soma dos scouts de cada atleta, apenas com os scouts diferentes de zero."""
+
+        np = self._np
+        registros = self._registros(rodadas)
+        quantidade = len(self._atleta_ids)
+        scouts = registros["scout"]
+        totais = np.stack(
+            [
+                np.bincount(
+                    registros["indice"], weights=scouts[:, coluna], minlength=quantidade
+                )
+                for coluna in range(len(SCOUTS))
+            ],
+            axis=1,
+        ).astype(np.int64)
+        jogaram = np.flatnonzero(np.bincount(registros["indice"], minlength=quantidade))
+        return {
+            self._atleta_ids[indice]: {
+                codigo: quantidade
+                for codigo, quantidade in zip(SCOUTS, totais[indice].tolist())
+                if quantidade
+            }
+            for indice in jogaram.tolist()
+        }
+
+    def _matriz(self, rodadas: List[int]) -> Any:
+        """Matriz (rodadas x atletas) com os pontos, e NaN onde o atleta não pontuou ou a rodada não está no
+        histórico."""
+
+        np = self._np
+        pontos = np.full((len(rodadas), len(self._atleta_ids)), np.nan)
+        for posicao, rodada in enumerate(rodadas):
+            registros = self._registros([rodada])
+            pontos[posicao, registros["indice"]] = registros["pontos"]
+        return pontos
+
+    def series(self, atleta_id: int) -> Dict[int, float]:
+        """Pontuação de um atleta em cada rodada em que pontuou."""
+
+        indice = self._indices.get(atleta_id)
+        if indice is None:
+            return {}
+        np = self._np
+        serie = {}
+        for rodada in self.rodadas:
+            registros = self._registros([rodada])
+            linhas = np.flatnonzero(registros["indice"] == indice)
+            if len(linhas):
+                serie[rodada] = float(registros["pontos"][linhas[0]])
+        return serie
+
+    def rolling_mean(self, window: int) -> Dict[int, List[Optional[float]]]:
+        """Média móvel de cada atleta: para cada rodada do histórico (em ordem), a média dos pontos nas rodadas
+        rodada - window + 1 até rodada, considerando apenas as rodadas em que ele pontuou (None se não pontuou em
+        nenhuma delas). Rodadas ausentes do histórico contam na janela como rodadas em que ninguém pontuou.
+        """
+
+        if window < 1:
+            raise CartolaFCError(
+                "A janela da média móvel deve ser de ao menos uma rodada."
+            )
+
+        np = self._np
+        rodadas = self.rodadas
+        if not rodadas:
+            return {atleta_id: [] for atleta_id in self._atleta_ids}
+        # As janelas são por número da rodada: a matriz tem uma linha para cada rodada entre a primeira e a última.
+        todas = list(range(rodadas[0], rodadas[-1] + 1))
+        pontos = self._matriz(todas)
+        jogou = ~np.isnan(pontos)
+        somas = np.cumsum(np.where(jogou, pontos, 0.0), axis=0)
+        jogos = np.cumsum(jogou, axis=0)
+        somas[window:] -= somas[:-window].copy()
+        jogos[window:] -= jogos[:-window].copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            medias = np.where(jogos > 0, somas / jogos, np.nan)
+        medias = medias[[rodada - rodadas[0] for rodada in rodadas]]
+        return {
+            atleta_id: [None if valor != valor else valor for valor in coluna]
+            for atleta_id, coluna in zip(self._atleta_ids, medias.T.tolist())
+        }
+
+    def _por_grupo(
+        self, campo: str, rodadas: Optional[Iterable[int]]
+    ) -> Dict[int, float]:
+        np = self._np
+        registros = self._registros(rodadas)
+        grupos, inverso = np.unique(registros[campo], return_inverse=True)
+        jogos = np.bincount(inverso, minlength=len(grupos))
+        somas = np.bincount(inverso, weights=registros["pontos"], minlength=len(grupos))
+        return dict(zip(grupos.tolist(), (somas / jogos).tolist()))
+
+    def mean_by_clube(
+        self, rodadas: Optional[Iterable[int]] = None
+    ) -> Dict[int, float]:
+        """Média de pontos por atleta pontuado, agrupada pelo id do clube."""
+
+        return self._por_grupo("clube_id", rodadas)
+
+    def mean_by_posicao(
+        self, rodadas: Optional[Iterable[int]] = None
+    ) -> Dict[int, float]:
+        """Média de pontos por atleta pontuado, agrupada pelo id da posição."""
+
+        return self._por_grupo("posicao_id", rodadas)
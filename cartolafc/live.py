@@ -0,0 +1,353 @@
+import asyncio
+import json
+import logging
+import re
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from .api import Api
+from .errors import CartolaFCError
+from .models import Atleta, Time
+
+logger = logging.getLogger(__name__)
+
+Roster = namedtuple("Roster", ["time_id", "nome", "atletas", "capitao_id"])
+"""Escalação de um time acompanhado: os ids dos atletas e do capitão."""
+
+_STREAM = re.compile(r"^/times/(\d+)/stream/?(?:\?.*)?$")
+_CABECALHOS_SSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: keep-alive\r\n"
+    b"\r\n"
+)
+_PING = b": ping\n\n"
+
+
+def _resposta(status: str, mensagem: str) -> bytes:
+    corpo = json.dumps({"mensagem": mensagem}).encode("utf-8")
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(corpo)}\r\nConnection: close\r\n\r\n"
+    ).encode("ascii") + corpo
+
+
+class _Cliente(object):
+    def __init__(self, tamanho: int) -> None:
+        self.fila: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=tamanho)
+
+
+class LiveScoreServer(object):
+    """Servidor de Server-Sent Events com as parciais ao vivo de cada time, para muitos clientes simultâneos.
+
+    As parciais são obtidas uma única vez a cada poll_interval, independentemente da quantidade de clientes, e a
+    escalação de cada time é obtida apenas na primeira inscrição. Um índice atleta -> times permite recalcular somente
+    os times com algum atleta cuja pontuação mudou. Cada atualização é serializada uma única vez e o mesmo payload é
+    enfileirado para todos os clientes do time.
+
+    As filas dos clientes são limitadas: se um cliente lento acumular queue_size eventos, os mais antigos são
+    descartados (apenas a pontuação mais recente importa), e um cliente que não consome os dados enviados em
+    write_timeout segundos é desconectado.
+
+    Cada cliente acompanha um time em GET /times/{time_id}/stream, recebendo eventos "score" com o JSON
+    {"time_id", "nome", "pontos", "jogados"}.
+
+    Exemplo de uso:
+        >>> server = LiveScoreServer(cartolafc.Api(), port=8080, poll_interval=10)
+        >>> server.run()
+    """
+
+    def __init__(
+        self,
+        api: Optional[Api] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        poll_interval: float = 5.0,
+        queue_size: int = 8,
+        keepalive: float = 15.0,
+        write_timeout: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            api (cartolafc.Api): API utilizada para obter as parciais e as escalações. Se não for informada, uma nova
+                é criada.
+            host (str): Endereço do servidor.
+            port (int): Porta do servidor. 0 para escolher uma porta livre.
+            poll_interval (float): Intervalo, em segundos, entre as consultas às parciais. 0 para não consultar
+                automaticamente (ver poll_once()).
+            queue_size (int): Quantidade máxima de eventos pendentes por cliente.
+            keepalive (float): Intervalo, em segundos, entre os comentários enviados a clientes sem atualizações.
+            write_timeout (float): Tempo máximo, em segundos, para um cliente consumir os dados enviados.
+        """
+
+        self._api = api or Api()
+        self._host = host
+        self._port = port
+        self._poll_interval = poll_interval
+        self._queue_size = max(queue_size, 1)
+        self._keepalive = keepalive
+        self._write_timeout = write_timeout
+
+        self._parciais: Dict[int, Atleta] = {}
+        self._rosters: Dict[int, Roster] = {}
+        self._indice: Dict[int, Set[int]] = defaultdict(set)
+        self._pontuacoes: Dict[int, Tuple[float, int]] = {}
+        self._payloads: Dict[int, bytes] = {}
+        self._clientes: Dict[int, Set[_Cliente]] = defaultdict(set)
+        self._carregando: Dict[int, "asyncio.Future[Time]"] = {}
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._conexoes: Set["asyncio.Task[None]"] = set()
+        self._poller: Optional["asyncio.Task[None]"] = None
+        self.dropped = 0
+        """Quantidade de eventos descartados por clientes lentos."""
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise CartolaFCError("O servidor não foi iniciado.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(clientes) for clientes in self._clientes.values())
+
+    @property
+    def teams(self) -> int:
+        return len(self._rosters)
+
+    async def start(self) -> "LiveScoreServer":
+        self._server = await asyncio.start_server(self._atender, self._host, self._port)
+        if self._poll_interval > 0:
+            self._poller = asyncio.ensure_future(self._consultar())
+        return self
+
+    async def stop(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+        if self._server is not None:
+            self._server.close()
+            for conexao in list(self._conexoes):
+                conexao.cancel()
+            await asyncio.gather(*self._conexoes, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LiveScoreServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def run(self) -> None:
+        """Executa o servidor até que o processo seja interrompido."""
+
+        async def executar() -> None:
+            async with self:
+                logger.info("Servidor de parciais ao vivo em %s", self.url)
+                await asyncio.Event().wait()
+
+        asyncio.run(executar())
+
+    async def _consultar(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                # Inclusive os erros de rede, que a cartolafc.Api não converte em cartolafc.CartolaFCError: a próxima
+                # consulta é tentada normalmente.
+                logger.warning("Não foi possível obter as parciais: %r", error)
+            await asyncio.sleep(self._poll_interval)
+
+    async def poll_once(self) -> int:
+        """Obtém as parciais, recalcula os times afetados e publica as pontuações que mudaram.
+
+        Returns:
+            A quantidade de times cuja pontuação foi publicada.
+        """
+
+        loop = asyncio.get_running_loop()
+        parciais = await loop.run_in_executor(None, self._api.parciais)
+        anteriores, self._parciais = self._parciais, parciais
+
+        alterados = {
+            atleta_id
+            for atleta_id, atleta in parciais.items()
+            if atleta_id not in anteriores
+            or anteriores[atleta_id].pontos != atleta.pontos
+        }
+        alterados.update(
+            atleta_id for atleta_id in anteriores if atleta_id not in parciais
+        )
+        times = {
+            time_id
+            for atleta_id in alterados
+            for time_id in self._indice.get(atleta_id, ())
+        }
+        return sum(self._atualizar(time_id) for time_id in times)
+
+    def _pontuar(self, roster: Roster) -> Tuple[float, int]:
+        # Mesmo cálculo de cartolafc.Api._calculate_parcial, sem construir os modelos.
+        pontos, jogados = 0.0, 0
+        for atleta_id in roster.atletas:
+            atleta = self._parciais.get(atleta_id)
+            if atleta is not None:
+                pontos += atleta.pontos * (2 if atleta_id == roster.capitao_id else 1)
+                jogados += 1
+        return pontos, jogados
+
+    def _atualizar(self, time_id: int) -> bool:
+        roster = self._rosters[time_id]
+        pontuacao = self._pontuar(roster)
+        if self._pontuacoes.get(time_id) == pontuacao:
+            return False
+        self._pontuacoes[time_id] = pontuacao
+        evento = json.dumps(
+            dict(
+                time_id=time_id,
+                nome=roster.nome,
+                pontos=round(pontuacao[0], 2),
+                jogados=pontuacao[1],
+            ),
+            separators=(",", ":"),
+        )
+        payload = f"event: score\ndata: {evento}\n\n".encode("utf-8")
+        self._payloads[time_id] = payload
+        self._publicar(self._clientes.get(time_id, ()), payload)
+        return True
+
+    def _publicar(self, clientes: Iterable[_Cliente], payload: bytes) -> None:
+        for cliente in clientes:
+            if cliente.fila.full():
+                cliente.fila.get_nowait()
+                self.dropped += 1
+            cliente.fila.put_nowait(payload)
+
+    async def _roster(self, time_id: int) -> Roster:
+        roster = self._rosters.get(time_id)
+        if roster is not None:
+            return roster
+        # Inscrições simultâneas no mesmo time aguardam uma única requisição.
+        carregando = self._carregando.get(time_id)
+        if carregando is None:
+            loop = asyncio.get_running_loop()
+            carregando = loop.run_in_executor(None, self._api.time, time_id)
+            self._carregando[time_id] = carregando
+        try:
+            time = await asyncio.shield(carregando)
+        finally:
+            self._carregando.pop(time_id, None)
+
+        roster = self._rosters.get(time_id)
+        if roster is None:
+            capitao = next(
+                (atleta.id for atleta in time.atletas if atleta.is_capitao), None
+            )
+            roster = Roster(
+                time_id,
+                time.info.nome,
+                tuple(atleta.id for atleta in time.atletas),
+                capitao,
+            )
+            self._rosters[time_id] = roster
+            for atleta_id in roster.atletas:
+                self._indice[atleta_id].add(time_id)
+            self._atualizar(time_id)
+        return roster
+
+    async def subscribe(self, time_id: int) -> _Cliente:
+        """Inscreve um novo cliente em um time, já com a pontuação atual na fila."""
+
+        await self._roster(time_id)
+        cliente = _Cliente(self._queue_size)
+        self._clientes[time_id].add(cliente)
+        self._publicar([cliente], self._payloads[time_id])
+        return cliente
+
+    def unsubscribe(self, time_id: int, cliente: _Cliente) -> None:
+        """Remove o cliente e, se ele for o último do time, deixa de acompanhar o time."""
+
+        clientes = self._clientes.get(time_id)
+        if clientes is None:
+            return
+        clientes.discard(cliente)
+        if clientes:
+            return
+        del self._clientes[time_id]
+        roster = self._rosters.pop(time_id, None)
+        self._pontuacoes.pop(time_id, None)
+        self._payloads.pop(time_id, None)
+        for atleta_id in roster.atletas if roster else ():
+            times = self._indice.get(atleta_id)
+            if times is not None:
+                times.discard(time_id)
+                if not times:
+                    del self._indice[atleta_id]
+
+    async def _atender(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conexao = asyncio.current_task()
+        if conexao is not None:
+            self._conexoes.add(conexao)
+        try:
+            requisicao = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), self._write_timeout
+            )
+            metodo, caminho = requisicao.decode("latin-1").split(" ", 2)[:2]
+            correspondencia = _STREAM.match(caminho)
+            if metodo != "GET" or correspondencia is None:
+                writer.write(_resposta("404 Not Found", "Recurso não encontrado"))
+                return
+            time_id = int(correspondencia.group(1))
+            try:
+                cliente = await self.subscribe(time_id)
+            except CartolaFCError as error:
+                writer.write(_resposta("404 Not Found", str(error)))
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("Não foi possível obter o time %s: %r", time_id, error)
+                writer.write(
+                    _resposta("502 Bad Gateway", "Não foi possível obter o time")
+                )
+                return
+
+            try:
+                writer.write(_CABECALHOS_SSE)
+                await self._transmitir(cliente, writer)
+            finally:
+                self.unsubscribe(time_id, cliente)
+        except (
+            ConnectionError,
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ):
+            pass
+        except ValueError:
+            writer.write(_resposta("400 Bad Request", "Requisição inválida"))
+        except asyncio.CancelledError:
+            # Conexão encerrada por stop().
+            pass
+        finally:
+            self._conexoes.discard(conexao)
+            writer.close()
+
+    async def _transmitir(
+        self, cliente: _Cliente, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            try:
+                payload = await asyncio.wait_for(cliente.fila.get(), self._keepalive)
+            except asyncio.TimeoutError:
+                payload = _PING
+            writer.write(payload)
+            await asyncio.wait_for(writer.drain(), self._write_timeout)
@@ -0,0 +1,278 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .errors import CartolaFCError
+from .models import Atleta
+
+CAMPOS = ("pontos", "preco", "media")
+"""Campos numéricos de cartolafc.Atleta que podem ser filtrados por intervalo e ordenados."""
+
+Ids = Union[int, Iterable[int]]
+
+# Abaixo dessa fração do mercado, ordenar os candidatos é mais barato que percorrer a ordem pré-calculada.
+_FRACAO_ORDENAR = 0.125
+
+
+def _conjunto(ids: Ids) -> FrozenSet[int]:
+    return frozenset((ids,) if isinstance(ids, int) else ids)
+
+
+def _fingerprint(atletas: Sequence[Atleta]) -> Tuple[tuple, ...]:
+    # Os próprios valores, e não um hash deles, para que uma colisão nunca faça refresh() reutilizar um índice antigo.
+    return tuple(
+        (
+            atleta.id,
+            atleta.apelido,
+            atleta.pontos,
+            atleta.preco,
+            atleta.media,
+            atleta.posicao.id,
+            atleta.status.id if atleta.status else None,
+            atleta.clube.id,
+            atleta.scout.to_bytes(),
+            tuple(sorted(atleta.scout.extras.items())),
+        )
+        for atleta in atletas
+    )
+
+
+class _Coluna(object):
+    """Um campo numérico: os valores em ordem crescente, com as posições dos atletas correspondentes, para os
+    intervalos, e as posições em ordem decrescente, para as ordenações. Atletas sem o valor ficam ao final.
+    """
+
+    def __init__(self, atletas: Sequence[Atleta], campo: str) -> None:
+        presentes = [
+            (getattr(atleta, campo), atleta.id, posicao)
+            for posicao, atleta in enumerate(atletas)
+            if getattr(atleta, campo) is not None
+        ]
+        ausentes = [
+            posicao
+            for posicao, atleta in enumerate(atletas)
+            if getattr(atleta, campo) is None
+        ]
+        presentes.sort()
+        self.valores = [valor for valor, _, _ in presentes]
+        self.crescente = [posicao for _, _, posicao in presentes] + ausentes
+        presentes.sort(key=lambda item: (-item[0], item[1]))
+        self.decrescente = [posicao for _, _, posicao in presentes] + ausentes
+        self.chaves = {
+            posicao: (valor, atleta_id) for valor, atleta_id, posicao in presentes
+        }
+
+    def intervalo(
+        self, minimo: Optional[float], maximo: Optional[float]
+    ) -> FrozenSet[int]:
+        inicio = 0 if minimo is None else bisect_left(self.valores, minimo)
+        fim = (
+            len(self.valores) if maximo is None else bisect_right(self.valores, maximo)
+        )
+        return frozenset(self.crescente[inicio:fim])
+
+
+class MarketIndex(object):
+    """Índice dos atletas do mercado, construído uma única vez por snapshot de cartolafc.Api.mercado_atletas().
+
+    Os atletas são agrupados pela posição, pelo clube e pelo status, e cada campo numérico (pontos, preço e média) é
+    mantido ordenado, de forma que os filtros se tornam interseções de conjuntos e buscas binárias, e o top-N percorre
+    uma ordem já calculada em vez de ordenar todo o mercado a cada consulta.
+
+    O índice não é alterado após a construção e pode ser compartilhado entre threads. Com refresh(), ele é reutilizado
+    enquanto o mercado não mudar.
+
+    Exemplo de uso:
+        >>> index = MarketIndex(api.mercado_atletas())
+        >>> index.query().where(posicao=5, status=7).between("preco", maximo=10).top(5, "media")
+        >>> index = index.refresh(api.mercado_atletas())
+    """
+
+    def __init__(self, atletas: Iterable[Atleta]) -> None:
+        """
+        Args:
+            atletas (list): Atletas do mercado, como retornados por cartolafc.Api.mercado_atletas().
+        """
+
+        self.atletas: Tuple[Atleta, ...] = tuple(atletas)
+        self.fingerprint = _fingerprint(self.atletas)
+        self._categorias: Dict[str, Dict[int, FrozenSet[int]]] = {}
+        for nome, chave in (
+            ("posicao", lambda atleta: atleta.posicao.id),
+            ("clube", lambda atleta: atleta.clube.id),
+            ("status", lambda atleta: atleta.status.id if atleta.status else None),
+        ):
+            grupos: Dict[int, List[int]] = {}
+            for posicao, atleta in enumerate(self.atletas):
+                grupos.setdefault(chave(atleta), []).append(posicao)
+            self._categorias[nome] = {
+                valor: frozenset(posicoes) for valor, posicoes in grupos.items()
+            }
+        self._colunas = {campo: _Coluna(self.atletas, campo) for campo in CAMPOS}
+
+    def __len__(self) -> int:
+        return len(self.atletas)
+
+    def refresh(self, atletas: Iterable[Atleta]) -> "MarketIndex":
+        """Retorna este índice se os atletas forem os mesmos do snapshot indexado (comparando os campos
+        indexados, o apelido e o scout de cada atleta), ou um novo índice caso contrário.
+        """
+
+        atletas = tuple(atletas)
+        if (
+            len(atletas) == len(self.atletas)
+            and _fingerprint(atletas) == self.fingerprint
+        ):
+            return self
+        return MarketIndex(atletas)
+
+    def query(self) -> "MarketQuery":
+        """Uma consulta sobre todos os atletas do índice."""
+
+        return MarketQuery(self, None)
+
+    def _coluna(self, campo: str) -> _Coluna:
+        try:
+            return self._colunas[campo]
+        except KeyError:
+            raise CartolaFCError(
+                f"Campo inválido: {campo}. Os campos válidos são {', '.join(CAMPOS)}."
+            )
+
+
+class MarketQuery(object):
+    """Consulta imutável sobre um cartolafc.market.MarketIndex. Cada filtro retorna uma nova consulta, então uma
+    consulta parcial (ex.: apenas os atacantes) pode ser reutilizada como base de outras.
+    """
+
+    def __init__(
+        self, index: MarketIndex, candidatos: Optional[FrozenSet[int]]
+    ) -> None:
+        self._index = index
+        # None representa todos os atletas, sem precisar materializar o conjunto.
+        self._candidatos = candidatos
+
+    def _filtrar(self, posicoes: FrozenSet[int]) -> "MarketQuery":
+        if self._candidatos is None:
+            return MarketQuery(self._index, posicoes)
+        menor, maior = sorted((self._candidatos, posicoes), key=len)
+        return MarketQuery(self._index, menor & maior)
+
+    def where(
+        self,
+        posicao: Optional[Ids] = None,
+        clube: Optional[Ids] = None,
+        status: Optional[Ids] = None,
+    ) -> "MarketQuery":
+        """Mantém os atletas de uma das posições, de um dos clubes e com um dos status informados.
+
+        Args:
+            posicao (int | list): Id, ou ids, das posições (ex.: 5 para atacantes).
+            clube (int | list): Id, ou ids, dos clubes.
+            status (int | list): Id, ou ids, dos status (ex.: 7 para os prováveis).
+        """
+
+        consulta = self
+        for nome, ids in (("posicao", posicao), ("clube", clube), ("status", status)):
+            if ids is None:
+                continue
+            grupos = self._index._categorias[nome]
+            posicoes = frozenset().union(
+                *(grupos.get(valor, frozenset()) for valor in _conjunto(ids))
+            )
+            consulta = consulta._filtrar(posicoes)
+        return consulta
+
+    def between(
+        self, campo: str, minimo: Optional[float] = None, maximo: Optional[float] = None
+    ) -> "MarketQuery":
+        """Mantém os atletas com o campo entre minimo e maximo (inclusive). Atletas sem o valor são descartados.
+
+        Args:
+            campo (str): Um dos campos de cartolafc.market.CAMPOS.
+            minimo (float): Valor mínimo. Se não for informado, não há limite inferior.
+            maximo (float): Valor máximo. Se não for informado, não há limite superior.
+        """
+
+        return self._filtrar(self._index._coluna(campo).intervalo(minimo, maximo))
+
+    def count(self) -> int:
+        if self._candidatos is None:
+            return len(self._index)
+        return len(self._candidatos)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[Atleta]:
+        return iter(self.all())
+
+    def all(self, campo: Optional[str] = None, descending: bool = True) -> List[Atleta]:
+        """Retorna os atletas da consulta, ordenados pelo campo informado ou, se não for informado, na ordem do
+        mercado."""
+
+        if campo is None:
+            atletas = self._index.atletas
+            if self._candidatos is None:
+                return list(atletas)
+            return [atletas[posicao] for posicao in sorted(self._candidatos)]
+        return self.top(self.count(), campo, descending)
+
+    def top(
+        self, n: int, campo: str = "media", descending: bool = True
+    ) -> List[Atleta]:
+        """Retorna os n atletas da consulta com os maiores (ou menores) valores do campo, desempatados pelo id.
+        Atletas sem o valor ficam ao final.
+
+        Args:
+            n (int): Quantidade de atletas.
+            campo (str): Um dos campos de cartolafc.market.CAMPOS.
+            descending (bool): Se True, os maiores valores primeiro.
+        """
+
+        coluna = self._index._coluna(campo)
+        atletas = self._index.atletas
+        ordem = coluna.decrescente if descending else coluna.crescente
+        candidatos = self._candidatos
+        if n <= 0:
+            return []
+        if candidatos is None:
+            return [atletas[posicao] for posicao in ordem[:n]]
+
+        if len(candidatos) < _FRACAO_ORDENAR * len(atletas):
+            # Poucos candidatos: seleciona diretamente entre eles.
+            sinal = -1 if descending else 1
+            presentes = [posicao for posicao in candidatos if posicao in coluna.chaves]
+            escolhidos = heapq.nsmallest(
+                n,
+                presentes,
+                key=lambda posicao: (
+                    sinal * coluna.chaves[posicao][0],
+                    coluna.chaves[posicao][1],
+                ),
+            )
+            if len(escolhidos) < n:
+                escolhidos += [
+                    posicao
+                    for posicao in ordem[len(coluna.valores) :]
+                    if posicao in candidatos
+                ][: n - len(escolhidos)]
+            return [atletas[posicao] for posicao in escolhidos]
+
+        resultado = []
+        for posicao in ordem:
+            if posicao in candidatos:
+                resultado.append(atletas[posicao])
+                if len(resultado) == n:
+                    break
+        return resultado
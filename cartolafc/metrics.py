@@ -0,0 +1,221 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Hooks(object):
+    """Interface de instrumentação da cartolafc.Api.
+
+    Todos os métodos são opcionais: basta sobrescrever os eventos de interesse. O endpoint é o nome do método da
+    cartolafc.Api que originou o evento (ex.: "parciais"), e as durações são dadas em segundos.
+
+    Exemplo de uso:
+        >>> class LogHooks(Hooks):
+        ...     def on_request_end(self, endpoint, elapsed, nbytes, error=None):
+        ...         print(endpoint, elapsed, nbytes)
+        >>> api = cartolafc.Api(hooks=LogHooks())
+    """
+
+    def on_request_start(self, endpoint: str, url: str) -> None:
+        pass
+
+    def on_request_end(
+        self,
+        endpoint: str,
+        elapsed: float,
+        nbytes: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        pass
+
+    def on_retry(self, endpoint: str, attempt: int, error: BaseException) -> None:
+        pass
+
+    def on_cache_hit(self, endpoint: str) -> None:
+        pass
+
+    def on_decode(self, endpoint: str, elapsed: float) -> None:
+        pass
+
+    def on_build(self, endpoint: str, elapsed: float) -> None:
+        pass
+
+    def on_circuit_state(self, endpoint: str, state: str) -> None:
+        """Chamado quando o circuito de um endpoint muda de estado ("closed", "open" ou "half_open")."""
+
+        pass
+
+    def on_stale(self, endpoint: str) -> None:
+        """Chamado quando uma resposta antiga é utilizada porque o circuito do endpoint está aberto."""
+
+        pass
+
+
+class Histogram(object):
+    """Histograma de durações com buckets fixos, no formato utilizado pelo Prometheus"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        limites = [str(limite) for limite in self.buckets] + ["+Inf"]
+        acumulado = 0
+        resultado = []
+        for limite, quantidade in zip(limites, self.counts):
+            acumulado += quantidade
+            resultado.append((limite, acumulado))
+        return resultado
+
+    def quantile(self, q: float) -> float:
+        """Estima o quantil q (0 a 1) pelo limite superior do bucket onde ele se encontra.
+
+        Returns:
+            O limite superior do bucket, ou infinito se o quantil estiver acima do maior bucket.
+        """
+
+        if not self.count:
+            return 0.0
+        alvo = q * self.count
+        acumulado = 0
+        for limite, quantidade in zip(self.buckets, self.counts):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return limite
+        return float("inf")
+
+
+class MetricsCollector(Hooks):
+    """Coletor de métricas em memória, com contadores e histogramas de latência por endpoint.
+
+    Exemplo de uso:
+        >>> metrics = MetricsCollector()
+        >>> api = cartolafc.Api(hooks=metrics)
+        >>> api.time_parcial(471815)
+        >>> metrics.histograms["request"]["parciais"].quantile(0.99)
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self.histograms: Dict[str, Dict[str, Histogram]] = defaultdict(
+            lambda: defaultdict(lambda: Histogram(self._buckets))
+        )
+
+    def on_request_start(self, endpoint: str, url: str) -> None:
+        with self._lock:
+            self.counters["requests"][endpoint] += 1
+
+    def on_request_end(
+        self,
+        endpoint: str,
+        elapsed: float,
+        nbytes: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            self.histograms["request"][endpoint].observe(elapsed)
+            self.counters["response_bytes"][endpoint] += nbytes
+            if error is not None:
+                self.counters["errors"][endpoint] += 1
+
+    def on_retry(self, endpoint: str, attempt: int, error: BaseException) -> None:
+        with self._lock:
+            self.counters["retries"][endpoint] += 1
+
+    def on_cache_hit(self, endpoint: str) -> None:
+        with self._lock:
+            self.counters["cache_hits"][endpoint] += 1
+
+    def on_decode(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            self.histograms["decode"][endpoint].observe(elapsed)
+
+    def on_build(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            self.histograms["build"][endpoint].observe(elapsed)
+
+    def on_circuit_state(self, endpoint: str, state: str) -> None:
+        if state == "open":
+            with self._lock:
+                self.counters["circuit_opens"][endpoint] += 1
+
+    def on_stale(self, endpoint: str) -> None:
+        with self._lock:
+            self.counters["stale_responses"][endpoint] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Cópia consistente dos contadores, que pode ser lida enquanto outras threads continuam registrando."""
+
+        with self._lock:
+            return {
+                nome: dict(por_endpoint) for nome, por_endpoint in self.counters.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_prometheus(self, prefix: str = "cartolafc") -> str:
+        """Exporta as métricas coletadas no formato texto do Prometheus.
+
+        Args:
+            prefix (str): Prefixo utilizado no nome de todas as métricas.
+
+        Returns:
+            O texto de exposição, pronto para ser servido em um endpoint /metrics.
+        """
+
+        linhas: List[str] = []
+        with self._lock:
+            for nome, por_endpoint in sorted(self.counters.items()):
+                metrica = f"{prefix}_{nome}_total"
+                linhas.append(f"# TYPE {metrica} counter")
+                for endpoint, valor in sorted(por_endpoint.items()):
+                    linhas.append(f'{metrica}{{endpoint="{endpoint}"}} {valor}')
+
+            for nome, por_endpoint in sorted(self.histograms.items()):
+                metrica = f"{prefix}_{nome}_duration_seconds"
+                linhas.append(f"# TYPE {metrica} histogram")
+                for endpoint, histograma in sorted(por_endpoint.items()):
+                    for limite, acumulado in histograma.cumulative():
+                        linhas.append(
+                            f'{metrica}_bucket{{endpoint="{endpoint}",le="{limite}"}} {acumulado}'
+                        )
+                    linhas.append(
+                        f'{metrica}_sum{{endpoint="{endpoint}"}} {histograma.sum}'
+                    )
+                    linhas.append(
+                        f'{metrica}_count{{endpoint="{endpoint}"}} {histograma.count}'
+                    )
+        return "\n".join(linhas) + "\n"
@@ -1,8 +1,9 @@
 import json
 from collections import namedtuple
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
+from .scout import Scout
 from .util import json_default
 
 Posicao = namedtuple("Posicao", ["id", "nome", "abreviacao"])
@@ -36,14 +37,70 @@ _mercado_status = {
 T = TypeVar("T", bound="BaseModel")
 
 
+def _plain(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Scout):
+        return dict(value)
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _coerce(cls: Type[T], value: Any) -> Optional[T]:
+    if value is None or isinstance(value, cls):
+        return value
+    return cls.from_serialized(value)
+
+
+def _coerce_list(cls: Type[T], values: Optional[Sequence[Any]]) -> Optional[List[T]]:
+    if values is None:
+        return None
+    return [_coerce(cls, value) for value in values]
+
+
+def _coerce_datetime(value: Union[str, datetime]) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
 class BaseModel(object):
+    _fields: Tuple[str, ...] = ()
+
     def __repr__(self) -> str:
         return json.dumps(self, default=json_default)
 
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return self._from_values, (self._values(),)
+
     @classmethod
     def from_dict(cls: Type[T], *args: Tuple[Any], **kwargs: Dict[str, Any]) -> T:
         raise NotImplementedError
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o modelo em um dicionário com tipos simples (datas no formato ISO 8601), que pode ser convertido
+        de volta com from_serialized."""
+
+        return {
+            field: _plain(value) for field, value in zip(self._fields, self._values())
+        }
+
+    @classmethod
+    def from_serialized(cls: Type[T], data: Union[Dict[str, Any], Sequence[Any]]) -> T:
+        """Reconstrói o modelo a partir do resultado de to_dict, ou da lista de valores na ordem de _fields."""
+
+        if isinstance(data, dict):
+            return cls._from_values([data.get(field) for field in cls._fields])
+        return cls._from_values(data)
+
+    def _values(self) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    @classmethod
+    def _from_values(cls: Type[T], values: Sequence[Any]) -> T:
+        raise NotImplementedError
+
 
 class TimeInfo(BaseModel):
     """Time Info"""
@@ -78,6 +135,22 @@ class TimeInfo(BaseModel):
             pontos,
         )
 
+    _fields = ("id", "nome", "nome_cartola", "slug", "assinante", "pontos")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.id,
+            self.nome,
+            self.nome_cartola,
+            self.slug,
+            self.assinante,
+            self.pontos,
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "TimeInfo":
+        return cls(*values)
+
 
 class Clube(BaseModel):
     """Representa um dos 20 clubes presentes no campeonato, e possui informações como o nome e a abreviação"""
@@ -91,6 +164,15 @@ class Clube(BaseModel):
     def from_dict(cls, data: dict) -> "Clube":
         return cls(data["id"], data["nome"], data["abreviacao"])
 
+    _fields = ("id", "nome", "abreviacao")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.id, self.nome, self.abreviacao
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Clube":
+        return cls(*values)
+
 
 class Atleta(BaseModel):
     """Representa um atleta (jogador ou técnico), e possui informações como o apelido, clube e pontuação obtida"""
@@ -100,20 +182,24 @@ class Atleta(BaseModel):
         atleta_id: int,
         apelido: str,
         pontos: float,
-        scout: Dict[str, int],
+        scout: Union[Scout, Dict[str, int]],
         posicao_id: int,
         clube: Clube,
         status_id: Optional[int] = None,
         is_capitao: Optional[bool] = None,
+        preco: Optional[float] = None,
+        media: Optional[float] = None,
     ) -> None:
         self.id = atleta_id
         self.apelido = apelido
         self.pontos = pontos
-        self.scout = scout
+        self.scout = scout if isinstance(scout, Scout) else Scout(scout)
         self.posicao = _posicoes[posicao_id]
         self.clube = clube
         self.status = _atleta_status[status_id] if status_id else None
         self.is_capitao = is_capitao
+        self.preco = preco
+        self.media = media
 
     @classmethod
     def from_dict(
@@ -138,6 +224,62 @@ class Atleta(BaseModel):
             clube,
             data.get("status_id", None),
             is_capitao,
+            data.get("preco_num", None),
+            data.get("media_num", None),
+        )
+
+    _fields = (
+        "id",
+        "apelido",
+        "pontos",
+        "scout",
+        "posicao_id",
+        "clube",
+        "status_id",
+        "is_capitao",
+        "preco",
+        "media",
+    )
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.id,
+            self.apelido,
+            self.pontos,
+            self.scout,
+            self.posicao.id,
+            self.clube,
+            self.status.id if self.status else None,
+            self.is_capitao,
+            self.preco,
+            self.media,
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Atleta":
+        (
+            atleta_id,
+            apelido,
+            pontos,
+            scout,
+            posicao_id,
+            clube,
+            status_id,
+            capitao,
+            preco,
+            media,
+        ) = values
+        return cls(
+            atleta_id,
+            apelido,
+            pontos,
+            scout,
+            posicao_id,
+            _coerce(Clube, clube),
+            status_id,
+            capitao,
+            preco,
+            media,
         )
 
 
@@ -179,6 +321,30 @@ class AtletaDestaque(BaseModel):
             data["escalacoes"],
         )
 
+    _fields = ("id", "apelido", "posicao_id", "preco", "clube", "escalacoes")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.id,
+            self.apelido,
+            self.posicao.id if self.posicao else None,
+            self.preco,
+            self.clube,
+            self.escalacoes,
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "AtletaDestaque":
+        atleta_id, apelido, posicao_id, preco, clube, escalacoes = values
+        return cls(
+            atleta_id,
+            apelido,
+            _posicoes.get(posicao_id),
+            preco,
+            _coerce(Clube, clube),
+            escalacoes,
+        )
+
 
 class DestaqueRodada(BaseModel):
     """Destaque Rodada"""
@@ -195,6 +361,16 @@ class DestaqueRodada(BaseModel):
         mito_rodada = TimeInfo.from_dict(data["mito_rodada"])
         return cls(data["media_cartoletas"], data["media_pontos"], mito_rodada)
 
+    _fields = ("media_cartoletas", "media_pontos", "mito_rodada")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.media_cartoletas, self.media_pontos, self.mito_rodada
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "DestaqueRodada":
+        media_cartoletas, media_pontos, mito_rodada = values
+        return cls(media_cartoletas, media_pontos, _coerce(TimeInfo, mito_rodada))
+
 
 class Liga(BaseModel):
     """Liga"""
@@ -224,6 +400,16 @@ class Liga(BaseModel):
             times,
         )
 
+    _fields = ("id", "nome", "slug", "descricao", "times")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.id, self.nome, self.slug, self.descricao, self.times
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Liga":
+        liga_id, nome, slug, descricao, times = values
+        return cls(liga_id, nome, slug, descricao, _coerce_list(TimeInfo, times))
+
 
 class Patrocinador(BaseModel):
     """Patrocinador"""
@@ -237,6 +423,15 @@ class Patrocinador(BaseModel):
     def from_dict(cls, data: dict) -> "Patrocinador":
         return cls(data["liga_id"], data["nome"], data["url_link"])
 
+    _fields = ("id", "nome", "url_link")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return self.id, self.nome, self.url_link
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Patrocinador":
+        return cls(*values)
+
 
 class Mercado(BaseModel):
     """Mercado"""
@@ -269,6 +464,23 @@ class Mercado(BaseModel):
             fechamento,
         )
 
+    _fields = ("rodada_atual", "status_id", "times_escalados", "fechamento")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.rodada_atual,
+            self.status.id,
+            self.times_escalados,
+            self.fechamento,
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Mercado":
+        rodada_atual, status_id, times_escalados, fechamento = values
+        return cls(
+            rodada_atual, status_id, times_escalados, _coerce_datetime(fechamento)
+        )
+
 
 class Partida(BaseModel):
     """Partida"""
@@ -281,6 +493,7 @@ class Partida(BaseModel):
         placar_casa: int,
         clube_visitante: Clube,
         placar_visitante: int,
+        rodada: Optional[int] = None,
     ) -> None:
         self.data = data
         self.local = local
@@ -288,17 +501,69 @@ class Partida(BaseModel):
         self.placar_casa = placar_casa
         self.clube_visitante = clube_visitante
         self.placar_visitante = placar_visitante
+        self.rodada = rodada
 
     @classmethod
-    def from_dict(cls, data: dict, clubes: Dict[int, Clube]) -> "Partida":
-        data_ = datetime.strptime(data["partida_data"], "%Y-%m-%d %H:%M:%S")
+    def from_dict(
+        cls, data: dict, clubes: Dict[int, Clube], rodada: Optional[int] = None
+    ) -> "Partida":
+        # Formato "%Y-%m-%d %H:%M:%S", que fromisoformat converte bem mais rápido que strptime.
+        data_ = datetime.fromisoformat(data["partida_data"])
         local = data["local"]
         clube_casa = clubes[data["clube_casa_id"]]
         placar_casa = data["placar_oficial_mandante"]
         clube_visitante = clubes[data["clube_visitante_id"]]
         placar_visitante = data["placar_oficial_visitante"]
         return cls(
-            data_, local, clube_casa, placar_casa, clube_visitante, placar_visitante
+            data_,
+            local,
+            clube_casa,
+            placar_casa,
+            clube_visitante,
+            placar_visitante,
+            rodada,
+        )
+
+    _fields = (
+        "data",
+        "local",
+        "clube_casa",
+        "placar_casa",
+        "clube_visitante",
+        "placar_visitante",
+        "rodada",
+    )
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.data,
+            self.local,
+            self.clube_casa,
+            self.placar_casa,
+            self.clube_visitante,
+            self.placar_visitante,
+            self.rodada,
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Partida":
+        (
+            data,
+            local,
+            clube_casa,
+            placar_casa,
+            clube_visitante,
+            placar_visitante,
+            rodada,
+        ) = values
+        return cls(
+            _coerce_datetime(data),
+            local,
+            _coerce(Clube, clube_casa),
+            placar_casa,
+            _coerce(Clube, clube_visitante),
+            placar_visitante,
+            rodada,
         )
 
 
@@ -322,12 +587,55 @@ class Time(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict, clubes: Dict[int, Clube], capitao: int) -> "Time":
-        data["atletas"].sort(key=lambda a: a["posicao_id"])
         atletas = [
             Atleta.from_dict(atleta, clubes, is_capitao=atleta["atleta_id"] == capitao)
-            for atleta in data["atletas"]
+            for atleta in sorted(data["atletas"], key=lambda a: a["posicao_id"])
         ]
         info = TimeInfo.from_dict(data["time"])
         return cls(
             data["patrimonio"], data["valor_time"], data["pontos"], atletas, info
         )
+
+    _fields = (
+        "patrimonio",
+        "valor_time",
+        "ultima_pontuacao",
+        "atletas",
+        "info",
+        "pontos",
+        "jogados",
+    )
+
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.patrimonio,
+            self.valor_time,
+            self.ultima_pontuacao,
+            self.atletas,
+            self.info,
+            self.pontos,
+            getattr(self, "jogados", None),
+        )
+
+    @classmethod
+    def _from_values(cls, values: Sequence[Any]) -> "Time":
+        (
+            patrimonio,
+            valor_time,
+            ultima_pontuacao,
+            atletas,
+            info,
+            pontos,
+            jogados,
+        ) = values
+        time = cls(
+            patrimonio,
+            valor_time,
+            ultima_pontuacao,
+            _coerce_list(Atleta, atletas),
+            _coerce(TimeInfo, info),
+        )
+        time.pontos = pontos
+        if jogados is not None:
+            time.jogados = jogados
+        return time
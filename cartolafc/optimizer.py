@@ -0,0 +1,241 @@
+import heapq
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .errors import CartolaFCError
+from .models import Atleta, _posicoes
+
+FORMATIONS = {
+    "3-4-3": {1: 1, 3: 3, 4: 4, 5: 3, 6: 1},
+    "3-5-2": {1: 1, 3: 3, 4: 5, 5: 2, 6: 1},
+    "4-3-3": {1: 1, 2: 2, 3: 2, 4: 3, 5: 3, 6: 1},
+    "4-4-2": {1: 1, 2: 2, 3: 2, 4: 4, 5: 2, 6: 1},
+    "4-5-1": {1: 1, 2: 2, 3: 2, 4: 5, 5: 1, 6: 1},
+    "5-3-2": {1: 1, 2: 2, 3: 3, 4: 3, 5: 2, 6: 1},
+    "5-4-1": {1: 1, 2: 2, 3: 3, 4: 4, 5: 1, 6: 1},
+}
+"""Formações aceitas pelo Cartola FC, com a quantidade de atletas de cada posição (id de cartolafc.models._posicoes).
+Formações com 3 defensores usam 3 zagueiros e nenhum lateral; com 5 defensores, 3 zagueiros e 2 laterais."""
+
+Escalacao = namedtuple("Escalacao", ["formacao", "atletas", "pontos", "preco"])
+"""Resultado do otimizador: os atletas escolhidos (ordenados pela posição), a soma dos pontos esperados e o preço
+total, em cartoletas."""
+
+# Cada ponto da fronteira é uma tupla (custo em centavos, pontos, índices dos atletas escolhidos).
+_Ponto = Tuple[int, float, Tuple[int, ...]]
+
+
+def _pareto(pontos: Iterable[_Ponto], limite: int) -> List[_Ponto]:
+    """Mantém apenas os pontos não dominados (mais pontos por um custo menor ou igual), ordenados pelo custo."""
+
+    fronteira = []
+    melhor = float("-inf")
+    for ponto in sorted(pontos, key=lambda p: (p[0], -p[1])):
+        if ponto[0] > limite:
+            break
+        if ponto[1] > melhor:
+            fronteira.append(ponto)
+            melhor = ponto[1]
+    return fronteira
+
+
+def _candidatos(
+    indices: Sequence[int], custos: array, pontos: array, quantidade: int
+) -> List[int]:
+    """Descarta os atletas dominados por pelo menos `quantidade` outros da mesma posição (mais baratos e com mais
+    pontos), que nunca fazem parte de uma escalação ótima."""
+
+    candidatos = []
+    melhores: List[float] = []
+    for indice in sorted(indices, key=lambda i: (custos[i], -pontos[i], i)):
+        if len(melhores) == quantidade and melhores[0] >= pontos[indice]:
+            continue
+        candidatos.append(indice)
+        if len(melhores) < quantidade:
+            heapq.heappush(melhores, pontos[indice])
+        elif pontos[indice] > melhores[0]:
+            heapq.heapreplace(melhores, pontos[indice])
+    return candidatos
+
+
+def _fronteira_posicao(
+    indices: Sequence[int],
+    custos: array,
+    pontos: array,
+    quantidade: int,
+    limite: int,
+) -> List[_Ponto]:
+    """Programação dinâmica sobre os candidatos: camadas[j] é a fronteira das escolhas de exatamente j atletas."""
+
+    camadas: List[List[_Ponto]] = [[(0, 0.0, ())]] + [[] for _ in range(quantidade)]
+    for indice in _candidatos(indices, custos, pontos, quantidade):
+        custo, ponto = custos[indice], pontos[indice]
+        for j in range(quantidade, 0, -1):
+            if not camadas[j - 1]:
+                continue
+            novos = [
+                (c + custo, p + ponto, escolha + (indice,))
+                for c, p, escolha in camadas[j - 1]
+                if c + custo <= limite
+            ]
+            if novos:
+                camadas[j] = _pareto(camadas[j] + novos, limite)
+    return camadas[quantidade]
+
+
+def _combinar(a: List[_Ponto], b: List[_Ponto], limite: int) -> List[_Ponto]:
+    custos_b = [ponto[0] for ponto in b]
+    combinados = []
+    for custo_a, pontos_a, escolha_a in a:
+        restante = limite - custo_a
+        for custo_b, pontos_b, escolha_b in b[: bisect_right(custos_b, restante)]:
+            combinados.append(
+                (custo_a + custo_b, pontos_a + pontos_b, escolha_a + escolha_b)
+            )
+    return _pareto(combinados, limite)
+
+
+class LineupOptimizer(object):
+    """Escolhe a escalação com a maior pontuação esperada para uma formação, respeitando um limite de cartoletas.
+
+    Os preços e pontuações esperadas dos atletas são mantidos em arrays por posição. Os atletas dominados são
+    descartados e, para cada posição, uma programação dinâmica calcula a fronteira de Pareto (custo x pontos) das
+    escolhas possíveis; as fronteiras das posições são então combinadas. A fronteira de cada formação é guardada, de
+    modo que consultas com outros orçamentos são respondidas com uma busca binária.
+
+    Exemplo de uso:
+        >>> otimizador = LineupOptimizer(api.mercado_atletas(), status=[7])
+        >>> escalacao = otimizador.solve(cartoletas=100, formacao="4-3-3")
+        >>> otimizador.solve_many([80, 100, 120], formacoes=["4-3-3", "3-5-2"])
+    """
+
+    def __init__(
+        self,
+        atletas: Iterable[Atleta],
+        pontuacao: Optional[Callable[[Atleta], float]] = None,
+        status: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Args:
+            atletas (list): Atletas do mercado, como retornados por cartolafc.Api.mercado_atletas(). Atletas sem
+                preço são ignorados.
+            pontuacao (callable): Função que retorna a pontuação esperada de um atleta. Por padrão, a média.
+            status (list): Ids dos status aceitos (ex.: [7] para apenas os prováveis). Por padrão, todos.
+        """
+
+        pontuacao = pontuacao or (lambda atleta: atleta.media or 0.0)
+        status = set(status) if status is not None else None
+
+        self._atletas: List[Atleta] = []
+        self._custos = array("l")
+        self._pontos = array("d")
+        self._posicoes: Dict[int, List[int]] = {posicao: [] for posicao in _posicoes}
+        for atleta in atletas:
+            if atleta.preco is None:
+                continue
+            if status is not None and (
+                atleta.status is None or atleta.status.id not in status
+            ):
+                continue
+            self._posicoes[atleta.posicao.id].append(len(self._atletas))
+            self._atletas.append(atleta)
+            self._custos.append(round(atleta.preco * 100))
+            self._pontos.append(float(pontuacao(atleta)))
+
+        self._fronteiras: Dict[str, Tuple[int, List[_Ponto], List[int]]] = {}
+
+    def _fronteira(
+        self, formacao: str, limite: int
+    ) -> Tuple[int, List[_Ponto], List[int]]:
+        if formacao not in FORMATIONS:
+            raise CartolaFCError(
+                f"Formação inválida: {formacao}. Use uma de: {', '.join(FORMATIONS)}"
+            )
+
+        guardada = self._fronteiras.get(formacao)
+        if guardada is not None and guardada[0] >= limite:
+            return guardada
+
+        fronteira: List[_Ponto] = [(0, 0.0, ())]
+        # Começa pelas posições com menos atletas, que têm as fronteiras menores.
+        for posicao, quantidade in sorted(
+            FORMATIONS[formacao].items(), key=lambda item: item[1]
+        ):
+            por_posicao = _fronteira_posicao(
+                self._posicoes[posicao], self._custos, self._pontos, quantidade, limite
+            )
+            fronteira = _combinar(fronteira, por_posicao, limite)
+            if not fronteira:
+                break
+        guardada = (limite, fronteira, [ponto[0] for ponto in fronteira])
+        self._fronteiras[formacao] = guardada
+        return guardada
+
+    def _escalacao(self, formacao: str, ponto: _Ponto) -> Escalacao:
+        atletas = sorted(
+            (self._atletas[indice] for indice in ponto[2]),
+            key=lambda atleta: atleta.posicao.id,
+        )
+        return Escalacao(formacao, atletas, ponto[1], ponto[0] / 100)
+
+    def solve(self, cartoletas: float, formacao: str = "4-3-3") -> Optional[Escalacao]:
+        """Retorna a escalação com a maior pontuação esperada que custa no máximo `cartoletas`.
+
+        Args:
+            cartoletas (float): Orçamento disponível.
+            formacao (str): Uma das formações de cartolafc.optimizer.FORMATIONS.
+
+        Returns:
+            Uma instância de cartolafc.optimizer.Escalacao, ou None se não houver escalação possível.
+
+        Raises:
+            cartolafc.CartolaFCError: Se a formação for inválida.
+        """
+
+        limite = int(round(cartoletas * 100))
+        _, fronteira, custos = self._fronteira(formacao, limite)
+        posicao = bisect_right(custos, limite)
+        if not posicao:
+            return None
+        return self._escalacao(formacao, fronteira[posicao - 1])
+
+    def solve_many(
+        self, cartoletas: Iterable[float], formacoes: Optional[Iterable[str]] = None
+    ) -> Dict[Tuple[str, float], Optional[Escalacao]]:
+        """Resolve vários cenários de uma vez, calculando uma única fronteira por formação.
+
+        Args:
+            cartoletas (list): Orçamentos a considerar.
+            formacoes (list): Formações a considerar. Por padrão, todas de cartolafc.optimizer.FORMATIONS.
+
+        Returns:
+            Um mapa, onde a key é a tupla (formação, cartoletas) e o valor é a cartolafc.optimizer.Escalacao (ou
+            None).
+        """
+
+        cartoletas = list(cartoletas)
+        formacoes = list(formacoes) if formacoes is not None else list(FORMATIONS)
+        if not cartoletas:
+            return {}
+
+        maximo = max(cartoletas)
+        for formacao in formacoes:
+            self._fronteira(formacao, int(round(maximo * 100)))
+        return {
+            (formacao, orcamento): self.solve(orcamento, formacao)
+            for formacao in formacoes
+            for orcamento in cartoletas
+        }
+
+
+def optimize_lineup(
+    atletas: Iterable[Atleta],
+    cartoletas: float,
+    formacao: str = "4-3-3",
+    status: Optional[Iterable[int]] = None,
+) -> Optional[Escalacao]:
+    """Atalho para uma única consulta com um cartolafc.optimizer.LineupOptimizer temporário."""
+
+    return LineupOptimizer(atletas, status=status).solve(cartoletas, formacao)
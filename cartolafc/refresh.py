@@ -0,0 +1,265 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .constants import MERCADO_ABERTO, MERCADO_FECHADO
+from .errors import CartolaFCError
+from .metrics import Hooks
+from .models import Mercado
+from .transports import request_key
+
+if TYPE_CHECKING:
+    from .api import Api
+
+logger = logging.getLogger(__name__)
+
+
+class _Carga(object):
+    __slots__ = ("evento", "data", "erro")
+
+    def __init__(self) -> None:
+        self.evento = threading.Event()
+        self.data: Any = None
+        self.erro: Optional[BaseException] = None
+
+
+class WarmCache(object):
+    """Cache em memória das respostas já decodificadas, preenchido com antecedência por um
+    cartolafc.refresh.RefreshAheadScheduler.
+
+    Apenas as requisições colocadas no cache com put() são respondidas a partir da memória, até expirarem. As demais
+    passam pelo cache sem serem guardadas, mas requisições iguais e simultâneas são agrupadas em uma única chamada à
+    API (single-flight), evitando a avalanche de requisições logo após uma mudança de status do mercado.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entradas: Dict[str, Tuple[float, Any]] = {}
+        self._cargas: Dict[str, _Carga] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entradas)
+
+    def __contains__(self, chave: str) -> bool:
+        return self.get(chave) is not None
+
+    def get(self, chave: str) -> Any:
+        # Leitura sem lock: dict.get é atômico e as entradas são tuplas imutáveis, substituídas por inteiro em put().
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            return None
+        if entrada[0] <= self._clock():
+            with self._lock:
+                # Só remove se outra thread não tiver colocado uma entrada nova nesse meio tempo.
+                if self._entradas.get(chave) is entrada:
+                    del self._entradas[chave]
+            return None
+        return entrada[1]
+
+    def put(self, chave: str, data: Any, ttl: float) -> None:
+        with self._lock:
+            self._entradas[chave] = (self._clock() + ttl, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+
+    def load(
+        self,
+        chave: str,
+        fetch: Callable[[], Any],
+        hooks: Optional[Hooks] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """Retorna a resposta guardada da requisição ou, se não houver, executa fetch, compartilhando o resultado
+        com as chamadas simultâneas da mesma requisição."""
+
+        data = self.get(chave)
+        if data is not None:
+            if hooks is not None:
+                hooks.on_cache_hit(endpoint)
+            return data
+
+        with self._lock:
+            carga = self._cargas.get(chave)
+            dono = carga is None
+            if dono:
+                carga = self._cargas[chave] = _Carga()
+
+        if not dono:
+            carga.evento.wait()
+            if carga.erro is not None:
+                raise carga.erro
+            if hooks is not None:
+                hooks.on_cache_hit(endpoint)
+            return carga.data
+
+        try:
+            carga.data = fetch()
+            return carga.data
+        except BaseException as error:
+            carga.erro = error
+            raise
+        finally:
+            with self._lock:
+                del self._cargas[chave]
+            carga.evento.set()
+
+
+class RefreshAheadScheduler(object):
+    """Acompanha o status do mercado e, logo após cada mudança, obtém e decodifica com antecedência os dados que
+    passam a ficar disponíveis, deixando-os em um cartolafc.refresh.WarmCache utilizado pela cartolafc.Api.
+
+    Com o mercado aberto, o agendador dorme até Mercado.fechamento (limitado a poll_interval). Quando o mercado fecha,
+    são obtidas as parciais, os clubes e os times acompanhados; enquanto estiver fechado, as parciais são atualizadas
+    a cada poll_interval. Quando o mercado abre, são obtidos os destaques da rodada anterior, o mercado de atletas e
+    novamente os times. As requisições são distribuídas em até `workers` threads.
+
+    Exemplo de uso:
+        >>> cache = WarmCache()
+        >>> api = cartolafc.Api(cache=cache)
+        >>> scheduler = RefreshAheadScheduler(api, time_ids=[471815, 1245808], workers=16)
+        >>> scheduler.start()
+        >>> api.parciais()  # Servido da memória logo após o fechamento do mercado
+    """
+
+    def __init__(
+        self,
+        api: "Api",
+        time_ids: Iterable[int] = (),
+        workers: int = 8,
+        poll_interval: float = 60.0,
+        ttl: Optional[float] = None,
+        lag: float = 5.0,
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """
+        Args:
+            api (cartolafc.Api): Instância criada com um cartolafc.refresh.WarmCache.
+            time_ids (list): Ids dos times cujos dados são obtidos a cada mudança de status.
+            workers (int): Quantidade de requisições feitas em paralelo.
+            poll_interval (float): Intervalo máximo, em segundos, entre duas consultas ao status do mercado.
+            ttl (float): Validade, em segundos, dos dados guardados. Por padrão, 2 * poll_interval.
+            lag (float): Segundos de espera após Mercado.fechamento antes de consultar o status novamente.
+            now (callable): Relógio utilizado para comparar com Mercado.fechamento (horário de Brasília).
+        """
+
+        if api._cache is None:
+            raise CartolaFCError("A cartolafc.Api deve ser criada com um WarmCache.")
+        self._api = api
+        self._time_ids = list(time_ids)
+        self._workers = max(workers, 1)
+        self._poll_interval = poll_interval
+        self._ttl = ttl if ttl is not None else 2 * poll_interval
+        self._lag = lag
+        self._now = now
+        self._status: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.mercado: Optional[Mercado] = None
+
+    def _aquecer(self, requisicoes: List[Tuple[str, str]]) -> int:
+        api = self._api
+
+        def aquecer(requisicao: Tuple[str, str]) -> bool:
+            endpoint, url = requisicao
+            try:
+                data = api._request(url, endpoint=endpoint, use_cache=False)
+            except Exception as error:
+                logger.warning("Não foi possível obter %s: %s", url, error)
+                return False
+            api._cache.put(request_key(url, None), data, self._ttl)
+            return True
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._workers, len(requisicoes) or 1)
+        ) as executor:
+            return sum(executor.map(aquecer, requisicoes))
+
+    def _requisicoes(self, status: int, mudou: bool) -> List[Tuple[str, str]]:
+        url = self._api._api_url
+        requisicoes = []
+        if status == MERCADO_FECHADO:
+            requisicoes.append(("parciais", f"{url}/atletas/pontuados"))
+        elif status == MERCADO_ABERTO and mudou:
+            requisicoes.append(("pos_rodada_destaques", f"{url}/pos-rodada/destaques"))
+            requisicoes.append(("mercado_atletas", f"{url}/atletas/mercado"))
+        if mudou and status in (MERCADO_ABERTO, MERCADO_FECHADO):
+            requisicoes.append(("clubes", f"{url}/clubes"))
+            requisicoes.extend(
+                ("time", f"{url}/time/id/{time_id}") for time_id in self._time_ids
+            )
+        return requisicoes
+
+    def tick(self) -> int:
+        """Consulta o status do mercado e obtém os dados correspondentes, se necessário.
+
+        Returns:
+            A quantidade de requisições guardadas no cache.
+        """
+
+        url = f"{self._api._api_url}/mercado/status"
+        data = self._api._request(url, endpoint="mercado", use_cache=False)
+        self.mercado = Mercado.from_dict(data)
+        status = self.mercado.status.id
+        mudou = status != self._status
+        if mudou:
+            logger.info("Mercado: %s", self.mercado.status.nome)
+        self._status = status
+
+        # O status também é guardado, para que as verificações feitas por parciais() e afins não acessem a API, mas
+        # apenas até o próximo tick ou, com o mercado aberto, até o horário de fechamento.
+        validade = self.next_delay()
+        if status == MERCADO_ABERTO:
+            fechamento = (self.mercado.fechamento - self._now()).total_seconds()
+            validade = min(validade, fechamento)
+        if validade > 0:
+            self._api._cache.put(request_key(url, None), data, validade)
+
+        return self._aquecer(self._requisicoes(status, mudou))
+
+    def next_delay(self) -> float:
+        """Segundos até o próximo tick: até o fechamento do mercado (mais lag) se ele estiver aberto, limitado a
+        poll_interval."""
+
+        if self.mercado is None or self.mercado.status.id != MERCADO_ABERTO:
+            return self._poll_interval
+        restante = (self.mercado.fechamento - self._now()).total_seconds() + self._lag
+        # Se o fechamento já passou e o mercado continua aberto (ex.: adiado), consulta a cada lag segundos.
+        return min(max(restante, self._lag, 1.0), self._poll_interval)
+
+    def _executar(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.tick()
+            except Exception as error:
+                logger.warning("Não foi possível consultar o mercado: %s", error)
+            self._stop.wait(self.next_delay())
+
+    def start(self) -> "RefreshAheadScheduler":
+        """Inicia o agendador em uma thread em segundo plano."""
+
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._executar, name="cartolafc-refresh-ahead", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "RefreshAheadScheduler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,189 @@
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from .errors import CartolaFCError
+from .models import Clube, Partida
+
+if TYPE_CHECKING:
+    from .api import Api
+
+RODADAS = 38
+"""Quantidade de rodadas do Campeonato Brasileiro."""
+
+_MANDOS = ("casa", "fora")
+
+
+def _consolidada(partidas: List[Partida]) -> bool:
+    return bool(partidas) and all(
+        partida.placar_casa is not None and partida.placar_visitante is not None
+        for partida in partidas
+    )
+
+
+class SeasonSchedule(object):
+    """Tabela de jogos da temporada, com índices por rodada, por clube e por data.
+
+    As rodadas são obtidas em paralelo, com um pool de threads, e compartilham as instâncias de cartolafc.Clube. As
+    rodadas consolidadas (todas as partidas com placar) ficam guardadas e não são obtidas novamente em refresh(), que
+    atualiza apenas as demais.
+
+    Exemplo de uso:
+        >>> tabela = SeasonSchedule(api).load()
+        >>> tabela.by_rodada(1)
+        >>> tabela.by_clube(262, mando="casa")
+        >>> tabela.next_match(262)
+    """
+
+    def __init__(
+        self,
+        api: "Api",
+        rodadas: Iterable[int] = range(1, RODADAS + 1),
+        workers: int = 8,
+    ) -> None:
+        """
+        Args:
+            api (cartolafc.Api): Instância utilizada para obter as partidas.
+            rodadas (list): Rodadas que fazem parte da tabela. Por padrão, as 38 rodadas do campeonato.
+            workers (int): Quantidade de rodadas obtidas em paralelo.
+        """
+
+        self._api = api
+        self._rodadas_tabela = sorted(set(rodadas))
+        self._workers = max(workers, 1)
+        self._lock = Lock()
+        self._clubes: Dict[int, Clube] = {}
+        self._rodadas: Dict[int, List[Partida]] = {}
+        self._consolidadas: Dict[int, bool] = {}
+        self._indexar()
+
+    def _obter_rodada(self, rodada: int) -> List[Partida]:
+        url = f"{self._api._api_url}/partidas/{rodada}"
+        data = self._api._request(url, endpoint="partidas")
+        with self._api._build("partidas"):
+            with self._lock:
+                for clube_id, clube in data["clubes"].items():
+                    if int(clube_id) not in self._clubes:
+                        self._clubes[int(clube_id)] = Clube.from_dict(clube)
+            partidas = [
+                Partida.from_dict(partida, clubes=self._clubes, rodada=rodada)
+                for partida in data["partidas"]
+            ]
+        partidas.sort(key=lambda partida: partida.data)
+        return partidas
+
+    def load(self) -> "SeasonSchedule":
+        """Obtém todas as rodadas ainda não consolidadas e reconstrói os índices.
+
+        Returns:
+            A própria instância, para encadear as chamadas.
+
+        Raises:
+            cartolafc.CartolaFCError: Se alguma das rodadas não puder ser obtida.
+        """
+
+        pendentes = [
+            rodada
+            for rodada in self._rodadas_tabela
+            if not self._consolidadas.get(rodada)
+        ]
+        if pendentes:
+            with ThreadPoolExecutor(
+                max_workers=min(self._workers, len(pendentes))
+            ) as executor:
+                resultados = list(executor.map(self._obter_rodada, pendentes))
+            for rodada, partidas in zip(pendentes, resultados):
+                self._rodadas[rodada] = partidas
+                self._consolidadas[rodada] = _consolidada(partidas)
+            self._indexar()
+        return self
+
+    refresh = load
+
+    def _indexar(self) -> None:
+        partidas = sorted(
+            (partida for rodada in self._rodadas.values() for partida in rodada),
+            key=lambda partida: partida.data,
+        )
+        por_clube: Dict[int, List[Partida]] = {}
+        por_mando: Dict[str, Dict[int, List[Partida]]] = {m: {} for m in _MANDOS}
+        por_dia: Dict[date, List[Partida]] = {}
+        for partida in partidas:
+            por_dia.setdefault(partida.data.date(), []).append(partida)
+            for mando, clube in zip(
+                _MANDOS, (partida.clube_casa, partida.clube_visitante)
+            ):
+                por_clube.setdefault(clube.id, []).append(partida)
+                por_mando[mando].setdefault(clube.id, []).append(partida)
+
+        self._partidas = partidas
+        self._datas = [partida.data for partida in partidas]
+        self._por_clube = por_clube
+        self._datas_clube = {
+            clube_id: [partida.data for partida in lista]
+            for clube_id, lista in por_clube.items()
+        }
+        self._por_mando = por_mando
+        self._por_dia = por_dia
+
+    @property
+    def consolidated(self) -> List[int]:
+        """Rodadas consolidadas, que não são mais obtidas em refresh()."""
+
+        return [rodada for rodada, ok in sorted(self._consolidadas.items()) if ok]
+
+    def __len__(self) -> int:
+        return len(self._partidas)
+
+    def __iter__(self) -> Iterator[Partida]:
+        return iter(self._partidas)
+
+    def by_rodada(self, rodada: int) -> List[Partida]:
+        """Partidas de uma rodada, ordenadas pela data."""
+
+        if rodada not in self._rodadas:
+            raise CartolaFCError(f"A rodada {rodada} não faz parte da tabela.")
+        return list(self._rodadas[rodada])
+
+    def by_clube(self, clube_id: int, mando: Optional[str] = None) -> List[Partida]:
+        """Partidas de um clube, ordenadas pela data.
+
+        Args:
+            clube_id (int): Id do clube.
+            mando (str): "casa" ou "fora" para apenas os jogos como mandante ou visitante. Por padrão, todos.
+        """
+
+        if mando is None:
+            return list(self._por_clube.get(clube_id, ()))
+        if mando not in self._por_mando:
+            raise CartolaFCError(f'Mando inválido: {mando}. Use "casa" ou "fora".')
+        return list(self._por_mando[mando].get(clube_id, ()))
+
+    def by_date(self, dia: date) -> List[Partida]:
+        """Partidas de um dia, ordenadas pela data."""
+
+        if isinstance(dia, datetime):
+            dia = dia.date()
+        return list(self._por_dia.get(dia, ()))
+
+    def between(self, inicio: datetime, fim: datetime) -> List[Partida]:
+        """Partidas com data entre inicio e fim (inclusive), ordenadas pela data."""
+
+        return self._partidas[
+            bisect_left(self._datas, inicio) : bisect_right(self._datas, fim)
+        ]
+
+    def next_match(
+        self, clube_id: int, a_partir: Optional[datetime] = None
+    ) -> Optional[Partida]:
+        """Próxima partida de um clube a partir de uma data (por padrão, agora), ou None se não houver."""
+
+        datas = self._datas_clube.get(clube_id)
+        if not datas:
+            return None
+        indice = bisect_left(datas, a_partir or datetime.now())
+        if indice == len(datas):
+            return None
+        return self._por_clube[clube_id][indice]
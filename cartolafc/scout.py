@@ -0,0 +1,213 @@
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from itertools import compress
+from operator import add, sub
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+SCOUTS = (
+    "G",
+    "A",
+    "FT",
+    "FD",
+    "FF",
+    "FS",
+    "PS",
+    "I",
+    "PP",
+    "PI",
+    "DS",
+    "SG",
+    "DE",
+    "DD",
+    "DP",
+    "GC",
+    "GS",
+    "CV",
+    "CA",
+    "FC",
+    "PC",
+    "PE",
+    "RB",
+    "V",
+)
+"""Códigos dos scouts do Cartola FC, na ordem em que são armazenados em cartolafc.scout.Scout."""
+
+_indices = {codigo: indice for indice, codigo in enumerate(SCOUTS)}
+_TYPECODE = "h"
+_ZEROS = bytes(struct.calcsize(_TYPECODE) * len(SCOUTS))
+_ZEROS_H = (0,) * len(SCOUTS)
+_unpack_from = struct.Struct(_TYPECODE).unpack_from
+
+
+class Scout(Mapping):
+    """Scouts de um atleta (ex.: {"G": 1, "FS": 2}), armazenados em um array de inteiros de 16 bits de tamanho fixo.
+
+    Cada código de cartolafc.scout.SCOUTS ocupa uma posição do array, e apenas os scouts diferentes de zero são
+    expostos como chaves, de modo que a leitura é compatível com o dicionário retornado pela API. Códigos
+    desconhecidos são preservados à parte. As instâncias são imutáveis e podem ser compartilhadas entre atletas.
+
+    Exemplo de uso:
+        >>> scout = Scout({"G": 1, "FS": 2})
+        >>> scout["G"], scout.get("A", 0), dict(scout)
+        (1, 0, {'G': 1, 'FS': 2})
+        >>> dict(Scout({"G": 2, "FS": 3}) - scout)
+        {'G': 1, 'FS': 1}
+    """
+
+    __slots__ = ("_valores", "_extras")
+
+    def __init__(self, data: Optional[Mapping] = None) -> None:
+        extras = None
+        if data:
+            valores = array(_TYPECODE, _ZEROS)
+            for codigo, quantidade in data.items():
+                indice = _indices.get(codigo)
+                if indice is not None:
+                    valores[indice] = quantidade
+                elif quantidade:
+                    extras = extras or {}
+                    extras[codigo] = quantidade
+            self._valores = valores.tobytes()
+        else:
+            self._valores = _ZEROS
+        self._extras = extras
+
+    @classmethod
+    def _from_array(
+        cls, valores: array, extras: Optional[Dict[str, int]] = None
+    ) -> "Scout":
+        scout = cls.__new__(cls)
+        scout._valores = valores.tobytes()
+        scout._extras = extras or None
+        return scout
+
+    def _quantidades(self) -> memoryview:
+        return memoryview(self._valores).cast(_TYPECODE)
+
+    @classmethod
+    def from_values(cls, valores: Iterable[int]) -> "Scout":
+        """Cria um scout a partir das quantidades, na ordem de cartolafc.scout.SCOUTS."""
+
+        valores = array(_TYPECODE, valores)
+        if len(valores) != len(SCOUTS):
+            raise ValueError(f"São esperados {len(SCOUTS)} valores")
+        return cls._from_array(valores)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, extras: Optional[Dict[str, int]] = None
+    ) -> "Scout":
+        valores = array(_TYPECODE)
+        valores.frombytes(data)
+        if sys.byteorder == "big":
+            valores.byteswap()
+        return cls._from_array(valores, extras)
+
+    def to_bytes(self) -> bytes:
+        """Retorna as quantidades como inteiros de 16 bits little-endian, na ordem de cartolafc.scout.SCOUTS. Os
+        códigos desconhecidos não são incluídos."""
+
+        if sys.byteorder == "big":
+            valores = self.values_array
+            valores.byteswap()
+            return valores.tobytes()
+        return self._valores
+
+    @property
+    def values_array(self) -> array:
+        """Cópia das quantidades, na ordem de cartolafc.scout.SCOUTS."""
+
+        return array(_TYPECODE, self._quantidades())
+
+    @property
+    def extras(self) -> Dict[str, int]:
+        return dict(self._extras) if self._extras else {}
+
+    def __getitem__(self, codigo: str) -> int:
+        indice = _indices.get(codigo)
+        if indice is None:
+            if self._extras and codigo in self._extras:
+                return self._extras[codigo]
+            raise KeyError(codigo)
+        quantidade = _unpack_from(self._valores, indice * 2)[0]
+        if not quantidade:
+            raise KeyError(codigo)
+        return quantidade
+
+    def get(self, codigo: str, default: Any = None) -> Any:
+        indice = _indices.get(codigo)
+        if indice is None:
+            return self._extras.get(codigo, default) if self._extras else default
+        return _unpack_from(self._valores, indice * 2)[0] or default
+
+    def __contains__(self, codigo: object) -> bool:
+        return self.get(codigo) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        yield from compress(SCOUTS, self._quantidades())
+        if self._extras:
+            yield from self._extras
+
+    def __len__(self) -> int:
+        zeros = self._quantidades().tolist().count(0)
+        return len(SCOUTS) - zeros + len(self._extras or ())
+
+    def __bool__(self) -> bool:
+        return self._valores != _ZEROS or bool(self._extras)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Scout):
+            return self._valores == other._valores and self.extras == other.extras
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def _combinar(self, other: "Scout", operacao: Any) -> "Scout":
+        if not isinstance(other, Scout):
+            other = Scout(other)
+        valores = array(
+            _TYPECODE, map(operacao, self._quantidades(), other._quantidades())
+        )
+        extras = None
+        if self._extras or other._extras:
+            extras = {}
+            for codigo in set(self.extras) | set(other.extras):
+                quantidade = operacao(
+                    self.extras.get(codigo, 0), other.extras.get(codigo, 0)
+                )
+                if quantidade:
+                    extras[codigo] = quantidade
+        return Scout._from_array(valores, extras)
+
+    def __add__(self, other: Mapping) -> "Scout":
+        return self._combinar(other, add)
+
+    def __sub__(self, other: Mapping) -> "Scout":
+        """Diferença entre dois snapshots, ex.: o que mudou desde a última leitura das parciais."""
+
+        return self._combinar(other, sub)
+
+    @classmethod
+    def total(cls, scouts: Iterable["Scout"]) -> "Scout":
+        """Soma vários scouts, ex.: os de todas as rodadas de um atleta."""
+
+        scouts = [s if isinstance(s, Scout) else Scout(s) for s in scouts]
+        valores = array(
+            _TYPECODE, map(sum, zip(_ZEROS_H, *(s._quantidades() for s in scouts)))
+        )
+        extras: Dict[str, int] = {}
+        for scout in scouts:
+            for codigo, quantidade in (scout._extras or {}).items():
+                extras[codigo] = extras.get(codigo, 0) + quantidade
+        return cls._from_array(valores, extras)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return Scout.from_bytes, (self.to_bytes(), self._extras)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+EMPTY_SCOUT = Scout()
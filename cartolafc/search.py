@@ -0,0 +1,268 @@
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .models import Liga, TimeInfo
+
+TIMES = "times"
+LIGAS = "ligas"
+
+
+def normalize(texto: Optional[str]) -> str:
+    """Converte um texto para a forma utilizada no índice: minúsculo, sem acentos e com os separadores (espaços,
+    hífens e sublinhados) reduzidos a um espaço."""
+
+    if not texto:
+        return ""
+    decomposto = unicodedata.normalize("NFKD", texto.lower())
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return " ".join(sem_acentos.replace("-", " ").replace("_", " ").split())
+
+
+def _trigramas(texto: str) -> Set[str]:
+    texto = f"  {texto} "
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class _Colecao(object):
+    """Índice de um tipo de item (times ou ligas): chaves ordenadas para a busca por prefixo e trigramas para a busca
+    aproximada."""
+
+    def __init__(self) -> None:
+        self.itens: Dict[int, Union[TimeInfo, Liga]] = {}
+        self.textos: Dict[int, Tuple[str, ...]] = {}
+        self.chaves: List[Tuple[str, int]] = []
+        self.chaves_por_item: Dict[int, Set[Tuple[str, int]]] = {}
+        self.trigramas: Dict[str, Set[int]] = {}
+        self.conjuntos: Dict[int, List[Set[str]]] = {}
+        # Termo normalizado -> (instante da busca na API, ids retornados).
+        self.consultas: Dict[str, Tuple[float, List[int]]] = {}
+
+    def adicionar(
+        self, item_id: int, item: Union[TimeInfo, Liga], *campos: str
+    ) -> None:
+        self.itens[item_id] = item
+        textos = tuple(sorted({normalize(campo) for campo in campos if campo}))
+        if self.textos.get(item_id) == textos:
+            return
+        conjuntos = [_trigramas(texto) for texto in textos]
+        chaves = {
+            (" ".join(palavras[inicio:]), item_id)
+            for palavras in (texto.split(" ") for texto in textos)
+            for inicio in range(len(palavras))
+        }
+        trigramas = set().union(*conjuntos)
+
+        # Um item renomeado deixa de ser encontrado pelos textos antigos. As chaves continuam ordenadas: cada
+        # inserção e remoção é uma busca binária, sem reordenar o índice inteiro.
+        antigas = self.chaves_por_item.get(item_id, set())
+        for chave in antigas - chaves:
+            del self.chaves[bisect_left(self.chaves, chave)]
+        for chave in chaves - antigas:
+            insort(self.chaves, chave)
+        for trigrama in set().union(*self.conjuntos.get(item_id, ())) - trigramas:
+            self.trigramas[trigrama].discard(item_id)
+            if not self.trigramas[trigrama]:
+                del self.trigramas[trigrama]
+        for trigrama in trigramas:
+            self.trigramas.setdefault(trigrama, set()).add(item_id)
+
+        self.textos[item_id] = textos
+        self.conjuntos[item_id] = conjuntos
+        self.chaves_por_item[item_id] = chaves
+
+    def prefixo(self, consulta: str) -> List[int]:
+        encontrados: Dict[int, None] = {}
+        indice = bisect_left(self.chaves, (consulta,))
+        while indice < len(self.chaves):
+            chave, item_id = self.chaves[indice]
+            if not chave.startswith(consulta):
+                break
+            encontrados[item_id] = None
+            indice += 1
+        return list(encontrados)
+
+    def aproximado(self, consulta: str, limiar: float) -> List[Tuple[float, int]]:
+        trigramas = _trigramas(consulta)
+        candidatos: Set[int] = set()
+        for trigrama in trigramas:
+            candidatos.update(self.trigramas.get(trigrama, ()))
+
+        resultados = []
+        for item_id in candidatos:
+            # Similaridade de Dice contra o texto mais parecido do item.
+            similaridade = max(
+                2 * len(trigramas & conjunto) / (len(trigramas) + len(conjunto))
+                for conjunto in self.conjuntos[item_id]
+            )
+            if similaridade >= limiar:
+                resultados.append((similaridade, item_id))
+        resultados.sort(key=lambda resultado: (-resultado[0], resultado[1]))
+        return resultados
+
+
+class SearchIndex(object):
+    """Índice local dos times (cartolafc.TimeInfo) e ligas (cartolafc.Liga) já vistos, para buscas sem acessar a API.
+
+    O índice é alimentado pela cartolafc.Api (resultados de times() e ligas(), Liga.times e Time.info) e busca pelo
+    nome, nome_cartola e slug, por prefixo de qualquer palavra e, opcionalmente, de forma aproximada (trigramas).
+
+    A API utiliza o índice em vez de uma requisição apenas quando a resposta local é comprovadamente completa: quando
+    o mesmo termo já foi buscado na API, ou quando um prefixo do termo já foi buscado e retornou menos que page_size
+    resultados. As buscas registradas expiram após query_ttl segundos. Opcionalmente, com min_results, a busca local
+    por prefixo também é utilizada quando encontra ao menos min_results itens, mesmo que a API pudesse retornar
+    outros.
+
+    Exemplo de uso:
+        >>> index = SearchIndex()
+        >>> api = cartolafc.Api(search_index=index)
+        >>> api.times("faly")
+        >>> api.times("falyd")  # Respondido localmente
+        >>> index.search_times("fallydos", fuzzy=True)
+    """
+
+    def __init__(
+        self,
+        min_results: Optional[int] = None,
+        page_size: Optional[int] = None,
+        fuzzy_threshold: float = 0.5,
+        query_ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            min_results (int): Quantidade de resultados locais por prefixo a partir da qual a busca não acessa a API,
+                mesmo sem saber se a resposta local está completa. Por padrão, desativado.
+            page_size (int): Quantidade máxima de resultados retornada pela API em uma busca, se for conhecida.
+            fuzzy_threshold (float): Similaridade mínima (de 0 a 1) dos resultados aproximados.
+            query_ttl (float): Tempo, em segundos, durante o qual uma busca feita na API é utilizada para responder
+                localmente. None para não expirar.
+            clock (callable): Relógio utilizado na expiração das buscas.
+        """
+
+        self._min_results = min_results
+        self._page_size = page_size
+        self._fuzzy_threshold = fuzzy_threshold
+        self._query_ttl = query_ttl
+        self._clock = clock
+        self._colecoes = {TIMES: _Colecao(), LIGAS: _Colecao()}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return sum(len(colecao.itens) for colecao in self._colecoes.values())
+
+    def add_time(self, time: TimeInfo) -> None:
+        with self._lock:
+            self._colecoes[TIMES].adicionar(
+                time.id, time, time.nome, time.nome_cartola, time.slug
+            )
+
+    def add_times(self, times: Iterable[TimeInfo]) -> None:
+        for time in times:
+            self.add_time(time)
+
+    def add_liga(self, liga: Liga) -> None:
+        """Adiciona uma liga e, se tiverem sido obtidos, os seus times."""
+
+        with self._lock:
+            self._colecoes[LIGAS].adicionar(liga.id, liga, liga.nome, liga.slug)
+        self.add_times(liga.times or ())
+
+    def add_ligas(self, ligas: Iterable[Liga]) -> None:
+        for liga in ligas:
+            self.add_liga(liga)
+
+    def record_query(
+        self, tipo: str, consulta: str, resultados: Iterable[Union[TimeInfo, Liga]]
+    ) -> None:
+        """Registra uma busca feita na API (tipo "times" ou "ligas") e os resultados retornados, que são adicionados
+        ao índice."""
+
+        resultados = list(resultados)
+        if tipo == LIGAS:
+            self.add_ligas(resultados)
+        else:
+            self.add_times(resultados)
+        with self._lock:
+            self._colecoes[tipo].consultas[normalize(consulta)] = (
+                self._clock(),
+                [item.id for item in resultados],
+            )
+
+    def _buscar(
+        self, tipo: str, consulta: str, fuzzy: bool, limit: Optional[int]
+    ) -> List[Union[TimeInfo, Liga]]:
+        consulta = normalize(consulta)
+        colecao = self._colecoes[tipo]
+        with self._lock:
+            encontrados = colecao.prefixo(consulta) if consulta else []
+            if fuzzy and consulta:
+                vistos = set(encontrados)
+                encontrados += [
+                    item_id
+                    for _, item_id in colecao.aproximado(
+                        consulta, self._fuzzy_threshold
+                    )
+                    if item_id not in vistos
+                ]
+            return [colecao.itens[item_id] for item_id in encontrados[:limit]]
+
+    def search_times(
+        self, consulta: str, fuzzy: bool = False, limit: Optional[int] = None
+    ) -> List[TimeInfo]:
+        """Busca os times do índice. Os resultados por prefixo vêm primeiro, seguidos dos aproximados, do mais para o
+        menos parecido."""
+
+        return self._buscar(TIMES, consulta, fuzzy, limit)
+
+    def search_ligas(
+        self, consulta: str, fuzzy: bool = False, limit: Optional[int] = None
+    ) -> List[Liga]:
+        """Busca as ligas do índice, como em search_times."""
+
+        return self._buscar(LIGAS, consulta, fuzzy, limit)
+
+    def lookup(self, tipo: str, consulta: str) -> Optional[List[Union[TimeInfo, Liga]]]:
+        """Retorna os resultados locais de uma busca do tipo "times" ou "ligas", ou None se a resposta local não for
+        confiável e a busca deve ser feita na API."""
+
+        normalizada = normalize(consulta)
+        colecao = self._colecoes[tipo]
+        with self._lock:
+            # Apenas os prefixos do termo (inclusive ele mesmo) podem comprovar que a resposta local está completa.
+            prefixos = {}
+            for fim in range(1, len(normalizada) + 1):
+                consulta_anterior = self._consulta(colecao, normalizada[:fim])
+                if consulta_anterior is not None:
+                    prefixos[normalizada[:fim]] = consulta_anterior
+            mesma = prefixos.get(normalizada)
+            completa = mesma is not None or (
+                self._page_size is not None
+                and any(len(ids) < self._page_size for ids in prefixos.values())
+            )
+            anteriores = [colecao.itens[item_id] for item_id in mesma or ()]
+
+        if not completa and self._min_results is None:
+            return None
+        locais = self._buscar(tipo, consulta, fuzzy=False, limit=None)
+        if anteriores:
+            # A mesma busca já foi feita na API: mantém a ordem da resposta, seguida dos itens vistos depois.
+            vistos = {item.id for item in anteriores}
+            return anteriores + [item for item in locais if item.id not in vistos]
+        if completa:
+            return locais
+        if len(locais) >= self._min_results:
+            return locais
+        return None
+
+    def _consulta(self, colecao: _Colecao, consulta: str) -> Optional[List[int]]:
+        registro = colecao.consultas.get(consulta)
+        if registro is None:
+            return None
+        instante, ids = registro
+        if self._query_ttl is not None and self._clock() - instante >= self._query_ttl:
+            del colecao.consultas[consulta]
+            return None
+        return ids
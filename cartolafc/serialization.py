@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from .errors import CartolaFCError
+from .models import (
+    Atleta,
+    AtletaDestaque,
+    BaseModel,
+    Clube,
+    DestaqueRodada,
+    Liga,
+    Mercado,
+    Partida,
+    Patrocinador,
+    Time,
+    TimeInfo,
+)
+from .scout import Scout
+
+_DATETIME = 0
+_SCOUT = 11
+_modelos = {
+    1: Clube,
+    2: TimeInfo,
+    3: Atleta,
+    4: AtletaDestaque,
+    5: DestaqueRodada,
+    6: Liga,
+    7: Patrocinador,
+    8: Mercado,
+    9: Partida,
+    10: Time,
+}
+_codigos = {modelo: codigo for codigo, modelo in _modelos.items()}
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        raise CartolaFCError(
+            "O formato binário requer o pacote msgpack: pip install Python-CartolaFC[msgpack]"
+        )
+    return msgpack
+
+
+class _Modelo(object):
+    __slots__ = ("modelo",)
+
+    def __init__(self, modelo: Any) -> None:
+        self.modelo = modelo
+
+
+def dumps(value: Any) -> bytes:
+    """Serializa modelos do cartolafc (ou listas e dicionários de modelos) no formato binário msgpack.
+
+    Cada modelo é gravado como uma lista com os seus valores, na ordem de _fields e sem os nomes dos campos,
+    precedida por uma extensão msgpack vazia que identifica o modelo. O resultado é compacto e pode ser convertido de
+    volta, sem perdas, com loads.
+
+    Args:
+        value: Um modelo, ou qualquer estrutura de listas, dicionários e tipos simples contendo modelos.
+
+    Returns:
+        Os bytes serializados.
+
+    Raises:
+        cartolafc.CartolaFCError: Se o pacote msgpack não estiver instalado.
+    """
+
+    msgpack = _msgpack()
+    tags = {modelo: msgpack.ExtType(codigo, b"") for modelo, codigo in _codigos.items()}
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            return [tags[type(obj)], *obj._values()]
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(_DATETIME, obj.isoformat().encode("ascii"))
+        if isinstance(obj, Scout):
+            if obj.extras:
+                return dict(obj)
+            return msgpack.ExtType(_SCOUT, obj.to_bytes())
+        raise TypeError(f"Tipo não suportado: {type(obj).__name__}")
+
+    return msgpack.packb(value, default=default, use_bin_type=True)
+
+
+def loads(data: bytes) -> Any:
+    """Reconstrói os modelos serializados por dumps.
+
+    Raises:
+        cartolafc.CartolaFCError: Se o pacote msgpack não estiver instalado.
+    """
+
+    msgpack = _msgpack()
+    tags = {codigo: _Modelo(modelo) for codigo, modelo in _modelos.items()}
+
+    def ext_hook(codigo: int, conteudo: bytes) -> Any:
+        if codigo == _DATETIME:
+            return datetime.fromisoformat(conteudo.decode("ascii"))
+        if codigo == _SCOUT:
+            return Scout.from_bytes(conteudo)
+        return tags[codigo]
+
+    clubes: Dict[Tuple[Any, ...], Clube] = {}
+
+    def list_hook(valores: List[Any]) -> Any:
+        if not valores or not isinstance(valores[0], _Modelo):
+            return valores
+        modelo = valores[0].modelo
+        if modelo is Clube:
+            # Os mesmos clubes se repetem em cada atleta: compartilha as instâncias, como em Api.parciais().
+            chave = tuple(valores[1:])
+            clube = clubes.get(chave)
+            if clube is None:
+                clube = clubes[chave] = Clube._from_values(chave)
+            return clube
+        return modelo._from_values(valores[1:])
+
+    return msgpack.unpackb(
+        data,
+        ext_hook=ext_hook,
+        list_hook=list_hook,
+        raw=False,
+        strict_map_key=False,
+    )
@@ -0,0 +1,252 @@
+import struct
+import sys
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+
+from .columnar import ParciaisColumns, pack_parciais
+from .errors import CartolaFCError
+from .models import Atleta
+
+if TYPE_CHECKING:
+    from .api import Api
+
+_MAGIC = b"CFCS"
+# Mágica, capacidade de cada slot, versão publicada e, para cada um dos dois slots, a sequência e o tamanho do bloco.
+_HEADER = struct.Struct("<4sIQQQQQ")
+_VERSAO = struct.Struct("<Q")
+_OFFSET_VERSAO = 8
+# Sequência de um slot (seqlock): ímpar enquanto um bloco está sendo escrito, 2 * versão quando ele está completo.
+_SLOT = struct.Struct("<QQ")
+_OFFSET_SLOTS = 16
+_SLOTS = 2
+
+
+def _shared_memory() -> Any:
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        raise CartolaFCError(
+            "A memória compartilhada requer Python 3.8 ou superior (multiprocessing.shared_memory)."
+        )
+    return shared_memory
+
+
+def _offset_slot(capacidade: int, slot: int) -> int:
+    return ((_HEADER.size + 7) & ~7) + slot * capacidade
+
+
+def _sequencia(buf: memoryview, slot: int) -> Tuple[int, int]:
+    return _SLOT.unpack_from(buf, _OFFSET_SLOTS + _SLOT.size * slot)
+
+
+class ParciaisSnapshot(ParciaisColumns):
+    """Parciais lidas diretamente da memória compartilhada, sem cópia (veja cartolafc.columnar.ParciaisColumns).
+
+    O slot lido é reaproveitado pelo publicador duas publicações depois. Como em um seqlock, os valores lidos só
+    correspondem à versão do snapshot se valid ainda for True depois da leitura.
+    """
+
+    def __init__(
+        self, buffer: memoryview, version: int, subscriber: "ParciaisSubscriber"
+    ) -> None:
+        super(ParciaisSnapshot, self).__init__(buffer)
+        self.version = version
+        self._subscriber = subscriber
+
+    @property
+    def valid(self) -> bool:
+        """Se o slot ainda não começou a ser sobrescrito por outra publicação."""
+
+        slot = self.version % _SLOTS
+        return _sequencia(self._subscriber._shm.buf, slot)[0] == 2 * self.version
+
+
+class ParciaisPublisher(object):
+    """Publica as parciais em um bloco de memória compartilhada, para que vários processos (ex.: workers do gunicorn)
+    as leiam sem acessar a API nem manter as próprias instâncias de cartolafc.Atleta.
+
+    A memória tem dois slots: cada publicação é escrita no slot que não está em uso e só então a versão é incrementada.
+    Antes de sobrescrever um slot, o publicador marca a sequência do slot como em andamento, e os leitores
+    (cartolafc.shared.ParciaisSubscriber) verificam a sequência antes e depois da leitura, descartando um bloco que
+    tenha sido sobrescrito no meio dela.
+
+    Exemplo de uso:
+        >>> publisher = ParciaisPublisher("cartolafc-parciais")
+        >>> publisher.publish_from(api)  # A cada atualização, em um único processo
+        >>> # Nos workers:
+        >>> parciais = ParciaisSubscriber("cartolafc-parciais").snapshot()
+        >>> parciais.pontos_of(37656)
+    """
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 1 << 20) -> None:
+        """
+        Args:
+            name (str): Nome da memória compartilhada. Por padrão, um nome aleatório (veja o atributo name).
+            capacity (int): Tamanho máximo, em bytes, de um bloco de parciais.
+        """
+
+        capacidade = (capacity + 7) & ~7
+        self._shm = _shared_memory().SharedMemory(
+            name=name, create=True, size=_offset_slot(capacidade, _SLOTS)
+        )
+        self._capacidade = capacidade
+        self._versao = 0
+        _HEADER.pack_into(self._shm.buf, 0, _MAGIC, capacidade, 0, 0, 0, 0, 0)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def version(self) -> int:
+        return self._versao
+
+    def publish(self, parciais: Mapping[int, Atleta]) -> int:
+        """Escreve as parciais no slot livre e as torna visíveis aos leitores.
+
+        Returns:
+            A versão publicada.
+
+        Raises:
+            cartolafc.CartolaFCError: Se o bloco das parciais for maior que a capacidade da memória.
+        """
+
+        bloco = pack_parciais(parciais)
+        if len(bloco) > self._capacidade:
+            raise CartolaFCError(
+                f"As parciais ocupam {len(bloco)} bytes, mais que a capacidade de {self._capacidade} bytes."
+            )
+
+        versao = self._versao + 1
+        slot = versao % _SLOTS
+        offset_sequencia = _OFFSET_SLOTS + _SLOT.size * slot
+        buf = self._shm.buf
+        _SLOT.pack_into(buf, offset_sequencia, 2 * versao - 1, 0)
+        self._copiar(_offset_slot(self._capacidade, slot), bloco)
+        _SLOT.pack_into(buf, offset_sequencia, 2 * versao, len(bloco))
+        _VERSAO.pack_into(buf, _OFFSET_VERSAO, versao)
+        self._versao = versao
+        return versao
+
+    def _copiar(self, offset: int, bloco: bytes) -> None:
+        self._shm.buf[offset : offset + len(bloco)] = bloco
+
+    def publish_from(self, api: "Api") -> int:
+        """Obtém as parciais com api.parciais() e as publica."""
+
+        return self.publish(api.parciais())
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove a memória compartilhada do sistema. Os leitores já conectados continuam com acesso a ela."""
+
+        self._shm.unlink()
+
+    def __enter__(self) -> "ParciaisPublisher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
+
+
+class ParciaisSubscriber(object):
+    """Lê as parciais publicadas por um cartolafc.shared.ParciaisPublisher, possivelmente em outro processo."""
+
+    def __init__(self, name: str) -> None:
+        shared_memory = _shared_memory()
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            # Sem isso, o resource_tracker remove a memória quando o leitor termina, mesmo sem ser o seu dono.
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+
+        magica, capacidade = _HEADER.unpack_from(self._shm.buf, 0)[:2]
+        if magica != _MAGIC:
+            self._shm.close()
+            raise CartolaFCError(f"A memória {name} não contém parciais publicadas.")
+        self._capacidade = capacidade
+        self._snapshots: "weakref.WeakSet[ParciaisSnapshot]" = weakref.WeakSet()
+
+    @property
+    def version(self) -> int:
+        """Última versão publicada, ou 0 se nada foi publicado ainda."""
+
+        return _VERSAO.unpack_from(self._shm.buf, _OFFSET_VERSAO)[0]
+
+    def snapshot(self) -> Optional[ParciaisSnapshot]:
+        """Retorna as parciais da última versão publicada, sem copiá-las, ou None se nada foi publicado ainda."""
+
+        buf = self._shm.buf
+        while True:
+            versao = self.version
+            if not versao:
+                return None
+            slot = versao % _SLOTS
+            sequencia, tamanho = _sequencia(buf, slot)
+            if sequencia != 2 * versao:
+                # O slot já está sendo sobrescrito por uma publicação mais nova.
+                continue
+            offset = _offset_slot(self._capacidade, slot)
+            try:
+                snapshot = ParciaisSnapshot(
+                    buf[offset : offset + tamanho], versao, self
+                )
+            except (CartolaFCError, ValueError, TypeError):
+                # Cabeçalho do bloco lido pela metade; só é um erro se o slot não tiver sido sobrescrito.
+                if _sequencia(buf, slot)[0] == sequencia:
+                    raise
+                continue
+            if snapshot.valid:
+                self._snapshots.add(snapshot)
+                return snapshot
+            snapshot.release()
+
+    def to_dict(self) -> Dict[int, Atleta]:
+        """Copia a última versão publicada para o mesmo mapa retornado por cartolafc.Api.parciais()."""
+
+        while True:
+            snapshot = self.snapshot()
+            if snapshot is None:
+                return {}
+            parciais = snapshot.to_dict()
+            valido = snapshot.valid
+            snapshot.release()
+            if valido:
+                return parciais
+
+    def wait_for(
+        self, version: int, timeout: Optional[float] = None, interval: float = 0.05
+    ) -> bool:
+        """Aguarda até que a versão publicada seja ao menos version.
+
+        Returns:
+            Se a versão foi publicada antes do timeout.
+        """
+
+        limite = None if timeout is None else time.monotonic() + timeout
+        while self.version < version:
+            if limite is not None and time.monotonic() >= limite:
+                return False
+            time.sleep(interval)
+        return True
+
+    def close(self) -> None:
+        """Libera os snapshots ainda em uso e desconecta da memória compartilhada."""
+
+        for snapshot in list(self._snapshots):
+            snapshot.release()
+        self._snapshots.clear()
+        self._shm.close()
+
+    def __enter__(self) -> "ParciaisSubscriber":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
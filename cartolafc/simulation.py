@@ -0,0 +1,228 @@
+from collections import namedtuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from .errors import CartolaFCError
+from .models import Time
+
+Normal = namedtuple("Normal", ["media", "desvio"])
+"""Pontuação de um atleta com distribuição normal."""
+
+Empirical = namedtuple("Empirical", ["pontos"])
+"""Pontuação de um atleta sorteada entre valores observados (ex.: as pontuações das últimas rodadas)."""
+
+Distribution = Union[Normal, Empirical]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise CartolaFCError(
+            "A simulação requer o pacote numpy: pip install Python-CartolaFC[numpy]"
+        )
+    return numpy
+
+
+class SimulationResult(object):
+    """Resultado de cartolafc.simulation.RoundSimulator.run(). Os arrays seguem a ordem dos times informados."""
+
+    def __init__(
+        self, times: Sequence[Time], cenarios: int, vitorias: Any, posicoes: Any
+    ) -> None:
+        self.times = list(times)
+        self.cenarios = cenarios
+        self.vitorias = vitorias
+        """Quantidade de cenários em que cada time terminou em primeiro."""
+        self.posicoes = posicoes
+        """Matriz (times x posições): quantidade de cenários em que cada time terminou em cada posição. None se a
+        simulação foi executada com ranking=False."""
+
+    def win_probability(self) -> Dict[int, float]:
+        """Um mapa, onde a key é o id do time e o valor é a probabilidade de terminar a rodada em primeiro."""
+
+        return {
+            time.info.id: vitorias / self.cenarios
+            for time, vitorias in zip(self.times, self.vitorias.tolist())
+        }
+
+    def rank_distribution(self) -> Dict[int, List[float]]:
+        """Um mapa, onde a key é o id do time e o valor é a probabilidade de terminar em cada posição (índice 0 é o
+        primeiro lugar)."""
+
+        if self.posicoes is None:
+            raise CartolaFCError("A simulação foi executada sem ranking.")
+        return {
+            time.info.id: (posicoes / self.cenarios).tolist()
+            for time, posicoes in zip(self.times, self.posicoes)
+        }
+
+    def expected_rank(self) -> Dict[int, float]:
+        """Um mapa, onde a key é o id do time e o valor é a posição média (1 é o primeiro lugar)."""
+
+        if self.posicoes is None:
+            raise CartolaFCError("A simulação foi executada sem ranking.")
+        numpy = _numpy()
+        lugares = numpy.arange(1, len(self.times) + 1)
+        medias = self.posicoes @ lugares / self.cenarios
+        return {time.info.id: media for time, media in zip(self.times, medias.tolist())}
+
+
+class RoundSimulator(object):
+    """Simula a pontuação de uma rodada para vários times (ex.: todos os times de uma liga) com o método de Monte Carlo.
+
+    Cada atleta escalado em qualquer um dos times é sorteado uma única vez por cenário, e a pontuação dos times é obtida
+    multiplicando a matriz de pontuações sorteadas (cenários x atletas) pela matriz de escalações (atletas x times), na
+    qual o capitão tem peso 2, como em cartolafc.Api._calculate_parcial. Os cenários são processados em lotes com
+    numpy, que é uma dependência opcional (pip install Python-CartolaFC[numpy]).
+
+    Exemplo de uso:
+        >>> times = [api.time(time_id) for time_id in (471815, 1229470, 2093742)]
+        >>> simulador = RoundSimulator(times, {37656: Normal(8.5, 4.0)}, seed=42)
+        >>> resultado = simulador.run(cenarios=1_000_000)
+        >>> resultado.win_probability()
+    """
+
+    def __init__(
+        self,
+        times: Sequence[Time],
+        distribuicoes: Optional[Mapping[int, Distribution]] = None,
+        desvio: float = 5.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            times (list): Times com os atletas escalados, como retornados por cartolafc.Api.time().
+            distribuicoes (dict): Distribuição da pontuação de cada atleta, pelo id. Os atletas ausentes seguem
+                Normal(atleta.media, desvio).
+            desvio (float): Desvio padrão utilizado para os atletas sem distribuição informada.
+            seed (int): Semente do gerador de números aleatórios, para resultados reproduzíveis.
+
+        Raises:
+            cartolafc.CartolaFCError: Se o pacote numpy não estiver instalado.
+        """
+
+        numpy = _numpy()
+        distribuicoes = distribuicoes or {}
+
+        self._times = list(times)
+        self._rng = numpy.random.default_rng(seed)
+
+        indices: Dict[int, int] = {}
+        atletas: List[Distribution] = []
+        for time in self._times:
+            for atleta in time.atletas:
+                if atleta.id not in indices:
+                    indices[atleta.id] = len(atletas)
+                    atletas.append(
+                        distribuicoes.get(atleta.id)
+                        or Normal(atleta.media or 0.0, desvio)
+                    )
+
+        escalacoes = numpy.zeros((len(atletas), len(self._times)), numpy.float32)
+        for coluna, time in enumerate(self._times):
+            for atleta in time.atletas:
+                escalacoes[indices[atleta.id], coluna] += 2 if atleta.is_capitao else 1
+
+        # A parte normal da pontuação dos times é media @ escalacoes + Z @ (desvio * escalacoes), com Z ~ N(0, 1): o
+        # desvio de cada atleta é aplicado uma única vez na matriz, em vez de em cada cenário sorteado.
+        normais = [i for i, d in enumerate(atletas) if isinstance(d, Normal)]
+        medias = numpy.array([atletas[i].media for i in normais], numpy.float32)
+        desvios = numpy.array([atletas[i].desvio for i in normais], numpy.float32)
+        self._base = medias @ escalacoes[normais]
+        self._normais = desvios[:, None] * escalacoes[normais]
+
+        empiricas = [i for i, d in enumerate(atletas) if isinstance(d, Empirical)]
+        self._empiricas = escalacoes[empiricas]
+        self._pontos_empiricos = [
+            numpy.asarray(atletas[i].pontos, dtype=numpy.float32) for i in empiricas
+        ]
+
+    def _sortear_empiricas(self, quantidade: int) -> Any:
+        numpy = _numpy()
+        pontuacoes = numpy.empty(
+            (quantidade, len(self._pontos_empiricos)), numpy.float32
+        )
+        for coluna, pontos in enumerate(self._pontos_empiricos):
+            pontuacoes[:, coluna] = pontos[
+                self._rng.integers(0, len(pontos), size=quantidade)
+            ]
+        return pontuacoes @ self._empiricas
+
+    def _sortear(self, quantidade: int) -> Any:
+        """Sorteia a pontuação dos times em `quantidade` cenários (cenários x times).
+
+        Usa variáveis antitéticas: para cada sorteio Z da parte normal, o cenário com -Z também é utilizado. Como a
+        pontuação é linear em Z, o segundo cenário sai sem custo (2 * base - primeiro), o que reduz pela metade os
+        sorteios e as multiplicações de matrizes, além de reduzir a variância das estimativas.
+        """
+
+        numpy = _numpy()
+        metade = (quantidade + 1) // 2
+        sorteio = self._rng.standard_normal(
+            (metade, len(self._normais)), dtype=numpy.float32
+        )
+        variacao = sorteio @ self._normais
+        pontos = numpy.concatenate((self._base + variacao, self._base - variacao))[
+            :quantidade
+        ]
+        if self._pontos_empiricos:
+            pontos += self._sortear_empiricas(quantidade)
+        return pontos
+
+    def run(
+        self, cenarios: int = 100_000, batch_size: int = 10_000, ranking: bool = True
+    ) -> SimulationResult:
+        """Executa a simulação.
+
+        Args:
+            cenarios (int): Quantidade de cenários (rodadas) sorteados.
+            batch_size (int): Quantidade de cenários processados de cada vez. Limita a memória utilizada.
+            ranking (bool): Se a distribuição das posições de cada time deve ser calculada. Ordenar os times em cada
+                cenário é a etapa mais cara da simulação; sem ela, apenas as vitórias são contadas.
+
+        Returns:
+            Uma instância de cartolafc.simulation.SimulationResult.
+        """
+
+        numpy = _numpy()
+        quantidade_times = len(self._times)
+        vitorias = numpy.zeros(quantidade_times, numpy.int64)
+        posicoes = (
+            numpy.zeros(quantidade_times * quantidade_times, numpy.int64)
+            if ranking
+            else None
+        )
+        lugares = numpy.arange(quantidade_times)
+
+        restantes = cenarios
+        while restantes > 0 and quantidade_times:
+            lote = min(batch_size, restantes)
+            restantes -= lote
+
+            pontos = self._sortear(lote)
+            if ranking:
+                ordem = numpy.argsort(-pontos, axis=1)
+                vitorias += numpy.bincount(ordem[:, 0], minlength=quantidade_times)
+                posicoes += numpy.bincount(
+                    (ordem * quantidade_times + lugares).ravel(),
+                    minlength=quantidade_times * quantidade_times,
+                )
+            else:
+                vitorias += numpy.bincount(
+                    pontos.argmax(axis=1), minlength=quantidade_times
+                )
+
+        if posicoes is not None:
+            posicoes = posicoes.reshape(quantidade_times, quantidade_times)
+        return SimulationResult(self._times, cenarios, vitorias, posicoes)
+
+
+def simulate_round(
+    times: Sequence[Time],
+    distribuicoes: Optional[Mapping[int, Distribution]] = None,
+    cenarios: int = 100_000,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Atalho para uma única simulação com um cartolafc.simulation.RoundSimulator temporário."""
+
+    return RoundSimulator(times, distribuicoes, seed=seed).run(cenarios)
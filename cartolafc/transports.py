@@ -0,0 +1,328 @@
+import gzip
+import json
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .errors import CartolaFCError
+
+Response = namedtuple("Response", ["status_code", "content", "headers"])
+Params = Optional[Mapping[str, Any]]
+
+
+def request_key(url: str, params: Params = None) -> str:
+    """Chave de uma requisição, independente do host, para que um arquivo gravado possa ser servido por qualquer
+    endereço (ex.: o servidor real ou um servidor local)."""
+
+    key = urlsplit(url).path
+    if params:
+        key += "?" + urlencode(sorted(params.items()))
+    return key
+
+
+class Transport(object):
+    """Camada de transporte utilizada pela cartolafc.Api para executar as requisições HTTP GET"""
+
+    def get(self, url: str, params: Params = None) -> Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """Transporte padrão, que executa as requisições com a biblioteca requests.
+
+    Como uma requests.Session não é thread-safe, cada thread utiliza a sua própria sessão, criada no primeiro uso,
+    que mantém as conexões abertas entre as requisições da thread. Assim, uma única instância (e a cartolafc.Api que
+    a utiliza) pode ser compartilhada por todas as threads de um pool.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Referências fracas: as sessões das threads encerradas são descartadas junto com a thread.
+        self._sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+
+    def _session(self) -> Any:
+        # Um processo criado com fork herda a sessão da thread que o criou, mas não pode usar as mesmas conexões.
+        session = getattr(self._local, "session", None)
+        if session is None or self._local.pid != os.getpid():
+            import requests
+
+            session = self._local.session = requests.Session()
+            self._local.pid = os.getpid()
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def get(self, url: str, params: Params = None) -> Response:
+        response = self._session().get(url, params=params)
+        return Response(response.status_code, response.content, response.headers)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+
+def _httpx() -> Any:
+    try:
+        import httpx
+    except ImportError:
+        raise CartolaFCError(
+            "O transporte HTTP/2 requer o pacote httpx: pip install Python-CartolaFC[http2]"
+        )
+    return httpx
+
+
+class HttpxTransport(Transport):
+    """Transporte que executa as requisições com a biblioteca httpx, por padrão em HTTP/2.
+
+    Com HTTP/2, as requisições simultâneas (ex.: de várias threads obtendo times) são multiplexadas em poucas conexões
+    com o servidor, com os cabeçalhos comprimidos (HPACK), em vez de uma conexão por requisição em andamento. As
+    requisições são executadas por um httpx.AsyncClient em um event loop próprio, em segundo plano, de modo que o
+    transporte pode ser compartilhado por todas as threads da mesma cartolafc.Api.
+
+    Exemplo de uso:
+        >>> with HttpxTransport(http2=True, max_connections=2) as transport:
+        ...     api = cartolafc.Api(transport=transport)
+        ...     with ThreadPoolExecutor(64) as executor:
+        ...         times = list(executor.map(api.time, time_ids))
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: Optional[int] = 4,
+        timeout: Optional[float] = 30.0,
+        prior_knowledge: bool = False,
+    ) -> None:
+        """
+        Args:
+            http2 (bool): Se o HTTP/2 deve ser negociado com o servidor (via ALPN, em HTTPS).
+            max_connections (int): Quantidade máxima de conexões abertas. None para não limitar.
+            timeout (float): Tempo máximo, em segundos, de cada etapa de uma requisição.
+            prior_knowledge (bool): Utiliza HTTP/2 sem negociação, inclusive sem TLS (ex.: um servidor local h2c).
+        """
+
+        import asyncio
+
+        httpx = _httpx()
+        # O httpx.Client síncrono, compartilhado entre threads, pode abrir streams HTTP/2 fora de ordem, o que o
+        # servidor trata como erro de protocolo. No event loop, os streams de uma conexão são abertos em sequência.
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+        async def criar() -> Any:
+            return httpx.AsyncClient(
+                http1=not prior_knowledge,
+                http2=http2 or prior_knowledge,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=timeout,
+            )
+
+        self._client = self._executar(criar())
+
+    def _executar(self, coro: Any) -> Any:
+        import asyncio
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get(self, url: str, params: Params = None) -> Response:
+        response = self._executar(self._client.get(url, params=params))
+        return Response(response.status_code, response.content, response.headers)
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._executar(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class RecordingTransport(Transport):
+    """Transporte que repassa as requisições a outro transporte e grava cada resposta em um arquivo.
+
+    O arquivo é um stream gzip de registros, cada um composto por uma linha JSON com a URL, os parâmetros, o status,
+    o instante (em segundos desde o início da gravação) e a duração da requisição, seguida do corpo da resposta.
+
+    Exemplo de uso:
+        >>> with RecordingTransport("fechamento.cartola.gz") as transport:
+        ...     api = cartolafc.Api(transport=transport)
+        ...     api.parciais()
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None) -> None:
+        """
+        Args:
+            path (str): Caminho do arquivo onde as respostas serão gravadas.
+            transport (cartolafc.transports.Transport): Transporte que executará as requisições. Se não for
+                informado, será utilizado o cartolafc.transports.RequestsTransport.
+        """
+
+        self._transport = transport or RequestsTransport()
+        self._file = gzip.open(path, "wb")
+        self._lock = threading.Lock()
+        self._inicio = time.monotonic()
+
+    def get(self, url: str, params: Params = None) -> Response:
+        inicio = time.monotonic()
+        response = self._transport.get(url, params=params)
+        elapsed = time.monotonic() - inicio
+
+        cabecalho = dict(
+            url=url,
+            params=dict(params) if params else None,
+            status=response.status_code,
+            content_type=(response.headers or {}).get("Content-Type"),
+            t=inicio - self._inicio,
+            elapsed=elapsed,
+            size=len(response.content),
+        )
+        linha = json.dumps(cabecalho, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._file.write(linha + b"\n" + response.content)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self._transport.close()
+
+
+class Recording(object):
+    """Uma requisição gravada por cartolafc.transports.RecordingTransport"""
+
+    __slots__ = ("url", "params", "status", "content_type", "t", "elapsed", "content")
+
+    def __init__(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        status: int,
+        content_type: Optional[str],
+        t: float,
+        elapsed: float,
+        content: bytes,
+    ) -> None:
+        self.url = url
+        self.params = params
+        self.status = status
+        self.content_type = content_type
+        self.t = t
+        self.elapsed = elapsed
+        self.content = content
+
+
+def read_recordings(path: str) -> Iterator[Recording]:
+    """Lê, em ordem, as requisições gravadas em um arquivo por cartolafc.transports.RecordingTransport."""
+
+    with gzip.open(path, "rb") as f:
+        while True:
+            linha = f.readline()
+            if not linha:
+                return
+            cabecalho = json.loads(linha)
+            content = f.read(cabecalho.pop("size"))
+            yield Recording(content=content, **cabecalho)
+
+
+class ReplayTransport(Transport):
+    """Transporte que serve as respostas gravadas por cartolafc.transports.RecordingTransport, sem acesso à rede.
+
+    Com speed=None as respostas são servidas na velocidade máxima: cada requisição recebe a próxima resposta gravada
+    para a mesma URL, repetindo a última quando as gravações acabam. Com uma velocidade (1.0 para a original, 10.0
+    para dez vezes mais rápido), o relógio da gravação é reproduzido: cada requisição recebe a resposta que era a
+    mais recente naquele instante da gravação, e a latência original é simulada, dividida pela velocidade.
+
+    Exemplo de uso:
+        >>> api = cartolafc.Api(transport=ReplayTransport("fechamento.cartola.gz", speed=10))
+        >>> api.parciais()
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = None) -> None:
+        self._speed = speed
+        self._gravacoes: Dict[str, List[Recording]] = defaultdict(list)
+        for gravacao in read_recordings(path):
+            self._gravacoes[request_key(gravacao.url, gravacao.params)].append(gravacao)
+        self._instantes = {
+            key: [gravacao.t for gravacao in gravacoes]
+            for key, gravacoes in self._gravacoes.items()
+        }
+        self._proximas: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._inicio = time.monotonic()
+
+    def __len__(self) -> int:
+        return sum(len(gravacoes) for gravacoes in self._gravacoes.values())
+
+    def restart(self) -> None:
+        """Reinicia o relógio e a ordem da reprodução."""
+
+        with self._lock:
+            self._proximas.clear()
+            self._inicio = time.monotonic()
+
+    def get(self, url: str, params: Params = None) -> Response:
+        key = request_key(url, params)
+        gravacoes = self._gravacoes.get(key)
+        if not gravacoes:
+            raise CartolaFCError(f"Nenhuma resposta gravada para {key}")
+
+        if self._speed:
+            agora = (time.monotonic() - self._inicio) * self._speed
+            indice = max(bisect_right(self._instantes[key], agora) - 1, 0)
+            gravacao = gravacoes[indice]
+            time.sleep(gravacao.elapsed / self._speed)
+        else:
+            with self._lock:
+                indice = self._proximas[key]
+                self._proximas[key] = indice + 1
+            gravacao = gravacoes[min(indice, len(gravacoes) - 1)]
+
+        headers = (
+            {"Content-Type": gravacao.content_type} if gravacao.content_type else {}
+        )
+        return Response(gravacao.status, gravacao.content, headers)
+
+    def schedule(self) -> List[Tuple[float, str, Optional[Dict[str, Any]]]]:
+        """Retorna a sequência de requisições gravadas, como (instante, url, params), com o instante já dividido
+        pela velocidade da reprodução. Útil para um gerador de carga reproduzir o mesmo padrão de acesso.
+        """
+
+        speed = self._speed or float("inf")
+        todas = sorted(
+            (
+                gravacao
+                for gravacoes in self._gravacoes.values()
+                for gravacao in gravacoes
+            ),
+            key=lambda g: g.t,
+        )
+        return [(g.t / speed, g.url, g.params) for g in todas]
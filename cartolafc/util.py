@@ -1,9 +1,33 @@
 import datetime
 import json
 import logging
-from typing import Any
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
-from .errors import CartolaFCError, CartolaFCGameOverError, CartolaFCOverloadError
+from .errors import (
+    CartolaFCError,
+    CartolaFCGameOverError,
+    CartolaFCHTTPError,
+    CartolaFCMalformedResponseError,
+    CartolaFCOverloadError,
+)
+from .scout import Scout
+
+logger = logging.getLogger(__name__)
+
+MENSAGEM_SOBRECARGA = (
+    "Globo.com - Desculpe-nos, nossos servidores estão sobrecarregados."
+)
+STATUS_SOBRECARGA = frozenset((429, 502, 503, 504))
+"""Status HTTP que indicam sobrecarga, e cuja requisição pode ser repetida."""
+PREVIEW_SIZE = 200
+"""Quantidade máxima de caracteres do corpo de uma resposta inválida incluída nos erros e nos logs."""
+
+# Início de um documento JSON (objeto ou lista), verificado sem copiar nem percorrer o restante do corpo.
+_INICIO_JSON = re.compile(r"\s*[\[{]")
+_INICIO_JSON_BYTES = re.compile(rb"\s*[\[{]")
 
 
 def json_default(value: Any) -> dict:
@@ -18,26 +42,169 @@ def json_default(value: Any) -> dict:
             microsecond=value.microsecond,
             tzinfo=value.tzinfo,
         )
+    if isinstance(value, Scout):
+        return dict(value)
     return value.__dict__
 
 
-def parse_and_check_cartolafc(json_data: str) -> dict:
+class RateLimitedLog(object):
+    """Registra no máximo uma mensagem por chave (ex.: o tipo de erro) a cada interval segundos, e informa na
+    mensagem seguinte quantas foram suprimidas. Assim, uma sequência de respostas inválidas durante uma instabilidade
+    custa apenas uma consulta a um dicionário por erro."""
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        log: Optional[logging.Logger] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self._logger = log or logger
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._chaves: Dict[Any, Tuple[float, int]] = {}
+
+    def log(self, level: int, chave: Any, mensagem: str, *args: Any) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        agora = self._clock()
+        with self._lock:
+            ultimo, suprimidas = self._chaves.get(chave, (None, 0))
+            if ultimo is not None and agora - ultimo < self.interval:
+                self._chaves[chave] = (ultimo, suprimidas + 1)
+                return
+            self._chaves[chave] = (agora, 0)
+        if suprimidas:
+            mensagem += " (%d ocorrências suprimidas)"
+            args += (suprimidas,)
+        self._logger.log(level, mensagem, *args)
+
+
+error_log = RateLimitedLog()
+"""Log dos erros de parse_and_check_cartolafc(). O intervalo pode ser alterado em error_log.interval."""
+
+
+def _previa(json_data: Union[str, bytes]) -> str:
+    previa = json_data[:PREVIEW_SIZE]
+    if isinstance(previa, bytes):
+        previa = previa.decode("utf-8", "replace")
+    return " ".join(previa.split())
+
+
+def _erro(
+    classe: Type[CartolaFCError],
+    mensagem: str,
+    json_data: Union[str, bytes],
+    status_code: Optional[int],
+    content_type: Optional[str],
+) -> CartolaFCError:
+    erro = classe(
+        mensagem,
+        status_code=status_code,
+        content_type=content_type,
+        size=len(json_data),
+        preview=_previa(json_data),
+    )
+    error_log.log(
+        logging.ERROR,
+        (classe, status_code),
+        "%s (HTTP %s, %s, %d bytes): %r",
+        mensagem,
+        status_code,
+        content_type,
+        erro.size,
+        erro.preview,
+    )
+    return erro
+
+
+def parse_and_check_cartolafc(
+    json_data: Union[str, bytes],
+    status_code: Optional[int] = None,
+    content_type: Optional[str] = None,
+) -> dict:
+    """Decodifica o corpo de uma resposta da API e verifica se ele representa um erro.
+
+    As respostas inválidas são classificadas sem decodificar o corpo inteiro: o status HTTP, o Content-Type e apenas
+    o início do corpo são incluídos no erro e no log, que é limitado por cartolafc.util.error_log.
+
+    Args:
+        json_data (str | bytes): Corpo da resposta.
+        status_code (int): Status HTTP da resposta, se conhecido.
+        content_type (str): Content-Type da resposta, se conhecido.
+
+    Raises:
+        cartolafc.CartolaFCOverloadError: Se o status indicar sobrecarga, ou se a resposta não for um JSON (ex.: a
+            página de sobrecarga da Globo.com).
+        cartolafc.CartolaFCMalformedResponseError: Se a resposta parecer um JSON, mas for inválida (ex.: truncada).
+        cartolafc.CartolaFCHTTPError: Se o status for de erro (ex.: 404), com a mensagem da API, se houver.
+        cartolafc.CartolaFCGameOverError: Se o jogo tiver terminado.
+        cartolafc.CartolaFCError: Se a API responder com uma mensagem de erro.
+    """
+
+    if status_code in STATUS_SOBRECARGA:
+        raise _erro(
+            CartolaFCOverloadError,
+            MENSAGEM_SOBRECARGA,
+            json_data,
+            status_code,
+            content_type,
+        )
+    erro_http = status_code is not None and not 200 <= status_code < 300
+
+    inicio = _INICIO_JSON_BYTES if isinstance(json_data, bytes) else _INICIO_JSON
+    if not inicio.match(json_data):
+        if erro_http:
+            raise _erro(
+                CartolaFCHTTPError,
+                f"Erro HTTP {status_code}",
+                json_data,
+                status_code,
+                content_type,
+            )
+        raise _erro(
+            CartolaFCOverloadError,
+            MENSAGEM_SOBRECARGA,
+            json_data,
+            status_code,
+            content_type,
+        )
+
     try:
         data = json.loads(json_data)
-        if "game_over" in data and data["game_over"]:
-            logging.info(
-                "Desculpe-nos, o jogo acabou e não podemos obter os dados solicitados"
+    except ValueError:
+        raise _erro(
+            CartolaFCMalformedResponseError,
+            f"{MENSAGEM_SOBRECARGA} Resposta inválida.",
+            json_data,
+            status_code,
+            content_type,
+        ) from None
+
+    if isinstance(data, dict):
+        if data.get("game_over"):
+            error_log.log(
+                logging.INFO,
+                CartolaFCGameOverError,
+                "Desculpe-nos, o jogo acabou e não podemos obter os dados solicitados",
             )
             raise CartolaFCGameOverError(
                 "Desculpe-nos, o jogo acabou e não podemos obter os dados solicitados"
             )
-        if "mensagem" in data and data["mensagem"]:
-            logging.error(data["mensagem"])
-            raise CartolaFCError(data["mensagem"].encode("utf-8"))
-        return data
-    except ValueError as error:
-        logging.error("Error parsing and checking json data: %s", json_data)
-        logging.error(error)
-        raise CartolaFCOverloadError(
-            "Globo.com - Desculpe-nos, nossos servidores estão sobrecarregados."
+        mensagem = data.get("mensagem")
+        if mensagem and erro_http:
+            raise _erro(
+                CartolaFCHTTPError, mensagem, json_data, status_code, content_type
+            )
+        if mensagem:
+            error_log.log(logging.ERROR, CartolaFCError, mensagem)
+            raise CartolaFCError(mensagem.encode("utf-8"))
+    if erro_http:
+        raise _erro(
+            CartolaFCHTTPError,
+            f"Erro HTTP {status_code}",
+            json_data,
+            status_code,
+            content_type,
         )
+    return data
@@ -0,0 +1,329 @@
+import struct
+from collections import OrderedDict, namedtuple
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .columnar import ParciaisColumns, pack_parciais
+from .errors import CartolaFCError
+from .models import Atleta, Clube
+from .scout import SCOUTS, Scout
+
+_MAGIC = b"CFCW"
+_HEADER = struct.Struct("<4sBBII")
+_COMPLETO, _DELTA = 0, 1
+_PONTOS_FLOAT64 = 1
+
+# Campos presentes em cada registro de atleta.
+_PONTOS, _SCOUT, _STATUS, _META = 1, 2, 4, 8
+_TODOS = _PONTOS | _SCOUT | _STATUS | _META
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_REGISTRO = struct.Struct("<IB")
+_CENTESIMOS = struct.Struct("<i")
+_FLOAT64 = struct.Struct("<d")
+_SCOUT_ITEM = struct.Struct("<Bh")
+_META_ITEM = struct.Struct("<HB")
+_SEM_CLUBE = Clube(0, "Sem Clube", "Sem Clube")
+
+WireSnapshot = namedtuple("WireSnapshot", ["version", "parciais"])
+"""Parciais decodificadas (o mesmo mapa retornado por cartolafc.Api.parciais()) e a versão do snapshot."""
+
+
+def _centesimos(pontos: float) -> Optional[int]:
+    # Tolera o erro de arredondamento de somas como 2.9 + 1.5, mas não valores com mais de duas casas decimais.
+    centesimos = round(pontos * 100)
+    return centesimos if abs(centesimos / 100 - pontos) < 1e-9 else None
+
+
+def _status_id(atleta: Atleta) -> int:
+    return atleta.status.id if atleta.status else 0
+
+
+def _texto(valor: str) -> bytes:
+    codificado = valor.encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+    return _U8.pack(len(codificado)) + codificado
+
+
+def _mudancas(anterior: Optional[Atleta], atleta: Atleta) -> int:
+    if anterior is None:
+        return _TODOS
+    campos = 0
+    if (anterior.pontos or 0.0) != (atleta.pontos or 0.0):
+        campos |= _PONTOS
+    if anterior.scout != atleta.scout:
+        campos |= _SCOUT
+    if _status_id(anterior) != _status_id(atleta):
+        campos |= _STATUS
+    if (anterior.apelido, anterior.clube.id, anterior.posicao.id) != (
+        atleta.apelido,
+        atleta.clube.id,
+        atleta.posicao.id,
+    ):
+        campos |= _META
+    return campos
+
+
+def _encode(
+    tipo: int,
+    version: int,
+    base_version: int,
+    registros: List[Tuple[Atleta, int]],
+    removidos: List[int],
+) -> bytes:
+    flags = 0
+    if any(
+        _centesimos(atleta.pontos or 0.0) is None
+        for atleta, campos in registros
+        if campos & _PONTOS
+    ):
+        flags |= _PONTOS_FLOAT64
+
+    clubes = {
+        atleta.clube.id: atleta.clube
+        for atleta, campos in registros
+        if campos & _META and atleta.clube.id
+    }
+    partes = [_HEADER.pack(_MAGIC, tipo, flags, version, base_version)]
+    partes.append(_U16.pack(len(clubes)))
+    for clube in clubes.values():
+        partes.append(_U16.pack(clube.id))
+        partes.append(_texto(clube.nome))
+        partes.append(_texto(clube.abreviacao))
+
+    partes.append(_U32.pack(len(removidos)))
+    partes.append(struct.pack(f"<{len(removidos)}I", *removidos))
+
+    partes.append(_U32.pack(len(registros)))
+    for atleta, campos in registros:
+        partes.append(_REGISTRO.pack(atleta.id, campos))
+        if campos & _PONTOS:
+            pontos = atleta.pontos or 0.0
+            if flags & _PONTOS_FLOAT64:
+                partes.append(_FLOAT64.pack(pontos))
+            else:
+                partes.append(_CENTESIMOS.pack(_centesimos(pontos)))
+        if campos & _SCOUT:
+            quantidades = [
+                (indice, quantidade)
+                for indice, quantidade in enumerate(atleta.scout.values_array)
+                if quantidade
+            ]
+            partes.append(_U8.pack(len(quantidades)))
+            for indice, quantidade in quantidades:
+                partes.append(_SCOUT_ITEM.pack(indice, quantidade))
+        if campos & _STATUS:
+            partes.append(_U8.pack(_status_id(atleta)))
+        if campos & _META:
+            partes.append(_META_ITEM.pack(atleta.clube.id, atleta.posicao.id))
+            partes.append(_texto(atleta.apelido))
+    return b"".join(partes)
+
+
+def encode_snapshot(parciais: Mapping[int, Atleta], version: int = 0) -> bytes:
+    """Codifica as parciais (como retornadas por cartolafc.Api.parciais()) em um snapshot binário completo.
+
+    Cada atleta ocupa um registro com o id, os pontos (em centésimos, ou em float64 se algum valor exigir), apenas
+    os scouts diferentes de zero, o status, o clube, a posição e o apelido. Os clubes são enviados uma única vez.
+    Assim como em cartolafc.columnar, scouts com códigos desconhecidos (Scout.extras) não são incluídos.
+
+    Args:
+        parciais (dict): Parciais a serem codificadas.
+        version (int): Versão do snapshot, utilizada como base para os deltas seguintes.
+    """
+
+    registros = [(parciais[atleta_id], _TODOS) for atleta_id in sorted(parciais)]
+    return _encode(_COMPLETO, version, 0, registros, [])
+
+
+def encode_delta(
+    base: Mapping[int, Atleta],
+    parciais: Mapping[int, Atleta],
+    version: int,
+    base_version: int,
+) -> bytes:
+    """Codifica apenas o que mudou nas parciais em relação a um snapshot anterior: os atletas removidos e, dos
+    atletas novos ou alterados, somente os campos que mudaram.
+
+    Args:
+        base (dict): Parciais do snapshot anterior, já conhecido por quem vai decodificar o delta.
+        parciais (dict): Parciais atuais.
+        version (int): Versão das parciais atuais.
+        base_version (int): Versão do snapshot anterior.
+    """
+
+    registros = []
+    for atleta_id in sorted(parciais):
+        atleta = parciais[atleta_id]
+        campos = _mudancas(base.get(atleta_id), atleta)
+        if campos:
+            registros.append((atleta, campos))
+    removidos = sorted(atleta_id for atleta_id in base if atleta_id not in parciais)
+    return _encode(_DELTA, version, base_version, registros, removidos)
+
+
+def decode_snapshot(data: bytes, base: Optional[WireSnapshot] = None) -> WireSnapshot:
+    """Decodifica um snapshot completo, ou aplica um delta sobre o snapshot base.
+
+    Raises:
+        cartolafc.CartolaFCError: Se os dados forem inválidos, ou se um delta não corresponder à versão do snapshot
+            base (nesse caso, é necessário obter um novo snapshot completo).
+    """
+
+    try:
+        magic, tipo, flags, version, base_version = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise CartolaFCError("Snapshot inválido.")
+    if magic != _MAGIC or tipo not in (_COMPLETO, _DELTA):
+        raise CartolaFCError("Snapshot inválido.")
+
+    parciais: Dict[int, Atleta] = {}
+    clubes: Dict[int, Clube] = {}
+    if tipo == _DELTA:
+        if base is None or base.version != base_version:
+            raise CartolaFCError(
+                f"O delta requer o snapshot {base_version}, e não "
+                f"{None if base is None else base.version}."
+            )
+        parciais = dict(base.parciais)
+        clubes = {atleta.clube.id: atleta.clube for atleta in parciais.values()}
+
+    try:
+        _decode(data, flags, parciais, clubes)
+    except (struct.error, KeyError, IndexError, UnicodeDecodeError):
+        raise CartolaFCError("Snapshot inválido.")
+    return WireSnapshot(version, parciais)
+
+
+def _decode(
+    data: bytes, flags: int, parciais: Dict[int, Atleta], clubes: Dict[int, Clube]
+) -> None:
+    view = memoryview(data)
+    offset = _HEADER.size
+
+    def texto() -> str:
+        nonlocal offset
+        tamanho = view[offset]
+        inicio, offset = offset + 1, offset + 1 + tamanho
+        return str(view[inicio:offset], "utf-8")
+
+    (quantidade,) = _U16.unpack_from(view, offset)
+    offset += _U16.size
+    for _ in range(quantidade):
+        (clube_id,) = _U16.unpack_from(view, offset)
+        offset += _U16.size
+        clubes[clube_id] = Clube(clube_id, texto(), texto())
+
+    (quantidade,) = _U32.unpack_from(view, offset)
+    offset += _U32.size
+    for atleta_id in struct.unpack_from(f"<{quantidade}I", view, offset):
+        parciais.pop(atleta_id, None)
+    offset += 4 * quantidade
+
+    pontos_struct = _FLOAT64 if flags & _PONTOS_FLOAT64 else _CENTESIMOS
+    (quantidade,) = _U32.unpack_from(view, offset)
+    offset += _U32.size
+    for _ in range(quantidade):
+        atleta_id, campos = _REGISTRO.unpack_from(view, offset)
+        offset += _REGISTRO.size
+        anterior = parciais.get(atleta_id)
+        if anterior is None and campos != _TODOS:
+            raise KeyError(atleta_id)
+
+        if campos & _PONTOS:
+            (pontos,) = pontos_struct.unpack_from(view, offset)
+            offset += pontos_struct.size
+            if pontos_struct is _CENTESIMOS:
+                pontos /= 100
+        else:
+            pontos = anterior.pontos
+        if campos & _SCOUT:
+            valores = [0] * len(SCOUTS)
+            for _ in range(view[offset]):
+                indice, valor = _SCOUT_ITEM.unpack_from(view, offset + 1)
+                valores[indice] = valor
+                offset += _SCOUT_ITEM.size
+            offset += 1
+            scout = Scout.from_values(valores)
+        else:
+            scout = anterior.scout
+        if campos & _STATUS:
+            status_id = view[offset] or None
+            offset += 1
+        else:
+            status_id = _status_id(anterior) or None
+        if campos & _META:
+            clube_id, posicao_id = _META_ITEM.unpack_from(view, offset)
+            offset += _META_ITEM.size
+            apelido = texto()
+            clube = clubes.get(clube_id, _SEM_CLUBE)
+        else:
+            apelido, clube, posicao_id = (
+                anterior.apelido,
+                anterior.clube,
+                anterior.posicao.id,
+            )
+
+        parciais[atleta_id] = Atleta(
+            atleta_id, apelido, pontos, scout, posicao_id, clube, status_id
+        )
+
+
+def decode_columns(data: bytes, base: Optional[WireSnapshot] = None) -> ParciaisColumns:
+    """Decodifica um snapshot, ou aplica um delta, diretamente na forma colunar de cartolafc.columnar."""
+
+    return ParciaisColumns(pack_parciais(decode_snapshot(data, base).parciais))
+
+
+class SnapshotEncoder(object):
+    """Mantém as últimas versões das parciais publicadas e codifica, para cada consumidor, o delta a partir da
+    versão que ele já possui, ou um snapshot completo se essa versão não for mais conhecida.
+
+    Exemplo de uso:
+        >>> encoder = SnapshotEncoder()
+        >>> encoder.update(api.parciais())
+        1
+        >>> payload = encoder.encode(since=versao_do_consumidor)
+    """
+
+    def __init__(self, history: int = 16) -> None:
+        """
+        Args:
+            history (int): Quantidade de versões anteriores mantidas como base para os deltas.
+        """
+
+        self._history = max(history, 1)
+        self._versoes: "OrderedDict[int, Dict[int, Atleta]]" = OrderedDict()
+        self.version = 0
+
+    def update(self, parciais: Mapping[int, Atleta]) -> int:
+        """Registra uma nova versão das parciais, se forem diferentes da última, e retorna a versão atual."""
+
+        atual = self._versoes.get(self.version)
+        if (
+            atual is not None
+            and len(atual) == len(parciais)
+            and not any(
+                _mudancas(atual.get(atleta_id), atleta)
+                for atleta_id, atleta in parciais.items()
+            )
+        ):
+            return self.version
+
+        self.version += 1
+        self._versoes[self.version] = dict(parciais)
+        while len(self._versoes) > self._history:
+            self._versoes.popitem(last=False)
+        return self.version
+
+    def encode(self, since: Optional[int] = None) -> bytes:
+        """Codifica a versão atual: um delta desde a versão since, se ela ainda for conhecida, ou o snapshot
+        completo."""
+
+        atual = self._versoes.get(self.version)
+        if atual is None:
+            raise CartolaFCError("Nenhuma versão das parciais foi registrada.")
+        base = self._versoes.get(since) if since is not None else None
+        if base is None:
+            return encode_snapshot(atual, self.version)
+        return encode_delta(base, atual, self.version, since)
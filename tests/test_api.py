@@ -64,6 +64,29 @@ class ApiAttemptsTest(unittest.TestCase):
             with self.assertRaisesRegex(cartolafc.CartolaFCError, error_message):
                 api.mercado()
 
+    def test_api_attempts_com_erros_http(self):
+        # Arrange
+        with requests_mock.mock() as m:
+            api = cartolafc.Api(attempts=3)
+            url = f"{api._api_url}/time/id/123"
+            m.get(url, status_code=404, json={"mensagem": "Time inexistente"})
+            mercado = m.get(
+                f"{api._api_url}/mercado/status",
+                response_list=[
+                    dict(status_code=503, text="<html>Sobrecarga</html>"),
+                    dict(status_code=codes.ok, text='{"rodada_atual": '),
+                    dict(status_code=codes.ok, text='{"rodada_atual": '),
+                ],
+            )
+
+            # Act and Assert
+            with self.assertRaisesRegex(cartolafc.CartolaFCHTTPError, "inexistente"):
+                api.time(123)
+            self.assertEqual(m.call_count, 1)
+            with self.assertRaises(cartolafc.CartolaFCMalformedResponseError):
+                api.mercado()
+            self.assertEqual(mercado.call_count, 3)
+
 
 class ApiTest(unittest.TestCase):
     with open("tests/testdata/clubes.json", "rb") as f:
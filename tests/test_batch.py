@@ -0,0 +1,109 @@
+import json
+import unittest
+
+import cartolafc
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc.batch import TimeCompacto, TimeParser, parse_times
+from cartolafc.models import Clube, Time
+
+
+class TimeParserTest(unittest.TestCase):
+    with open("tests/testdata/clubes.json", "rb") as f:
+        CLUBES = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/parciais.json", "rb") as f:
+        PARCIAIS = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/time.json", "rb") as f:
+        TIME = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        self.clubes = {
+            int(clube_id): Clube.from_dict(clube)
+            for clube_id, clube in self.CLUBES.items()
+        }
+        atletas = [
+            dict(atleta, atleta_id=int(atleta_id), status_id=7)
+            for atleta_id, atleta in list(self.PARCIAIS["atletas"].items())[:12]
+        ]
+        self.data = dict(self.TIME, atletas=atletas, capitao_id=atletas[0]["atleta_id"])
+        self.payload = json.dumps(self.data).encode("utf-8")
+
+    def test_parse_times_equivalente_ao_from_dict(self):
+        # Arrange
+        esperado = Time.from_dict(
+            json.loads(self.payload),
+            clubes=self.clubes,
+            capitao=self.data["capitao_id"],
+        )
+
+        # Act
+        times = parse_times([self.payload] * 3, self.clubes, workers=0)
+
+        # Assert
+        self.assertEqual(len(times), 3)
+        self.assertIsInstance(times[0], Time)
+        self.assertEqual(repr(times[0]), repr(esperado))
+        self.assertIs(
+            times[0].atletas[0].clube, self.clubes[times[0].atletas[0].clube.id]
+        )
+
+    def test_parse_times_campos_dos_atletas(self):
+        # Arrange
+        dados = SyntheticCartola(times=1)
+        payload = dados.routes().get(f"/time/id/{dados.time_ids[0]}")
+        data = json.loads(payload)
+        clubes = {
+            clube.id: clube for clube in map(Clube.from_dict, dados.clubes().values())
+        }
+        esperado = Time.from_dict(data, clubes=clubes, capitao=data["capitao_id"])
+
+        # Act
+        time = parse_times([payload], clubes, workers=0)[0]
+
+        # Assert
+        self.assertTrue(esperado.atletas)
+        self.assertEqual(len(time.atletas), len(esperado.atletas))
+        for atleta, atleta_esperado in zip(time.atletas, esperado.atletas):
+            for campo in ("id", "apelido", "pontos", "preco", "media", "is_capitao"):
+                self.assertEqual(
+                    getattr(atleta, campo), getattr(atleta_esperado, campo), campo
+                )
+            self.assertEqual(dict(atleta.scout), dict(atleta_esperado.scout))
+            self.assertEqual(atleta.posicao.id, atleta_esperado.posicao.id)
+            self.assertIs(atleta.clube, atleta_esperado.clube)
+            self.assertEqual(atleta.status, atleta_esperado.status)
+        self.assertIsNotNone(time.atletas[0].preco)
+        self.assertIsNotNone(time.atletas[0].media)
+
+    def test_parse_compact_pool_de_processos(self):
+        # Arrange
+        payloads = [self.payload] * 10
+
+        # Act
+        with TimeParser(workers=2, chunksize=3) as parser:
+            compactos = list(parser.parse_compact(payloads))
+
+        # Assert
+        self.assertEqual(len(compactos), 10)
+        self.assertIsInstance(compactos[0], TimeCompacto)
+        self.assertEqual(compactos[0].time_id, 471815)
+        self.assertEqual(
+            [atleta[4] for atleta in compactos[0].atletas],
+            sorted(atleta["posicao_id"] for atleta in self.data["atletas"]),
+        )
+
+    def test_time_from_dict_nao_altera_os_dados(self):
+        # Arrange
+        ordem = [atleta["atleta_id"] for atleta in self.data["atletas"]]
+
+        # Act
+        Time.from_dict(self.data, clubes=self.clubes, capitao=self.data["capitao_id"])
+
+        # Assert
+        self.assertEqual(
+            [atleta["atleta_id"] for atleta in self.data["atletas"]], ordem
+        )
+
+    def test_parse_times_resposta_invalida(self):
+        # Arrange and Act and Assert
+        with self.assertRaises(cartolafc.CartolaFCOverloadError):
+            parse_times([self.payload, b"<html></html>"], self.clubes, workers=0)
@@ -0,0 +1,146 @@
+import subprocess
+import sys
+import unittest
+
+import cartolafc
+from benchmarks.stub_server import StubServer, load_testdata_routes
+from benchmarks.suite import IMPORT_BUDGET_MS, compare, import_time, measure
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc.models import Clube, Liga, Mercado, Time
+
+
+class StubServerTest(unittest.TestCase):
+    def test_stub_server_testdata(self):
+        # Arrange and Act
+        with StubServer(load_testdata_routes()) as server:
+            api = cartolafc.Api()
+            api._api_url = server.url
+            mercado = api.mercado()
+            clubes = api.clubes()
+
+            # Assert
+            self.assertIsInstance(mercado, Mercado)
+            self.assertEqual(mercado.rodada_atual, 2)
+            self.assertEqual(clubes[262].nome, "Flamengo")
+            self.assertEqual(server.requests, 2)
+
+    def test_stub_server_falhas(self):
+        # Arrange
+        with StubServer(load_testdata_routes(), failure_rate=1.0, seed=1) as server:
+            api = cartolafc.Api(attempts=3)
+            api._api_url = server.url
+
+            # Act and Assert
+            with self.assertRaises(cartolafc.CartolaFCOverloadError):
+                api.mercado()
+            self.assertEqual(server.failures, 3)
+
+
+class SyntheticCartolaTest(unittest.TestCase):
+    def test_deterministico(self):
+        # Arrange
+        dados = SyntheticCartola(seed=3, times=100, rodada_atual=5)
+        outros = SyntheticCartola(seed=3, times=100, rodada_atual=5)
+
+        # Act and Assert
+        self.assertEqual(
+            dados.time(dados.time_ids[7], 2), outros.time(outros.time_ids[7], 2)
+        )
+        self.assertEqual(dados.pontuados(4), outros.pontuados(4))
+        self.assertNotEqual(
+            dados.time(dados.time_ids[7], 2),
+            SyntheticCartola(seed=4, times=100).time(dados.time_ids[7], 2),
+        )
+
+    def test_modelos(self):
+        # Arrange
+        dados = SyntheticCartola(times=30, ligas=3, rodada_atual=5)
+        clubes = {int(c): Clube.from_dict(clube) for c, clube in dados.clubes().items()}
+
+        # Act
+        times = [
+            Time.from_dict(data, clubes=clubes, capitao=data["capitao_id"])
+            for data in dados.iter_times(rodada=4)
+        ]
+        liga = Liga.from_dict(dados.liga(dados.liga_ids[0]), ranking="campeonato")
+        partidas = [dados.partidas(rodada)["partidas"] for rodada in range(1, 39)]
+
+        # Assert
+        self.assertEqual(len(times), 30)
+        self.assertTrue(all(len(time.atletas) == 12 for time in times))
+        self.assertEqual(sum(atleta.is_capitao for atleta in times[0].atletas), 1)
+        self.assertEqual(len(liga.times), 10)
+        self.assertTrue(all(time.pontos is not None for time in liga.times))
+        for rodada in partidas:
+            clubes_rodada = [p["clube_casa_id"] for p in rodada] + [
+                p["clube_visitante_id"] for p in rodada
+            ]
+            self.assertEqual(sorted(clubes_rodada), sorted(clubes))
+        self.assertIsNotNone(partidas[0][0]["placar_oficial_mandante"])
+        self.assertIsNone(partidas[4][0]["placar_oficial_mandante"])
+
+    def test_stub_server_sintetico(self):
+        # Arrange
+        dados = SyntheticCartola(times=100000, rodada_atual=10)
+
+        with StubServer(dados.routes()) as server:
+            api = cartolafc.Api()
+            api._api_url = server.url
+
+            # Act
+            time = api.time(dados.time_ids[-1], rodada=3)
+            parciais = api.parciais()
+            partidas = api.partidas(20)
+
+            # Assert
+            self.assertEqual(time.info.id, dados.time_ids[-1])
+            self.assertEqual(len(time.atletas), 12)
+            self.assertEqual(len(parciais), dados.pontuados()["total_atletas"])
+            self.assertEqual(len(partidas), 10)
+            with self.assertRaises(cartolafc.CartolaFCError):
+                api.time(dados.time_ids[-1] + 1)
+
+
+class BenchmarkSuiteTest(unittest.TestCase):
+    def test_measure(self):
+        # Arrange and Act
+        resultado = measure(lambda: sum(range(100)), repeat=10)
+
+        # Assert
+        self.assertLessEqual(resultado["p50_ms"], resultado["p95_ms"])
+        self.assertGreater(resultado["ops"], 0)
+
+    def test_compare(self):
+        # Arrange
+        baseline = dict(a=dict(p50_ms=1.0), b=dict(p50_ms=1.0))
+        resultados = dict(a=dict(p50_ms=1.2), b=dict(p50_ms=2.0), c=dict(p50_ms=9.0))
+
+        # Act
+        regressoes = compare(resultados, baseline, tolerance=0.5)
+
+        # Assert
+        self.assertEqual(regressoes, ["b"])
+
+    def test_import_time(self):
+        # Arrange and Act
+        tempo = min(import_time("cartolafc") for _ in range(3))
+
+        # Assert
+        self.assertLess(tempo, IMPORT_BUDGET_MS)
+
+    def test_import_sem_efeitos_colaterais(self):
+        # Arrange
+        codigo = (
+            "import logging, sys, cartolafc; "
+            "print(sorted(m for m in ('requests', 'cartolafc.api', 'cartolafc.models') if m in sys.modules)); "
+            "print(len(logging.getLogger().handlers)); "
+            "print(cartolafc.Api.__module__, 'requests' in sys.modules)"
+        )
+
+        # Act
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+
+        # Assert
+        self.assertEqual(saida, ["[]", "0", "cartolafc.api False"])
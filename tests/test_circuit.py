@@ -0,0 +1,107 @@
+import time
+import unittest
+
+import cartolafc
+from cartolafc.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from cartolafc.metrics import MetricsCollector
+from cartolafc.transports import Response, Transport
+
+
+class FakeTransport(Transport):
+    def __init__(self, body):
+        self.body = body
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        return Response(200, self.body, {})
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    with open("tests/testdata/mercado_status_aberto.json", "rb") as f:
+        MERCADO_STATUS_ABERTO = f.read()
+    SOBRECARGA = b"<html>Servidores sobrecarregados</html>"
+
+    def setUp(self):
+        self.agora = 0.0
+        self.breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10, clock=lambda: self.agora
+        )
+        self.hooks = MetricsCollector()
+        self.transport = FakeTransport(self.MERCADO_STATUS_ABERTO)
+        self.api = cartolafc.Api(
+            transport=self.transport, hooks=self.hooks, circuit_breaker=self.breaker
+        )
+
+    def _abrir(self):
+        self.api.mercado()
+        self.transport.body = self.SOBRECARGA
+        for _ in range(2):
+            self.api.mercado()
+
+    def test_resposta_antiga(self):
+        # Arrange
+        self._abrir()
+        chamadas = self.transport.calls
+
+        # Act
+        mercado = self.api.mercado()
+
+        # Assert
+        self.assertEqual(mercado.rodada_atual, 3)
+        self.assertTrue(self.api.last_response_stale)
+        self.assertEqual(self.breaker.state("mercado"), OPEN)
+        self.assertEqual(self.transport.calls, chamadas)
+        self.assertEqual(self.hooks.counters["circuit_opens"]["mercado"], 1)
+        self.assertEqual(self.hooks.counters["stale_responses"]["mercado"], 3)
+
+    def test_circuito_aberto_sem_resposta(self):
+        # Arrange
+        self.transport.body = self.SOBRECARGA
+        for _ in range(2):
+            with self.assertRaises(cartolafc.CartolaFCOverloadError):
+                self.api.clubes()
+        chamadas = self.transport.calls
+
+        # Act and Assert
+        with self.assertRaises(cartolafc.CartolaFCCircuitOpenError):
+            self.api.clubes()
+        self.assertEqual(self.transport.calls, chamadas)
+
+    def test_revalidacao_em_segundo_plano(self):
+        # Arrange
+        self._abrir()
+        self.transport.body = self.MERCADO_STATUS_ABERTO
+        self.agora = 10.0
+
+        # Act
+        mercado = self.api.mercado()
+        for _ in range(100):
+            if self.breaker.state("mercado") == CLOSED:
+                break
+            time.sleep(0.01)
+
+        # Assert
+        self.assertTrue(self.api.last_response_stale)
+        self.assertEqual(mercado.rodada_atual, 3)
+        self.assertEqual(self.breaker.state("mercado"), CLOSED)
+        self.api.mercado()
+        self.assertFalse(self.api.last_response_stale)
+
+    def test_sondagem_falha(self):
+        # Arrange
+        self.transport.body = self.SOBRECARGA
+        for _ in range(2):
+            with self.assertRaises(cartolafc.CartolaFCOverloadError):
+                self.api.clubes()
+        self.agora = 10.0
+
+        # Act
+        with self.assertRaises(cartolafc.CartolaFCOverloadError):
+            self.api.clubes()
+
+        # Assert
+        self.assertEqual(self.breaker.state("clubes"), OPEN)
+        self.assertNotEqual(self.breaker.state("clubes"), HALF_OPEN)
+        with self.assertRaises(cartolafc.CartolaFCCircuitOpenError):
+            self.api.clubes()
@@ -0,0 +1,198 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import requests
+
+from benchmarks.stub_server import StubServer, load_testdata_routes
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc import Api, CartolaFCError
+from cartolafc.cli import build_parser, export, main
+from cartolafc.transports import RequestsTransport
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.stderr = io.StringIO()
+
+    def tearDown(self):
+        for nome in os.listdir(self.path):
+            os.remove(os.path.join(self.path, nome))
+        os.rmdir(self.path)
+
+    def _export(self, server, *argv):
+        args = build_parser().parse_args(
+            list(argv) + ["--api-url", server.url, "--progress", "0"]
+        )
+        return export(args, stderr=self.stderr)
+
+    def _arquivo(self, nome):
+        return os.path.join(self.path, nome)
+
+    def test_export_mercado_csv(self):
+        # Arrange
+        saida = self._arquivo("mercado.csv")
+
+        with StubServer(load_testdata_routes()) as server:
+            # Act
+            registros = self._export(server, "mercado", "-o", saida)
+
+        # Assert
+        with open(saida, newline="", encoding="utf-8") as f:
+            linhas = list(csv.DictReader(f))
+        self.assertEqual(registros, 627)
+        self.assertEqual(len(linhas), 627)
+        self.assertEqual(linhas[0]["apelido"], "Marcos Rocha")
+        self.assertEqual(linhas[0]["preco"], "5")
+        self.assertIn("scout_G", linhas[0])
+        self.assertIn("mercado: 1 itens, 627 registros", self.stderr.getvalue())
+
+    def test_export_partidas_ndjson(self):
+        # Arrange
+        saida = self._arquivo("partidas.ndjson")
+        dados = SyntheticCartola(times=0, rodada_atual=3)
+
+        with StubServer(dados.routes()) as server:
+            # Act
+            self._export(server, "partidas", "--rodadas", "1-2,5", "-o", saida)
+
+        # Assert
+        with open(saida, encoding="utf-8") as f:
+            partidas = [json.loads(linha) for linha in f]
+        self.assertEqual([p["rodada"] for p in partidas[::10]], [1, 2, 5])
+        self.assertIsNotNone(partidas[0]["placar_casa"])
+        self.assertIsNone(partidas[-1]["placar_casa"])
+
+    def test_export_times_checkpoint(self):
+        # Arrange
+        dados = SyntheticCartola(times=20)
+        ids, saida, checkpoint = (
+            self._arquivo("ids.txt"),
+            self._arquivo("times.ndjson"),
+            self._arquivo("checkpoint.json"),
+        )
+        argv = ["times", "--ids", ids, "-o", saida, "--checkpoint", checkpoint]
+        with open(ids, "w") as f:
+            f.write("\n".join(str(time_id) for time_id in dados.time_ids[:8]))
+            f.write("\n123  # time inexistente\n")
+
+        with StubServer(dados.routes()) as server:
+            # Act
+            primeira = self._export(server, *argv, "--checkpoint-every", "2")
+            # Uma linha incompleta, gravada após o último checkpoint, é descartada ao retomar.
+            with open(saida, "a") as f:
+                f.write('{"time_id": ')
+            with open(ids, "a") as f:
+                f.write("\n".join(str(time_id) for time_id in dados.time_ids[8:]))
+            segunda = self._export(server, *argv, "-w", "4")
+
+        # Assert
+        with open(saida, encoding="utf-8") as f:
+            registros = [json.loads(linha) for linha in f]
+        with open(checkpoint) as f:
+            estado = json.load(f)
+        self.assertEqual((primeira, segunda), (8 * 12, 12 * 12))
+        self.assertEqual(
+            sorted({r["time_id"] for r in registros}), list(dados.time_ids)
+        )
+        self.assertEqual(len(registros), 20 * 12)
+        self.assertEqual({r["rodada"] for r in registros}, {dados.rodada_atual})
+        self.assertEqual(estado["done"], 21)
+        self.assertEqual(estado["failed"], [123])
+        self.assertIn("1 falhas", self.stderr.getvalue())
+
+    def test_export_times_retoma_falhas(self):
+        # Arrange
+        dados = SyntheticCartola(times=6)
+        falho = dados.time_ids[2]
+        ids, saida, checkpoint = (
+            self._arquivo("ids.txt"),
+            self._arquivo("times.ndjson"),
+            self._arquivo("checkpoint.json"),
+        )
+        with open(ids, "w") as f:
+            f.write("\n".join(str(time_id) for time_id in dados.time_ids))
+        argv = ["times", "--ids", ids, "-o", saida, "--checkpoint", checkpoint]
+
+        class Transporte(RequestsTransport):
+            falhar = True
+
+            def get(self, url, params=None):
+                if self.falhar and url.endswith(f"/time/id/{falho}"):
+                    raise requests.ConnectionError("Conexão recusada")
+                return super().get(url, params=params)
+
+        transporte = Transporte()
+
+        with StubServer(dados.routes()) as server:
+            # Act
+            args = build_parser().parse_args(
+                argv + ["--api-url", server.url, "--progress", "0", "-w", "2"]
+            )
+            primeira = export(args, api=Api(transport=transporte), stderr=self.stderr)
+            with open(checkpoint) as f:
+                estado = json.load(f)
+            transporte.falhar = False
+            segunda = export(args, api=Api(transport=transporte), stderr=self.stderr)
+
+        # Assert
+        with open(saida, encoding="utf-8") as f:
+            registros = [json.loads(linha) for linha in f]
+        with open(checkpoint) as f:
+            final = json.load(f)
+        self.assertEqual((primeira, segunda), (5 * 12, 12))
+        self.assertEqual((estado["done"], estado["failed"]), (6, [falho]))
+        self.assertEqual((final["done"], final["failed"]), (6, []))
+        self.assertEqual(
+            sorted({r["time_id"] for r in registros}), sorted(dados.time_ids)
+        )
+        self.assertEqual(len(registros), 6 * 12)
+
+    def test_main_erro_de_rede(self):
+        # Arrange
+        with StubServer(load_testdata_routes()) as server:
+            url = server.url
+        argv = ["mercado", "-o", self._arquivo("mercado.csv"), "--api-url", url]
+
+        # Act
+        with contextlib.redirect_stderr(self.stderr):
+            codigo = main(argv)
+
+        # Assert
+        self.assertEqual(codigo, 1)
+        self.assertTrue(self.stderr.getvalue().startswith("cartolafc: "))
+        self.assertNotIn("Traceback", self.stderr.getvalue())
+
+    def test_export_parquet_stdout(self):
+        # Arrange
+        args = build_parser().parse_args(["mercado", "-f", "parquet"])
+
+        # Act and Assert
+        with self.assertRaises(CartolaFCError):
+            export(args, stderr=self.stderr)
+
+    @unittest.skipUnless(pyarrow, "Requer o pacote pyarrow")
+    def test_export_parciais_parquet(self):
+        # Arrange
+        import pyarrow.parquet
+
+        saida = self._arquivo("parciais.parquet")
+
+        with StubServer(load_testdata_routes()) as server:
+            # Act
+            registros = self._export(server, "parciais", "-o", saida)
+
+        # Assert
+        tabela = pyarrow.parquet.read_table(saida)
+        self.assertEqual(tabela.num_rows, registros)
+        self.assertEqual(tabela.column("rodada")[0].as_py(), 2)
@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+
+import cartolafc
+from benchmarks.stub_server import StubServer
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc.columnar import pack_parciais
+from cartolafc.distributed import (
+    RankingEntry,
+    ScoringCoordinator,
+    ScoringWorker,
+    ShardResult,
+    SQLiteShardQueue,
+    merge_rankings,
+)
+from cartolafc.metrics import MetricsCollector
+
+
+class DistributedTest(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.diretorio.name, "fila.sqlite3")
+        self.dados = SyntheticCartola(times=30)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _api(self, server):
+        api = cartolafc.Api()
+        api._api_url = server.url
+        return api
+
+    def test_merge_rankings(self):
+        # Arrange
+        a = [RankingEntry(3, "C", 50.0, 12), RankingEntry(1, "A", 10.0, 12)]
+        b = [RankingEntry(2, "B", 50.0, 12), RankingEntry(4, "D", 20.0, 11)]
+
+        # Act
+        ranking = merge_rankings([a, b])
+
+        # Assert
+        self.assertEqual([entrada.time_id for entrada in ranking], [2, 3, 4, 1])
+
+    def test_tick_em_processos(self):
+        # Arrange
+        queue = SQLiteShardQueue(self.path)
+        with StubServer(self.dados.routes()) as server:
+            api = self._api(server)
+            parciais = api.parciais()
+            esperado = sorted(
+                (
+                    api.time_parcial(time_id, parciais)
+                    for time_id in self.dados.time_ids
+                ),
+                key=lambda time: (-time.pontos, time.info.id),
+            )
+            workers = [
+                multiprocessing.Process(
+                    target=ScoringWorker(queue, api).run, kwargs=dict(idle_timeout=2)
+                )
+                for _ in range(2)
+            ]
+            for worker in workers:
+                worker.start()
+
+            # Act
+            coordinator = ScoringCoordinator(queue, api, shard_size=7, timeout=60)
+            ranking = coordinator.tick(list(self.dados.time_ids) + [123], parciais)
+            for worker in workers:
+                worker.join()
+
+        # Assert
+        self.assertEqual(
+            [(entrada.time_id, entrada.pontos) for entrada in ranking],
+            [(time.info.id, time.pontos) for time in esperado],
+        )
+        self.assertEqual(coordinator.missing, [123])
+        self.assertEqual(queue.progress(1), (0, 0, 0))
+
+    def test_score_obtem_clubes_uma_vez(self):
+        # Arrange
+        queue = SQLiteShardQueue(self.path)
+        metrics = MetricsCollector()
+        with StubServer(self.dados.routes()) as server:
+            api = self._api(server)
+            parciais = api.parciais()
+            esperado = {
+                time_id: api.time_parcial(time_id, parciais).pontos
+                for time_id in self.dados.time_ids[:7]
+            }
+            api = cartolafc.Api(hooks=metrics)
+            api._api_url = server.url
+            queue.publish(pack_parciais(parciais), [self.dados.time_ids[:7]])
+
+            # Act
+            processado = ScoringWorker(queue, api).run_once()
+
+        # Assert
+        resultado = queue.results(1)[0]
+        self.assertTrue(processado)
+        self.assertEqual(
+            {entrada.time_id: entrada.pontos for entrada in resultado.ranking}, esperado
+        )
+        self.assertEqual(metrics.snapshot()["requests"], {"clubes": 1, "time": 7})
+
+    def test_lease_expirado(self):
+        # Arrange
+        agora = [0.0]
+        queue = SQLiteShardQueue(self.path, clock=lambda: agora[0])
+        queue.publish(b"snapshot", [[1, 2], [3]])
+        primeiro = queue.claim("a", lease=10)
+
+        # Act
+        agora[0] = 11.0
+        segundo = queue.claim("b", lease=10)
+        queue.fail(primeiro, "atrasado")
+        queue.complete(segundo, ShardResult([RankingEntry(1, "A", 1.0, 1)], [2]))
+
+        # Assert
+        self.assertEqual((primeiro.shard_id, segundo.shard_id), (0, 0))
+        self.assertEqual(segundo.attempts, 2)
+        self.assertEqual(queue.progress(1), (1, 1, 0))
+        self.assertEqual(queue.results(1)[0].missing, [2])
+        self.assertEqual(queue.snapshot(1), b"snapshot")
+
+    def test_falhas_esgotam_tentativas(self):
+        # Arrange
+        queue = SQLiteShardQueue(self.path, max_attempts=2)
+        stop = threading.Event()
+        with StubServer(self.dados.routes()) as server:
+            parciais = self._api(server).parciais()
+        with StubServer(self.dados.routes(), failure_rate=1.0) as server:
+            worker = ScoringWorker(queue, self._api(server))
+            thread = threading.Thread(
+                target=worker.run,
+                kwargs=dict(idle_timeout=None, poll_interval=0.01, stop=stop),
+            )
+            thread.start()
+            coordinator = ScoringCoordinator(queue, shard_size=10, timeout=30)
+
+            # Act and Assert
+            try:
+                with self.assertRaisesRegex(cartolafc.CartolaFCError, "tentativas"):
+                    coordinator.tick(self.dados.time_ids, parciais)
+            finally:
+                stop.set()
+                thread.join()
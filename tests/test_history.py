@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from cartolafc import CartolaFCError
+from cartolafc.models import Atleta, Clube
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipUnless(numpy, "Requer o pacote numpy")
+class SeasonHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.flamengo = Clube(262, "Flamengo", "FLA")
+        self.palmeiras = Clube(275, "Palmeiras", "PAL")
+
+    def tearDown(self):
+        for nome in os.listdir(self.path):
+            os.remove(os.path.join(self.path, nome))
+        os.rmdir(self.path)
+
+    def _rodada(self, pontos):
+        atletas = [
+            Atleta(1, "Gabigol", pontos[0], {"G": 1}, 5, self.flamengo, 7),
+            Atleta(2, "Weverton", pontos[1], {"DE": 3}, 1, self.palmeiras, 7),
+            Atleta(3, "Pedro", pontos[2], {"G": 2, "FS": 1}, 5, self.flamengo),
+        ]
+        return {atleta.id: atleta for atleta in atletas if atleta.pontos is not None}
+
+    def _historico(self):
+        from cartolafc.history import SeasonHistory
+
+        historico = SeasonHistory(self.path)
+        historico.append(1, self._rodada([10.0, 4.0, 8.0]))
+        historico.append(2, self._rodada([2.0, 6.0, None]))
+        historico.append(3, self._rodada([6.0, 2.0, 12.0]))
+        return historico
+
+    def test_append(self):
+        # Arrange
+        from cartolafc.history import SeasonHistory
+
+        self._historico()
+
+        # Act
+        historico = SeasonHistory(self.path)
+
+        # Assert
+        self.assertEqual(historico.rodadas, [1, 2, 3])
+        self.assertEqual(historico.atleta_ids, [1, 2, 3])
+        self.assertEqual(len(historico), 8)
+        self.assertIn(2, historico)
+        self.assertEqual(historico.series(3), {1: 8.0, 3: 12.0})
+        with self.assertRaises(CartolaFCError):
+            historico.append(3, self._rodada([1.0, 1.0, 1.0]))
+
+    def test_mean(self):
+        # Arrange
+        historico = self._historico()
+
+        # Act
+        media = historico.mean()
+        media_recente = historico.mean(rodadas=[2, 3])
+        media_atacantes = historico.mean(posicao_id=5)
+
+        # Assert
+        self.assertEqual(media, {1: 6.0, 2: 4.0, 3: 10.0})
+        self.assertEqual(media_recente, {1: 4.0, 2: 4.0, 3: 12.0})
+        self.assertEqual(media_atacantes, {1: 6.0, 3: 10.0})
+        self.assertEqual(historico.mean(rodadas=[38]), {})
+
+    def test_rolling_mean(self):
+        # Arrange
+        historico = self._historico()
+
+        # Act
+        medias = historico.rolling_mean(2)
+
+        # Assert
+        self.assertEqual(medias[1], [10.0, 6.0, 4.0])
+        self.assertEqual(medias[3], [8.0, 8.0, 12.0])
+        with self.assertRaises(CartolaFCError):
+            historico.rolling_mean(0)
+
+    def test_rolling_mean_rodada_ausente(self):
+        # Arrange
+        from cartolafc.history import SeasonHistory
+
+        historico = SeasonHistory(self.path)
+        historico.append(1, self._rodada([10.0, 4.0, 8.0]))
+        historico.append(3, self._rodada([6.0, 2.0, None]))
+        historico.append(4, self._rodada([2.0, 6.0, None]))
+
+        # Act
+        medias = historico.rolling_mean(2)
+
+        # Assert
+        self.assertEqual(medias[1], [10.0, 6.0, 4.0])
+        self.assertEqual(medias[3], [8.0, None, None])
+        self.assertEqual(historico.series(1), {1: 10.0, 3: 6.0, 4: 2.0})
+
+    def test_grupos_e_scouts(self):
+        # Arrange
+        historico = self._historico()
+
+        # Act
+        por_clube = historico.mean_by_clube()
+        por_posicao = historico.mean_by_posicao(rodadas=[1])
+        scouts = historico.scout_totals()
+
+        # Assert
+        self.assertEqual(por_clube, {262: 7.6, 275: 4.0})
+        self.assertEqual(por_posicao, {1: 4.0, 5: 9.0})
+        self.assertEqual(scouts[1], {"G": 3})
+        self.assertEqual(scouts[3], {"G": 4, "FS": 2})
+        self.assertEqual(scouts[2], {"DE": 9})
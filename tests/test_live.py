@@ -0,0 +1,151 @@
+import asyncio
+import json
+import unittest
+
+import cartolafc
+from benchmarks.stub_server import StubServer
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc.live import LiveScoreServer
+
+
+async def _conectar(url, caminho):
+    host, port = url[len("http://") :].split(":")
+    reader, writer = await asyncio.open_connection(host, int(port))
+    writer.write(f"GET {caminho} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("ascii"))
+    cabecalhos = await reader.readuntil(b"\r\n\r\n")
+    return reader, writer, cabecalhos.split(b"\r\n", 1)[0]
+
+
+async def _evento(reader):
+    bruto = await asyncio.wait_for(reader.readuntil(b"\n\n"), 10)
+    return bruto, json.loads(bruto.split(b"data: ", 1)[1])
+
+
+class LiveScoreServerTest(unittest.TestCase):
+    def setUp(self):
+        self.dados = SyntheticCartola(times=10, rodada_atual=5)
+        self.routes = self.dados.routes()
+        self.upstream = StubServer(self.routes).start()
+        self.api = cartolafc.Api()
+        self.api._api_url = self.upstream.url
+
+    def tearDown(self):
+        self.upstream.stop()
+
+    def _rodada(self, rodada):
+        self.routes["/atletas/pontuados"] = json.dumps(
+            self.dados.pontuados(rodada)
+        ).encode("utf-8")
+
+    def _pontuacao(self, time_id):
+        time = self.api.time_parcial(time_id, self.api.parciais())
+        return dict(
+            time_id=time_id,
+            nome=time.info.nome,
+            pontos=round(time.pontos, 2),
+            jogados=time.jogados,
+        )
+
+    def test_stream(self):
+        # Arrange
+        time_a, time_b = self.dados.time_ids[:2]
+        self._rodada(1)
+
+        async def executar():
+            async with LiveScoreServer(self.api, poll_interval=0) as server:
+                await server.poll_once()
+                conexoes = [
+                    await _conectar(server.url, f"/times/{time_id}/stream")
+                    for time_id in (time_a, time_a, time_a, time_b)
+                ]
+                iniciais = [await _evento(reader) for reader, _, _ in conexoes]
+
+                self._rodada(2)
+                publicados = await server.poll_once()
+                atualizados = [await _evento(reader) for reader, _, _ in conexoes]
+
+                estado = (server.subscribers, server.teams)
+                for _, writer, _ in conexoes:
+                    writer.close()
+                return conexoes, iniciais, publicados, atualizados, estado
+
+        # Act
+        conexoes, iniciais, publicados, atualizados, estado = asyncio.run(executar())
+
+        # Assert
+        self.assertEqual(conexoes[0][2], b"HTTP/1.1 200 OK")
+        self.assertEqual(estado, (4, 2))
+        self.assertEqual(publicados, 2)
+        self.assertEqual(atualizados[0][1], self._pontuacao(time_a))
+        self.assertEqual(atualizados[3][1], self._pontuacao(time_b))
+        self.assertNotEqual(iniciais[0][1]["pontos"], atualizados[0][1]["pontos"])
+        self.assertEqual(len({bruto for bruto, _ in atualizados[:3]}), 1)
+
+    def test_cliente_lento(self):
+        # Arrange
+        time_id = self.dados.time_ids[0]
+
+        async def executar():
+            server = LiveScoreServer(self.api, poll_interval=0, queue_size=2)
+            cliente = await server.subscribe(time_id)
+            for rodada in (1, 2, 3, 4):
+                self._rodada(rodada)
+                await server.poll_once()
+            eventos = [cliente.fila.get_nowait() for _ in range(cliente.fila.qsize())]
+            server.unsubscribe(time_id, cliente)
+            return server, eventos
+
+        # Act
+        server, eventos = asyncio.run(executar())
+
+        # Assert
+        self.assertEqual(len(eventos), 2)
+        self.assertEqual(server.dropped, 3)
+        self.assertEqual(
+            json.loads(eventos[-1].split(b"data: ", 1)[1]), self._pontuacao(time_id)
+        )
+        self.assertEqual((server.subscribers, server.teams), (0, 0))
+        self.assertEqual(server._indice, {})
+
+    def test_time_inexistente(self):
+        # Arrange
+        async def executar():
+            async with LiveScoreServer(self.api, poll_interval=0) as server:
+                respostas = []
+                for caminho in ("/times/123/stream", "/ligas"):
+                    reader, writer, status = await _conectar(server.url, caminho)
+                    respostas.append(status)
+                    writer.close()
+                return respostas, server.teams
+
+        # Act
+        respostas, times = asyncio.run(executar())
+
+        # Assert
+        self.assertEqual(respostas, [b"HTTP/1.1 404 Not Found"] * 2)
+        self.assertEqual(times, 0)
+
+    def test_erro_de_rede(self):
+        # Arrange
+        with StubServer(self.routes) as upstream:
+            url = upstream.url
+        api = cartolafc.Api()
+        api._api_url = url
+
+        async def executar():
+            async with LiveScoreServer(api, poll_interval=0.01) as server:
+                await asyncio.sleep(0.1)
+                reader, writer, status = await _conectar(
+                    server.url, f"/times/{self.dados.time_ids[0]}/stream"
+                )
+                writer.close()
+                return status, server._poller.done(), server.teams
+
+        # Act
+        with self.assertLogs("cartolafc", level="WARNING"):
+            status, encerrado, times = asyncio.run(executar())
+
+        # Assert
+        self.assertEqual(status, b"HTTP/1.1 502 Bad Gateway")
+        self.assertFalse(encerrado)
+        self.assertEqual(times, 0)
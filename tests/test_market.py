@@ -0,0 +1,168 @@
+import json
+import random
+import unittest
+
+from cartolafc import CartolaFCError
+from cartolafc.market import MarketIndex
+from cartolafc.models import Atleta, Clube
+
+
+class MarketIndexTest(unittest.TestCase):
+    with open("tests/testdata/mercado_atletas.json", "rb") as f:
+        MERCADO_ATLETAS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        clubes = {
+            clube["id"]: Clube.from_dict(clube)
+            for clube in self.MERCADO_ATLETAS["clubes"].values()
+        }
+        aleatorio = random.Random(42)
+        self.atletas = [
+            Atleta.from_dict(
+                dict(
+                    atleta,
+                    pontos_num=round(aleatorio.uniform(-3, 15), 1),
+                    media_num=round(aleatorio.uniform(0, 10), 2),
+                ),
+                clubes=clubes,
+            )
+            for atleta in self.MERCADO_ATLETAS["atletas"]
+        ]
+        self.index = MarketIndex(self.atletas)
+
+    @staticmethod
+    def _ids(atletas):
+        return [atleta.id for atleta in atletas]
+
+    def _ordenar(self, atletas, campo, descending=True):
+        sinal = -1 if descending else 1
+        return sorted(
+            atletas, key=lambda atleta: (sinal * getattr(atleta, campo), atleta.id)
+        )
+
+    def test_filtros(self):
+        # Arrange
+        esperado = [
+            atleta
+            for atleta in self.atletas
+            if atleta.posicao.id in (4, 5)
+            and atleta.status
+            and atleta.status.id == 7
+            and 5 <= atleta.preco <= 12
+            and atleta.media >= 2
+        ]
+
+        # Act
+        consulta = (
+            self.index.query()
+            .where(posicao=[4, 5], status=7)
+            .between("preco", 5, 12)
+            .between("media", minimo=2)
+        )
+
+        # Assert
+        self.assertTrue(esperado)
+        self.assertEqual(self._ids(consulta.all()), self._ids(esperado))
+        self.assertEqual(len(consulta), len(esperado))
+        self.assertEqual(
+            self._ids(consulta.all("media")),
+            self._ids(self._ordenar(esperado, "media")),
+        )
+
+    def test_top(self):
+        # Arrange
+        clube_id = self.atletas[0].clube.id
+        do_clube = [atleta for atleta in self.atletas if atleta.clube.id == clube_id]
+
+        # Act
+        mercado = self.index.query().top(10, "pontos")
+        baratos = self.index.query().where(posicao=5).top(5, "preco", descending=False)
+        clube = self.index.query().where(clube=clube_id).top(3, "media")
+
+        # Assert
+        self.assertEqual(
+            self._ids(mercado), self._ids(self._ordenar(self.atletas, "pontos")[:10])
+        )
+        self.assertEqual(
+            self._ids(baratos),
+            self._ids(
+                self._ordenar(
+                    [atleta for atleta in self.atletas if atleta.posicao.id == 5],
+                    "preco",
+                    descending=False,
+                )[:5]
+            ),
+        )
+        self.assertEqual(
+            self._ids(clube), self._ids(self._ordenar(do_clube, "media")[:3])
+        )
+        self.assertEqual(self.index.query().where(clube=-1).top(3), [])
+
+    def test_refresh(self):
+        # Arrange
+        alterado = self.atletas[0]
+        atletas = list(self.atletas)
+        atletas[0] = Atleta(
+            alterado.id,
+            alterado.apelido,
+            alterado.pontos,
+            alterado.scout,
+            alterado.posicao.id,
+            alterado.clube,
+            alterado.status.id if alterado.status else None,
+            preco=alterado.preco + 1,
+            media=alterado.media,
+        )
+
+        # Act
+        mesmo = self.index.refresh(list(self.atletas))
+        novo = self.index.refresh(atletas)
+
+        # Assert
+        self.assertIs(mesmo, self.index)
+        self.assertIsNot(novo, self.index)
+        preco = alterado.preco + 1
+        self.assertIn(
+            alterado.id, self._ids(novo.query().between("preco", preco, preco))
+        )
+        self.assertNotIn(
+            alterado.id, self._ids(self.index.query().between("preco", preco, preco))
+        )
+        with self.assertRaises(CartolaFCError):
+            self.index.query().between("variacao", 1)
+
+    def test_refresh_posicao_e_scout(self):
+        # Arrange
+        alterado = self.atletas[0]
+        nova_posicao = 5 if alterado.posicao.id != 5 else 4
+
+        def copia(posicao, scout):
+            return Atleta(
+                alterado.id,
+                alterado.apelido,
+                alterado.pontos,
+                scout,
+                posicao,
+                alterado.clube,
+                alterado.status.id if alterado.status else None,
+                preco=alterado.preco,
+                media=alterado.media,
+            )
+
+        scout = dict(alterado.scout, G=alterado.scout.get("G", 0) + 1)
+
+        # Act
+        posicao = self.index.refresh(
+            [copia(nova_posicao, alterado.scout)] + self.atletas[1:]
+        )
+        scout = self.index.refresh(
+            [copia(alterado.posicao.id, scout)] + self.atletas[1:]
+        )
+
+        # Assert
+        self.assertIsNot(posicao, self.index)
+        self.assertIn(
+            alterado.id, self._ids(posicao.query().where(posicao=nova_posicao))
+        )
+        self.assertIsNot(scout, self.index)
+        self.assertEqual(scout.atletas[0].scout["G"], alterado.scout.get("G", 0) + 1)
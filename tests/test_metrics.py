@@ -0,0 +1,120 @@
+import unittest
+
+import requests_mock
+from requests.status_codes import codes
+
+import cartolafc
+from cartolafc.metrics import Histogram, Hooks, MetricsCollector
+
+
+class HistogramTest(unittest.TestCase):
+    def test_histogram_quantile(self):
+        # Arrange
+        histograma = Histogram(buckets=(0.1, 0.2, 0.5))
+
+        # Act
+        for valor in (0.05, 0.05, 0.15, 0.4, 1.0):
+            histograma.observe(valor)
+
+        # Assert
+        self.assertEqual(histograma.count, 5)
+        self.assertAlmostEqual(histograma.sum, 1.65)
+        self.assertEqual(histograma.quantile(0.4), 0.1)
+        self.assertEqual(histograma.quantile(0.8), 0.5)
+        self.assertEqual(histograma.quantile(1.0), float("inf"))
+        self.assertEqual(
+            histograma.cumulative(),
+            [("0.1", 2), ("0.2", 3), ("0.5", 4), ("+Inf", 5)],
+        )
+
+
+class MetricsCollectorTest(unittest.TestCase):
+    with open("tests/testdata/mercado_status_aberto.json", "rb") as f:
+        MERCADO_STATUS_ABERTO = f.read().decode("utf8")
+    with open("tests/testdata/clubes.json", "rb") as f:
+        CLUBES = f.read().decode("utf8")
+
+    def setUp(self):
+        self.metrics = MetricsCollector()
+        self.api = cartolafc.Api(attempts=3, hooks=self.metrics)
+        self.api_url = self.api._api_url
+
+    def test_metrics_requisicao(self):
+        # Arrange and Act
+        with requests_mock.mock() as m:
+            m.get(f"{self.api_url}/mercado/status", text=self.MERCADO_STATUS_ABERTO)
+            m.get(f"{self.api_url}/clubes", text=self.CLUBES)
+            self.api.mercado()
+            self.api.mercado()
+            self.api.clubes()
+
+        # Assert
+        self.assertEqual(self.metrics.counters["requests"]["mercado"], 2)
+        self.assertEqual(self.metrics.counters["requests"]["clubes"], 1)
+        self.assertEqual(
+            self.metrics.counters["response_bytes"]["clubes"], len(self.CLUBES.encode())
+        )
+        self.assertEqual(self.metrics.histograms["request"]["mercado"].count, 2)
+        self.assertEqual(self.metrics.histograms["decode"]["mercado"].count, 2)
+        self.assertEqual(self.metrics.histograms["build"]["clubes"].count, 1)
+
+    def test_metrics_retries(self):
+        # Arrange
+        with requests_mock.mock() as m:
+            m.get(
+                f"{self.api_url}/mercado/status",
+                response_list=[
+                    dict(status_code=codes.ok, text="<html></html>"),
+                    dict(status_code=codes.ok, text=self.MERCADO_STATUS_ABERTO),
+                ],
+            )
+
+            # Act
+            self.api.mercado()
+
+        # Assert
+        self.assertEqual(self.metrics.counters["requests"]["mercado"], 2)
+        self.assertEqual(self.metrics.counters["retries"]["mercado"], 1)
+        self.assertEqual(self.metrics.histograms["build"]["mercado"].count, 1)
+
+    def test_metrics_prometheus(self):
+        # Arrange
+        with requests_mock.mock() as m:
+            m.get(f"{self.api_url}/mercado/status", text=self.MERCADO_STATUS_ABERTO)
+            self.api.mercado()
+
+        # Act
+        texto = self.metrics.to_prometheus()
+
+        # Assert
+        self.assertIn("# TYPE cartolafc_requests_total counter", texto)
+        self.assertIn('cartolafc_requests_total{endpoint="mercado"} 1', texto)
+        self.assertIn("# TYPE cartolafc_request_duration_seconds histogram", texto)
+        self.assertIn(
+            'cartolafc_request_duration_seconds_bucket{endpoint="mercado",le="+Inf"} 1',
+            texto,
+        )
+        self.assertIn(
+            'cartolafc_build_duration_seconds_count{endpoint="mercado"} 1', texto
+        )
+
+    def test_hooks_customizados(self):
+        # Arrange
+        eventos = []
+
+        class Registro(Hooks):
+            def on_request_start(self, endpoint, url):
+                eventos.append(("start", endpoint))
+
+            def on_build(self, endpoint, elapsed):
+                eventos.append(("build", endpoint))
+
+        api = cartolafc.Api(hooks=Registro())
+
+        # Act
+        with requests_mock.mock() as m:
+            m.get(f"{self.api_url}/mercado/status", text=self.MERCADO_STATUS_ABERTO)
+            api.mercado()
+
+        # Assert
+        self.assertEqual(eventos, [("start", "mercado"), ("build", "mercado")])
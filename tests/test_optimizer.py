@@ -0,0 +1,136 @@
+import itertools
+import json
+import random
+import unittest
+
+from cartolafc import CartolaFCError
+from cartolafc.models import Atleta, Clube
+from cartolafc.optimizer import FORMATIONS, LineupOptimizer, optimize_lineup
+
+
+class LineupOptimizerTest(unittest.TestCase):
+    with open("tests/testdata/mercado_atletas.json", "rb") as f:
+        MERCADO_ATLETAS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        clubes = {
+            clube["id"]: Clube.from_dict(clube)
+            for clube in self.MERCADO_ATLETAS["clubes"].values()
+        }
+        aleatorio = random.Random(42)
+        self.atletas = [
+            Atleta.from_dict(
+                dict(
+                    atleta,
+                    preco_num=round(aleatorio.uniform(1, 20), 2),
+                    media_num=round(aleatorio.uniform(0, 10), 2),
+                ),
+                clubes=clubes,
+            )
+            for atleta in self.MERCADO_ATLETAS["atletas"]
+        ]
+
+    @staticmethod
+    def _forca_bruta(atletas, cartoletas, formacao):
+        por_posicao = [
+            itertools.combinations(
+                [atleta for atleta in atletas if atleta.posicao.id == posicao],
+                quantidade,
+            )
+            for posicao, quantidade in FORMATIONS[formacao].items()
+        ]
+        melhor = None
+        for escolhas in itertools.product(*[list(p) for p in por_posicao]):
+            escolhidos = [atleta for escolha in escolhas for atleta in escolha]
+            preco = sum(round(atleta.preco * 100) for atleta in escolhidos)
+            pontos = sum(atleta.media for atleta in escolhidos)
+            if preco <= cartoletas * 100 and (melhor is None or pontos > melhor):
+                melhor = pontos
+        return melhor
+
+    def test_mercado_atletas_preco_media(self):
+        # Arrange and Act
+        atleta = Atleta.from_dict(self.MERCADO_ATLETAS["atletas"][0], clubes={})
+
+        # Assert
+        self.assertEqual(atleta.preco, 5)
+        self.assertEqual(atleta.media, 0)
+
+    def test_solve(self):
+        # Arrange
+        otimizador = LineupOptimizer(self.atletas)
+
+        # Act
+        escalacao = otimizador.solve(100, "4-3-3")
+
+        # Assert
+        self.assertEqual(escalacao.formacao, "4-3-3")
+        self.assertEqual(len(escalacao.atletas), 12)
+        self.assertLessEqual(escalacao.preco, 100)
+        self.assertAlmostEqual(
+            escalacao.pontos, sum(atleta.media for atleta in escalacao.atletas)
+        )
+        self.assertEqual(
+            [atleta.posicao.id for atleta in escalacao.atletas],
+            [1, 2, 2, 3, 3, 4, 4, 4, 5, 5, 5, 6],
+        )
+
+    def test_solve_forca_bruta(self):
+        # Arrange
+        atletas = []
+        for posicao in range(1, 7):
+            atletas.extend(
+                [a for a in self.atletas if a.posicao.id == posicao][: 3 + posicao % 3]
+            )
+        otimizador = LineupOptimizer(atletas)
+
+        for formacao in ("3-4-3", "4-3-3", "5-4-1"):
+            for cartoletas in (60, 90, 130):
+                # Act
+                escalacao = otimizador.solve(cartoletas, formacao)
+
+                # Assert
+                esperado = self._forca_bruta(atletas, cartoletas, formacao)
+                if esperado is None:
+                    self.assertIsNone(escalacao)
+                else:
+                    self.assertAlmostEqual(escalacao.pontos, esperado)
+
+    def test_solve_status(self):
+        # Arrange and Act
+        escalacao = optimize_lineup(self.atletas, 140, "3-5-2", status=[7])
+
+        # Assert
+        self.assertTrue(all(atleta.status.id == 7 for atleta in escalacao.atletas))
+
+    def test_solve_sem_orcamento(self):
+        # Arrange and Act
+        escalacao = LineupOptimizer(self.atletas).solve(5)
+
+        # Assert
+        self.assertIsNone(escalacao)
+
+    def test_solve_many(self):
+        # Arrange
+        otimizador = LineupOptimizer(self.atletas)
+
+        # Act
+        resultados = otimizador.solve_many([80, 120], formacoes=["4-4-2", "5-3-2"])
+
+        # Assert
+        self.assertEqual(len(resultados), 4)
+        for (formacao, cartoletas), escalacao in resultados.items():
+            self.assertEqual(
+                escalacao.pontos, otimizador.solve(cartoletas, formacao).pontos
+            )
+        self.assertGreater(
+            resultados[("4-4-2", 120)].pontos, resultados[("4-4-2", 80)].pontos
+        )
+
+    def test_solve_formacao_invalida(self):
+        # Arrange
+        otimizador = LineupOptimizer(self.atletas)
+
+        # Act and Assert
+        with self.assertRaises(CartolaFCError):
+            otimizador.solve(100, "2-2-6")
@@ -0,0 +1,141 @@
+import threading
+import time
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+import cartolafc
+from cartolafc.metrics import MetricsCollector
+from cartolafc.refresh import RefreshAheadScheduler, WarmCache
+from cartolafc.transports import Response, Transport
+
+
+def _testdata(nome):
+    with open(f"tests/testdata/{nome}", "rb") as f:
+        return f.read()
+
+
+class RoutingTransport(Transport):
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = Counter()
+
+    def get(self, url, params=None):
+        path = urlsplit(url).path
+        self.calls[path] += 1
+        return Response(200, self.routes[path], {})
+
+
+class RefreshAheadSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.transport = RoutingTransport(
+            {
+                "/mercado/status": _testdata("mercado_status_aberto.json"),
+                "/atletas/pontuados": _testdata("parciais.json"),
+                "/atletas/mercado": _testdata("mercado_atletas.json"),
+                "/pos-rodada/destaques": _testdata("pos_rodada_destaques.json"),
+                "/clubes": _testdata("clubes.json"),
+                "/time/id/471815": _testdata("time.json"),
+            }
+        )
+        self.hooks = MetricsCollector()
+        self.api = cartolafc.Api(
+            transport=self.transport, hooks=self.hooks, cache=WarmCache()
+        )
+        self.fechamento = datetime(2023, 4, 15, 23, 59)
+        self.agora = self.fechamento - timedelta(seconds=30)
+        self.scheduler = RefreshAheadScheduler(
+            self.api, time_ids=[471815], workers=4, now=lambda: self.agora
+        )
+
+    def _fechar_mercado(self):
+        self.transport.routes["/mercado/status"] = _testdata(
+            "mercado_status_fechado.json"
+        )
+
+    def test_tick_mercado_aberto(self):
+        # Arrange and Act
+        aquecidas = self.scheduler.tick()
+
+        # Assert
+        self.assertEqual(aquecidas, 4)
+        self.assertEqual(self.scheduler.next_delay(), 35)
+        self.assertEqual(self.transport.calls["/pos-rodada/destaques"], 1)
+        self.assertEqual(self.transport.calls["/atletas/pontuados"], 0)
+
+    def test_tick_mercado_fechado(self):
+        # Arrange
+        self.scheduler.tick()
+        self._fechar_mercado()
+        self.agora = self.fechamento + timedelta(seconds=5)
+
+        # Act
+        aquecidas = self.scheduler.tick()
+        chamadas = sum(self.transport.calls.values())
+        parciais = self.api.parciais()
+        time_parcial = self.api.time_parcial(471815)
+
+        # Assert
+        self.assertEqual(aquecidas, 3)
+        self.assertEqual(self.scheduler.next_delay(), 60)
+        self.assertEqual(sum(self.transport.calls.values()), chamadas)
+        self.assertTrue(parciais)
+        self.assertEqual(time_parcial.info.id, 471815)
+        self.assertEqual(self.hooks.counters["cache_hits"]["parciais"], 2)
+        self.assertEqual(self.hooks.counters["cache_hits"]["time"], 1)
+
+    def test_tick_sem_mudanca(self):
+        # Arrange
+        self._fechar_mercado()
+        self.scheduler.tick()
+
+        # Act
+        aquecidas = self.scheduler.tick()
+
+        # Assert
+        self.assertEqual(aquecidas, 1)
+        self.assertEqual(self.transport.calls["/atletas/pontuados"], 2)
+        self.assertEqual(self.transport.calls["/time/id/471815"], 1)
+
+    def test_single_flight(self):
+        # Arrange
+        cache = WarmCache()
+        chamadas = []
+
+        def fetch():
+            chamadas.append(1)
+            time.sleep(0.05)
+            return {"ok": True}
+
+        resultados = []
+        threads = [
+            threading.Thread(target=lambda: resultados.append(cache.load("k", fetch)))
+            for _ in range(8)
+        ]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(len(chamadas), 1)
+        self.assertEqual(resultados, [{"ok": True}] * 8)
+        self.assertNotIn("k", cache)
+
+    def test_warm_cache_expira(self):
+        # Arrange
+        agora = [0.0]
+        cache = WarmCache(clock=lambda: agora[0])
+        cache.put("k", {"ok": True}, ttl=10)
+
+        # Act
+        antes = cache.get("k")
+        agora[0] = 10.0
+        depois = cache.get("k")
+
+        # Assert
+        self.assertEqual(antes, {"ok": True})
+        self.assertIsNone(depois)
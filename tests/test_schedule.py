@@ -0,0 +1,102 @@
+import json
+import re
+import unittest
+from datetime import datetime, timedelta
+
+import requests_mock
+
+import cartolafc
+from cartolafc import CartolaFCError
+from cartolafc.schedule import SeasonSchedule
+
+
+class SeasonScheduleTest(unittest.TestCase):
+    with open("tests/testdata/partidas.json", "rb") as f:
+        PARTIDAS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        self.api = cartolafc.Api()
+        self.api_url = self.api._api_url
+        self.requisicoes = []
+
+    def _partidas(self, request, context):
+        # Cada rodada repete os jogos do fixture uma semana depois; as duas primeiras já têm placar.
+        rodada = int(request.path.rsplit("/", 1)[1])
+        self.requisicoes.append(rodada)
+        data = json.loads(json.dumps(self.PARTIDAS))
+        data["rodada"] = rodada
+        for partida in data["partidas"]:
+            inicio = datetime.fromisoformat(partida["partida_data"])
+            partida["partida_data"] = str(inicio + timedelta(weeks=rodada - 1))
+            if rodada <= 2:
+                partida["placar_oficial_mandante"] = 1
+                partida["placar_oficial_visitante"] = 0
+        return json.dumps(data)
+
+    def _tabela(self, m, rodadas=range(1, 5)):
+        m.get(re.compile(f"{self.api_url}/partidas/\\d+"), text=self._partidas)
+        return SeasonSchedule(self.api, rodadas=rodadas, workers=4).load()
+
+    def test_load(self):
+        with requests_mock.mock() as m:
+            # Arrange and Act
+            tabela = self._tabela(m)
+
+        # Assert
+        self.assertEqual(sorted(self.requisicoes), [1, 2, 3, 4])
+        self.assertEqual(len(tabela), 4 * len(self.PARTIDAS["partidas"]))
+        self.assertEqual(tabela.consolidated, [1, 2])
+        partidas = tabela.by_rodada(3)
+        self.assertEqual(len(partidas), len(self.PARTIDAS["partidas"]))
+        self.assertTrue(all(partida.rodada == 3 for partida in partidas))
+        self.assertEqual(
+            [partida.data for partida in partidas],
+            sorted(partida.data for partida in partidas),
+        )
+        self.assertIs(partidas[0].clube_casa, tabela.by_rodada(1)[0].clube_casa)
+
+    def test_refresh(self):
+        with requests_mock.mock() as m:
+            # Arrange
+            tabela = self._tabela(m)
+            self.requisicoes.clear()
+
+            # Act
+            tabela.refresh()
+
+        # Assert
+        self.assertEqual(sorted(self.requisicoes), [3, 4])
+        self.assertEqual(len(tabela), 4 * len(self.PARTIDAS["partidas"]))
+
+    def test_by_clube(self):
+        with requests_mock.mock() as m:
+            # Arrange and Act
+            tabela = self._tabela(m)
+
+        # Assert
+        partidas = tabela.by_clube(262)
+        self.assertEqual(len(partidas), 4)
+        self.assertEqual([partida.rodada for partida in partidas], [1, 2, 3, 4])
+        self.assertEqual(len(tabela.by_clube(262, mando="casa")), 4)
+        self.assertEqual(tabela.by_clube(262, mando="fora"), [])
+        self.assertEqual(len(tabela.by_clube(294, mando="fora")), 4)
+        with self.assertRaises(CartolaFCError):
+            tabela.by_clube(262, mando="neutro")
+
+    def test_datas(self):
+        with requests_mock.mock() as m:
+            # Arrange
+            tabela = self._tabela(m)
+        primeira = tabela.by_clube(262)[0]
+
+        # Act
+        proxima = tabela.next_match(262, a_partir=primeira.data + timedelta(hours=1))
+        janela = tabela.between(primeira.data, primeira.data + timedelta(days=6))
+        dia = tabela.by_date(primeira.data.date())
+
+        # Assert
+        self.assertEqual(proxima.rodada, 2)
+        self.assertIsNone(tabela.next_match(262, a_partir=datetime(2030, 1, 1)))
+        self.assertTrue(all(partida.rodada == 1 for partida in janela))
+        self.assertIn(primeira, janela)
+        self.assertIn(primeira, dia)
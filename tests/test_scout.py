@@ -0,0 +1,97 @@
+import json
+import pickle
+import unittest
+
+from cartolafc.models import Atleta, Clube
+from cartolafc.scout import SCOUTS, Scout
+from cartolafc.util import json_default
+
+
+class ScoutTest(unittest.TestCase):
+    def test_scout_leitura_compativel_com_dict(self):
+        # Arrange
+        data = {"CA": 1, "FC": 1, "FS": 2, "PE": 2, "SG": 1}
+
+        # Act
+        scout = Scout(data)
+
+        # Assert
+        self.assertEqual(scout, data)
+        self.assertEqual(dict(scout), data)
+        self.assertEqual(len(scout), 5)
+        self.assertEqual(scout["FS"], 2)
+        self.assertEqual(scout.get("G", 0), 0)
+        self.assertIn("SG", scout)
+        self.assertNotIn("G", scout)
+        with self.assertRaises(KeyError):
+            scout["G"]
+
+    def test_scout_vazio(self):
+        # Arrange and Act
+        scout = Scout()
+
+        # Assert
+        self.assertEqual(scout, {})
+        self.assertFalse(scout)
+        self.assertEqual(len(scout), 0)
+        self.assertEqual(list(Scout(None)), [])
+
+    def test_scout_codigo_desconhecido(self):
+        # Arrange and Act
+        scout = Scout({"G": 1, "XYZ": 4})
+
+        # Assert
+        self.assertEqual(scout, {"G": 1, "XYZ": 4})
+        self.assertEqual(scout.extras, {"XYZ": 4})
+
+    def test_scout_soma_e_diferenca(self):
+        # Arrange
+        anterior = Scout({"G": 1, "FS": 1})
+        atual = Scout({"G": 2, "FS": 1, "CA": 1})
+
+        # Act
+        diferenca = atual - anterior
+        soma = atual + anterior
+        total = Scout.total([anterior, atual, {"DS": 3}])
+
+        # Assert
+        self.assertEqual(diferenca, {"G": 1, "CA": 1})
+        self.assertEqual(soma, {"G": 3, "FS": 2, "CA": 1})
+        self.assertEqual(total, {"G": 3, "FS": 2, "CA": 1, "DS": 3})
+
+    def test_scout_valores(self):
+        # Arrange
+        scout = Scout({"A": 2, "V": 1})
+
+        # Act
+        valores = scout.values_array
+
+        # Assert
+        self.assertEqual(len(valores), len(SCOUTS))
+        self.assertEqual(valores[SCOUTS.index("A")], 2)
+        self.assertEqual(Scout.from_values(valores), scout)
+        self.assertEqual(Scout.from_bytes(scout.to_bytes()), scout)
+        self.assertEqual(len(scout.to_bytes()), 2 * len(SCOUTS))
+
+    def test_scout_pickle_e_json(self):
+        # Arrange
+        scout = Scout({"G": 1, "XYZ": 4})
+
+        # Act
+        reconstruido = pickle.loads(pickle.dumps(scout))
+        texto = json.dumps(scout, default=json_default)
+
+        # Assert
+        self.assertEqual(reconstruido, scout)
+        self.assertEqual(json.loads(texto), {"G": 1, "XYZ": 4})
+
+    def test_atleta_scout(self):
+        # Arrange
+        clube = Clube(262, "Flamengo", "FLA")
+
+        # Act
+        atleta = Atleta(1, "Juan", 2.9, {"SG": 1}, 3, clube)
+
+        # Assert
+        self.assertIsInstance(atleta.scout, Scout)
+        self.assertEqual(atleta.to_dict()["scout"], {"SG": 1})
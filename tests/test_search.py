@@ -0,0 +1,174 @@
+import json
+import unittest
+
+import requests_mock
+
+import cartolafc
+from cartolafc.metrics import MetricsCollector
+from cartolafc.models import Liga, TimeInfo
+from cartolafc.search import LIGAS, TIMES, SearchIndex, normalize
+
+
+class SearchIndexTest(unittest.TestCase):
+    with open("tests/testdata/times.json", "rb") as f:
+        TIMES = f.read().decode("utf8")
+    with open("tests/testdata/ligas.json", "rb") as f:
+        LIGAS = f.read().decode("utf8")
+
+    def setUp(self):
+        self.index = SearchIndex(min_results=2)
+        self.index.add_times(
+            [
+                TimeInfo(1, "Falydos FC", "Vicente Neto", "falydos-fc", True, None),
+                TimeInfo(2, "Fala Sério FC", "Maria", "fala-serio-fc", False, None),
+                TimeInfo(
+                    3, "Grêmio Cartoleiro", "João", "gremio-cartoleiro", False, None
+                ),
+            ]
+        )
+
+    def test_normalize(self):
+        # Arrange and Act
+        texto = normalize("  Grêmio_Cartoleiro-FC ")
+
+        # Assert
+        self.assertEqual(texto, "gremio cartoleiro fc")
+
+    def test_search_times_prefixo(self):
+        # Arrange and Act
+        fal = self.index.search_times("Fal")
+        serio = self.index.search_times("serio")
+        joao = self.index.search_times("joão")
+
+        # Assert
+        self.assertEqual(sorted(time.id for time in fal), [1, 2])
+        self.assertEqual([time.id for time in serio], [2])
+        self.assertEqual([time.id for time in joao], [3])
+        self.assertEqual(self.index.search_times("xyz"), [])
+
+    def test_search_times_aproximado(self):
+        # Arrange and Act
+        exato = self.index.search_times("fallydos")
+        aproximado = self.index.search_times("fallydos", fuzzy=True)
+
+        # Assert
+        self.assertEqual(exato, [])
+        self.assertEqual(aproximado[0].id, 1)
+
+    def test_search_times_renomeado(self):
+        # Arrange
+        self.index.add_time(
+            TimeInfo(1, "Outro Nome", "Vicente Neto", "outro-nome", True, None)
+        )
+
+        # Act
+        fal = self.index.search_times("faly")
+        outro = self.index.search_times("outro")
+
+        # Assert
+        self.assertEqual(fal, [])
+        self.assertEqual([time.id for time in outro], [1])
+
+    def test_add_liga(self):
+        # Arrange
+        liga = Liga(
+            10,
+            "Liga dos Amigos",
+            "liga-dos-amigos",
+            "",
+            [TimeInfo(20, "Amigos FC", "Pedro", "amigos-fc", False, 30.5)],
+        )
+
+        # Act
+        self.index.add_liga(liga)
+
+        # Assert
+        self.assertEqual(self.index.search_ligas("amigos"), [liga])
+        self.assertEqual([time.id for time in self.index.search_times("amigos")], [20])
+
+    def test_lookup(self):
+        # Arrange and Act
+        confiavel = self.index.lookup(TIMES, "fal")
+        poucos = self.index.lookup(TIMES, "grem")
+        self.index.record_query(TIMES, "grem", [])
+
+        # Assert
+        self.assertEqual(len(confiavel), 2)
+        self.assertIsNone(poucos)
+        self.assertEqual([time.id for time in self.index.lookup(TIMES, "grem")], [3])
+
+    def test_lookup_completo(self):
+        # Arrange
+        agora = [0.0]
+        index = SearchIndex(page_size=3, query_ttl=60, clock=lambda: agora[0])
+        index.add_times(
+            TimeInfo(i, f"Fla {i}", "", f"fla-{i}", False, None) for i in range(10)
+        )
+
+        # Act
+        sem_consulta = index.lookup(TIMES, "fla")
+        index.record_query(TIMES, "fla 1", [])
+        completa = index.lookup(TIMES, "fla 1")
+        agora[0] = 60.0
+        expirada = index.lookup(TIMES, "fla 1")
+
+        # Assert
+        self.assertIsNone(sem_consulta)
+        self.assertEqual([time.id for time in completa], [1])
+        self.assertIsNone(expirada)
+
+    def test_renomeado_remove_chaves(self):
+        # Arrange
+        chaves = len(self.index._colecoes[TIMES].chaves)
+
+        # Act
+        self.index.add_time(
+            TimeInfo(1, "Outro Nome", "Vicente Neto", "outro-nome", True, None)
+        )
+
+        # Assert
+        colecao = self.index._colecoes[TIMES]
+        self.assertEqual(colecao.chaves, sorted(colecao.chaves))
+        self.assertFalse(
+            any(chave.startswith("falydos") for chave, _ in colecao.chaves)
+        )
+        self.assertLessEqual(len(colecao.chaves), chaves)
+        self.assertNotIn(1, colecao.trigramas.get("fal", ()))
+
+    def test_api_times(self):
+        # Arrange
+        index = SearchIndex()
+        hooks = MetricsCollector()
+        api = cartolafc.Api(search_index=index, hooks=hooks)
+
+        with requests_mock.mock() as m:
+            m.get(f"{api._api_url}/times", text=self.TIMES)
+
+            # Act
+            primeira = api.times("Faly")
+            segunda = api.times("faly")
+
+        # Assert
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual([time.id for time in segunda], [time.id for time in primeira])
+        self.assertEqual(hooks.counters["cache_hits"]["times"], 1)
+        self.assertEqual([time.id for time in index.search_times("falydos")], [471815])
+
+    def test_api_ligas(self):
+        # Arrange
+        index = SearchIndex(page_size=50)
+        api = cartolafc.Api(search_index=index)
+
+        with requests_mock.mock() as m:
+            m.get(f"{api._api_url}/ligas", text=self.LIGAS)
+
+            # Act
+            ligas = api.ligas("time")
+            locais = api.ligas("time cartola")
+
+        # Assert
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(ligas), len(json.loads(self.LIGAS)))
+        self.assertEqual(locais[0].slug, "time-cartola-oficial")
+        self.assertTrue(index.search_ligas("time cartola"))
+        self.assertIsNotNone(index.lookup(LIGAS, "time"))
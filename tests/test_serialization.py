@@ -0,0 +1,137 @@
+import json
+import pickle
+import unittest
+
+import cartolafc
+from cartolafc.models import (
+    Atleta,
+    AtletaDestaque,
+    Clube,
+    DestaqueRodada,
+    Liga,
+    Mercado,
+    Partida,
+    Time,
+)
+from cartolafc.serialization import dumps, loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class SerializationTest(unittest.TestCase):
+    with open("tests/testdata/clubes.json", "rb") as f:
+        CLUBES = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/parciais.json", "rb") as f:
+        PARCIAIS = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/partidas.json", "rb") as f:
+        PARTIDAS = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/mercado_status_aberto.json", "rb") as f:
+        MERCADO = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/time.json", "rb") as f:
+        TIME = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/mercado_destaques.json", "rb") as f:
+        DESTAQUES = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/pos_rodada_destaques.json", "rb") as f:
+        POS_RODADA_DESTAQUES = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/ligas.json", "rb") as f:
+        LIGAS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        self.clubes = {
+            int(clube_id): Clube.from_dict(clube)
+            for clube_id, clube in self.CLUBES.items()
+        }
+        self.parciais = {
+            int(atleta_id): Atleta.from_dict(
+                atleta, clubes=self.clubes, atleta_id=int(atleta_id)
+            )
+            for atleta_id, atleta in self.PARCIAIS["atletas"].items()
+        }
+        atletas = [
+            dict(atleta, atleta_id=int(atleta_id), status_id=7)
+            for atleta_id, atleta in list(self.PARCIAIS["atletas"].items())[:12]
+        ]
+        self.time = Time.from_dict(
+            dict(self.TIME, atletas=atletas),
+            clubes=self.clubes,
+            capitao=atletas[0]["atleta_id"],
+        )
+        cartolafc.Api._calculate_parcial(self.time, self.parciais)
+        self.mercado = Mercado.from_dict(self.MERCADO)
+        self.partidas = [
+            Partida.from_dict(partida, clubes=self.clubes)
+            for partida in self.PARTIDAS["partidas"]
+        ]
+        self.modelos = [
+            self.time,
+            self.mercado,
+            self.partidas[0],
+            list(self.parciais.values())[0],
+            AtletaDestaque.from_dict(self.DESTAQUES[0]),
+            DestaqueRodada.from_dict(self.POS_RODADA_DESTAQUES),
+            Liga.from_dict(self.LIGAS[0]),
+        ]
+
+    def test_to_dict_json(self):
+        # Arrange
+        for modelo in self.modelos:
+            # Act
+            data = json.loads(json.dumps(modelo.to_dict()))
+            reconstruido = type(modelo).from_serialized(data)
+
+            # Assert
+            self.assertEqual(reconstruido.to_dict(), modelo.to_dict())
+            self.assertEqual(repr(reconstruido), repr(modelo))
+
+    def test_to_dict_mercado(self):
+        # Arrange and Act
+        data = self.mercado.to_dict()
+        reconstruido = Mercado.from_serialized(data)
+
+        # Assert
+        self.assertEqual(data["fechamento"], "2023-04-15T23:59:00")
+        self.assertEqual(data["status_id"], 1)
+        self.assertEqual(reconstruido.fechamento, self.mercado.fechamento)
+        self.assertEqual(reconstruido.status, self.mercado.status)
+
+    def test_to_dict_time_parcial(self):
+        # Arrange and Act
+        reconstruido = Time.from_serialized(self.time.to_dict())
+
+        # Assert
+        self.assertEqual(reconstruido.pontos, self.time.pontos)
+        self.assertEqual(reconstruido.jogados, self.time.jogados)
+        self.assertEqual(
+            [atleta.is_capitao for atleta in reconstruido.atletas],
+            [atleta.is_capitao for atleta in self.time.atletas],
+        )
+        self.assertEqual(sum(atleta.is_capitao for atleta in reconstruido.atletas), 1)
+
+    def test_pickle(self):
+        # Arrange and Act
+        reconstruido = pickle.loads(pickle.dumps(self.modelos))
+
+        # Assert
+        self.assertEqual(repr(reconstruido), repr(self.modelos))
+
+    @unittest.skipUnless(msgpack, "msgpack não está instalado")
+    def test_msgpack(self):
+        # Arrange
+        valor = dict(
+            parciais=self.parciais, partidas=self.partidas, modelos=self.modelos
+        )
+
+        # Act
+        data = dumps(valor)
+        reconstruido = loads(data)
+
+        # Assert
+        self.assertEqual(repr(reconstruido["modelos"]), repr(self.modelos))
+        self.assertEqual(repr(reconstruido["partidas"]), repr(self.partidas))
+        self.assertEqual(repr(reconstruido["parciais"]), repr(self.parciais))
+        self.assertLess(
+            len(data), len(json.dumps(valor, default=lambda o: o.to_dict()))
+        )
@@ -0,0 +1,159 @@
+import json
+import multiprocessing
+import sys
+import unittest
+
+from cartolafc import CartolaFCError
+from cartolafc.columnar import ParciaisColumns, pack_parciais
+from cartolafc.models import Atleta, Clube
+
+
+def _pontos_no_worker(nome, atleta_id, fila):
+    from cartolafc.shared import ParciaisSubscriber
+
+    with ParciaisSubscriber(nome) as subscriber:
+        snapshot = subscriber.snapshot()
+        fila.put((snapshot.version, snapshot.pontos_of(atleta_id)))
+
+
+class ParciaisColumnsTest(unittest.TestCase):
+    with open("tests/testdata/parciais.json", "rb") as f:
+        PARCIAIS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        clubes = {
+            clube["id"]: Clube.from_dict(clube)
+            for clube in self.PARCIAIS["clubes"].values()
+        }
+        self.parciais = {
+            int(atleta_id): Atleta.from_dict(
+                atleta, clubes=clubes, atleta_id=int(atleta_id)
+            )
+            for atleta_id, atleta in self.PARCIAIS["atletas"].items()
+            if atleta["clube_id"] > 0
+        }
+
+    def test_pack_parciais(self):
+        # Arrange and Act
+        colunas = ParciaisColumns(pack_parciais(self.parciais))
+
+        # Assert
+        self.assertEqual(len(colunas), len(self.parciais))
+        self.assertEqual(list(colunas), sorted(self.parciais))
+        self.assertEqual(colunas.scouts.shape, (len(self.parciais), 24))
+        for atleta_id, atleta in self.parciais.items():
+            self.assertEqual(colunas.pontos_of(atleta_id), atleta.pontos)
+            self.assertEqual(colunas.scout_of(atleta_id), atleta.scout)
+            self.assertEqual(colunas.status_of(atleta_id), atleta.status)
+        reconstruido = colunas.to_dict()[36540]
+        self.assertEqual(reconstruido.apelido, self.parciais[36540].apelido)
+        self.assertEqual(reconstruido.clube.nome, self.parciais[36540].clube.nome)
+        self.assertEqual(reconstruido.posicao, self.parciais[36540].posicao)
+        self.assertNotIn(1, colunas)
+        with self.assertRaises(KeyError):
+            colunas.pontos_of(1)
+
+    def test_buffer_invalido(self):
+        # Act and Assert
+        with self.assertRaises(CartolaFCError):
+            ParciaisColumns(bytes(64))
+
+    @unittest.skipIf(sys.version_info < (3, 8), "Requer multiprocessing.shared_memory")
+    def test_publish_subscribe(self):
+        # Arrange
+        from cartolafc.shared import ParciaisPublisher, ParciaisSubscriber
+
+        with ParciaisPublisher() as publisher:
+            with ParciaisSubscriber(publisher.name) as subscriber:
+                vazio = subscriber.snapshot()
+
+                # Act
+                publisher.publish(self.parciais)
+                primeiro = subscriber.snapshot()
+                pontos = primeiro.pontos_of(36540)
+                self.parciais.pop(36540)
+                publisher.publish(self.parciais)
+                segundo = subscriber.snapshot()
+                publisher.publish(self.parciais)
+
+                # Assert
+                self.assertIsNone(vazio)
+                self.assertEqual((primeiro.version, segundo.version), (1, 2))
+                self.assertEqual(subscriber.version, 3)
+                self.assertEqual(pontos, 2.9)
+                self.assertNotIn(36540, segundo)
+                self.assertFalse(primeiro.valid)
+                self.assertTrue(segundo.valid)
+                self.assertEqual(len(subscriber.to_dict()), len(self.parciais))
+                self.assertTrue(subscriber.wait_for(3, timeout=0))
+                self.assertFalse(subscriber.wait_for(4, timeout=0))
+
+    @unittest.skipIf(sys.version_info < (3, 8), "Requer multiprocessing.shared_memory")
+    def test_publish_durante_leitura(self):
+        # Arrange
+        from cartolafc.shared import ParciaisPublisher, ParciaisSubscriber
+
+        with ParciaisPublisher() as publisher:
+            with ParciaisSubscriber(publisher.name) as subscriber:
+                publisher.publish(self.parciais)
+                primeiro = subscriber.snapshot()
+                publisher.publish(self.parciais)
+                durante = []
+                copiar = publisher._copiar
+
+                def copiar_interrompido(offset, bloco):
+                    # Lê enquanto a versão 3 sobrescreve, pela metade, o slot da versão 1.
+                    metade = len(bloco) // 2
+                    copiar(offset, bloco[:metade])
+                    snapshot = subscriber.snapshot()
+                    durante.append(
+                        (primeiro.valid, subscriber.version, snapshot.version)
+                    )
+                    snapshot.release()
+                    copiar(offset + metade, bloco[metade:])
+
+                publisher._copiar = copiar_interrompido
+                self.parciais.pop(36540)
+
+                # Act
+                publisher.publish(self.parciais)
+
+                # Assert
+                self.assertEqual(durante, [(False, 2, 2)])
+                self.assertFalse(primeiro.valid)
+                terceiro = subscriber.snapshot()
+                self.assertEqual(terceiro.version, 3)
+                self.assertNotIn(36540, terceiro)
+                self.assertEqual(len(subscriber.to_dict()), len(self.parciais))
+
+    @unittest.skipIf(sys.version_info < (3, 8), "Requer multiprocessing.shared_memory")
+    def test_publish_capacidade(self):
+        # Arrange
+        from cartolafc.shared import ParciaisPublisher
+
+        with ParciaisPublisher(capacity=1024) as publisher:
+            # Act and Assert
+            with self.assertRaises(CartolaFCError):
+                publisher.publish(self.parciais)
+            self.assertEqual(publisher.version, 0)
+
+    @unittest.skipIf(sys.version_info < (3, 8), "Requer multiprocessing.shared_memory")
+    def test_subscriber_em_outro_processo(self):
+        # Arrange
+        from cartolafc.shared import ParciaisPublisher
+
+        fila = multiprocessing.Queue()
+        with ParciaisPublisher() as publisher:
+            publisher.publish(self.parciais)
+
+            # Act
+            processo = multiprocessing.Process(
+                target=_pontos_no_worker, args=(publisher.name, 36540, fila)
+            )
+            processo.start()
+            resultado = fila.get(timeout=30)
+            processo.join()
+
+        # Assert
+        self.assertEqual(resultado, (1, 2.9))
+        self.assertEqual(processo.exitcode, 0)
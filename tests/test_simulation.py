@@ -0,0 +1,85 @@
+import unittest
+
+from cartolafc.models import Atleta, Clube, Time, TimeInfo
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    from cartolafc.simulation import Empirical, Normal, RoundSimulator
+
+
+@unittest.skipUnless(numpy, "numpy não está instalado")
+class RoundSimulatorTest(unittest.TestCase):
+    def setUp(self):
+        self.clube = Clube(262, "Flamengo", "FLA")
+
+    def _time(self, time_id, atletas, capitao):
+        return Time(
+            0,
+            0,
+            0,
+            [
+                Atleta(atleta_id, "", 0, {}, 5, self.clube, 7, atleta_id == capitao)
+                for atleta_id in atletas
+            ],
+            TimeInfo(time_id, f"Time {time_id}", "", "", False, None),
+        )
+
+    def test_run_deterministico(self):
+        # Arrange
+        times = [self._time(1, [1, 2], 1), self._time(2, [1, 2], 2)]
+        distribuicoes = {1: Empirical([5.0]), 2: Empirical([3.0])}
+
+        # Act
+        resultado = RoundSimulator(times, distribuicoes, seed=1).run(100)
+
+        # Assert
+        self.assertEqual(resultado.win_probability(), {1: 1.0, 2: 0.0})
+        self.assertEqual(resultado.rank_distribution(), {1: [1.0, 0.0], 2: [0.0, 1.0]})
+        self.assertEqual(resultado.expected_rank(), {1: 1.0, 2: 2.0})
+
+    def test_run_probabilidades(self):
+        # Arrange
+        times = [
+            self._time(1, [1, 2, 3], 1),
+            self._time(2, [1, 2, 4], 1),
+            self._time(3, [5, 6, 7], 7),
+        ]
+        distribuicoes = {
+            1: Normal(6.0, 4.0),
+            2: Normal(3.0, 3.0),
+            3: Normal(4.0, 5.0),
+            4: Normal(4.0, 5.0),
+            5: Normal(1.0, 1.0),
+            6: Normal(1.0, 1.0),
+            7: Empirical([0.0, 1.0, 2.0]),
+        }
+
+        # Act
+        resultado = RoundSimulator(times, distribuicoes, seed=7).run(
+            20_000, batch_size=3_000
+        )
+
+        # Assert
+        probabilidades = resultado.win_probability()
+        self.assertAlmostEqual(sum(probabilidades.values()), 1.0)
+        self.assertAlmostEqual(probabilidades[1], 0.5, delta=0.02)
+        self.assertLess(probabilidades[3], 0.1)
+        for posicoes in resultado.rank_distribution().values():
+            self.assertAlmostEqual(sum(posicoes), 1.0)
+        self.assertEqual(resultado.posicoes.sum(axis=0).tolist(), [20_000] * 3)
+
+    def test_run_seed(self):
+        # Arrange
+        times = [self._time(time_id, [time_id, 10], 10) for time_id in range(1, 6)]
+
+        # Act
+        primeiro = RoundSimulator(times, seed=3).run(1_000, ranking=False)
+        segundo = RoundSimulator(times, seed=3).run(1_000, ranking=False)
+
+        # Assert
+        self.assertEqual(primeiro.vitorias.tolist(), segundo.vitorias.tolist())
+        self.assertEqual(primeiro.vitorias.sum(), 1_000)
+        self.assertIsNone(primeiro.posicoes)
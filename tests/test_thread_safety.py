@@ -0,0 +1,109 @@
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import cartolafc
+from benchmarks.stub_server import StubServer, load_testdata_routes
+from cartolafc.circuit import CircuitBreaker
+from cartolafc.metrics import MetricsCollector
+from cartolafc.refresh import WarmCache
+from cartolafc.search import SearchIndex
+from cartolafc.util import json_default
+
+THREADS = 32
+
+# pos_rodada_destaques() exige o mercado aberto, e parciais() o mercado fechado, como nos dados de testes.
+_chamadas = [
+    ("clubes", ()),
+    ("ligas", ("premiere",)),
+    ("patrocinadores", ()),
+    ("mercado", ()),
+    ("mercado_atletas", ()),
+    ("parciais", ()),
+    ("partidas", ()),
+    ("destaques", ()),
+    ("destaques_reservas", ()),
+    ("time", (471815,)),
+    ("times", ("termo",)),
+]
+
+
+def _serializar(resultado):
+    return json.dumps(resultado, default=json_default, sort_keys=True)
+
+
+class ThreadSafetyTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(load_testdata_routes()).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _api(self, **kwargs):
+        api = cartolafc.Api(**kwargs)
+        api._api_url = self.server.url
+        return api
+
+    def _chamar(self, api, indice):
+        nome, args = _chamadas[indice % len(_chamadas)]
+        return nome, _serializar(getattr(api, nome)(*args))
+
+    def test_api_compartilhada(self):
+        # Arrange
+        esperado = dict(self._chamar(self._api(), i) for i in range(len(_chamadas)))
+        requisicoes = self.server.requests
+        metrics = MetricsCollector()
+        api = self._api(
+            hooks=metrics,
+            search_index=SearchIndex(),
+            circuit_breaker=CircuitBreaker(),
+        )
+        chamadas = THREADS * len(_chamadas)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            resultados = list(
+                executor.map(lambda i: self._chamar(api, i), range(chamadas))
+            )
+
+        # Assert
+        for nome, resultado in resultados:
+            self.assertEqual(resultado, esperado[nome], nome)
+        contadores = metrics.snapshot()
+        self.assertEqual(
+            sum(contadores["requests"].values()), self.server.requests - requisicoes
+        )
+        self.assertNotIn("errors", contadores)
+        self.assertLessEqual(len(api._transport._sessions), THREADS)
+        self.assertFalse(api.last_response_stale)
+        api._transport.close()
+
+    def test_warm_cache_concorrente(self):
+        # Arrange
+        agora = [0.0]
+        cache = WarmCache(clock=lambda: agora[0])
+        inconsistentes = []
+
+        def executar(thread_id):
+            for i in range(2000):
+                chave = f"chave-{i % 10}"
+                if i % 3 == thread_id % 3:
+                    cache.put(chave, (chave, i), ttl=1.0 + i % 2)
+                valor = cache.get(chave)
+                if valor is not None and valor[0] != chave:
+                    inconsistentes.append(valor)
+                if i % 500 == 0:
+                    agora[0] += 1.0
+
+        threads = [threading.Thread(target=executar, args=(i,)) for i in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(inconsistentes, [])
+        self.assertLessEqual(len(cache), 10)
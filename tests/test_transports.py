@@ -0,0 +1,195 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests_mock
+
+import cartolafc
+from benchmarks.stub_server import StubServer
+from benchmarks.synthetic import SyntheticCartola
+from cartolafc.transports import (
+    HttpxTransport,
+    RecordingTransport,
+    ReplayTransport,
+    Response,
+    Transport,
+    read_recordings,
+    request_key,
+)
+
+try:
+    import h2
+    import httpx
+except ImportError:  # pragma: no cover
+    h2 = httpx = None
+
+
+class TransportsTest(unittest.TestCase):
+    with open("tests/testdata/mercado_status_aberto.json", "rb") as f:
+        MERCADO_STATUS_ABERTO = f.read().decode("utf8")
+    with open("tests/testdata/mercado_status_fechado.json", "rb") as f:
+        MERCADO_STATUS_FECHADO = f.read().decode("utf8")
+    with open("tests/testdata/times.json", "rb") as f:
+        TIMES = f.read().decode("utf8")
+
+    def setUp(self):
+        self.api_url = cartolafc.Api()._api_url
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.diretorio.name, "gravacao.gz")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _gravar(self):
+        with requests_mock.mock() as m:
+            m.get(
+                f"{self.api_url}/mercado/status",
+                response_list=[
+                    dict(text=self.MERCADO_STATUS_ABERTO),
+                    dict(text=self.MERCADO_STATUS_FECHADO),
+                ],
+            )
+            m.get(f"{self.api_url}/times", text=self.TIMES)
+
+            with RecordingTransport(self.path) as transport:
+                api = cartolafc.Api(transport=transport)
+                api.mercado()
+                api.times(query="Faly")
+                api.mercado()
+
+    def test_request_key(self):
+        # Arrange and Act
+        key = request_key(f"{self.api_url}/times", dict(q="Faly", a=1))
+
+        # Assert
+        self.assertEqual(key, "/times?a=1&q=Faly")
+
+    def test_recording_transport(self):
+        # Arrange and Act
+        self._gravar()
+        gravacoes = list(read_recordings(self.path))
+
+        # Assert
+        self.assertEqual(len(gravacoes), 3)
+        self.assertEqual(gravacoes[0].url, f"{self.api_url}/mercado/status")
+        self.assertEqual(
+            gravacoes[0].content.decode("utf8"), self.MERCADO_STATUS_ABERTO
+        )
+        self.assertEqual(gravacoes[1].params, dict(q="Faly"))
+        self.assertEqual(
+            gravacoes[2].content.decode("utf8"), self.MERCADO_STATUS_FECHADO
+        )
+        self.assertLessEqual(gravacoes[0].t, gravacoes[2].t)
+
+    def test_recording_transport_sem_cabecalhos(self):
+        # Arrange
+        class SemCabecalhos(Transport):
+            def get(self, url, params=None):
+                return Response(200, b'{"status": "ok"}', None)
+
+        # Act
+        with RecordingTransport(self.path, SemCabecalhos()) as transport:
+            response = transport.get(f"{self.api_url}/clubes")
+        gravacoes = list(read_recordings(self.path))
+
+        # Assert
+        self.assertIsNone(response.headers)
+        self.assertEqual(len(gravacoes), 1)
+        self.assertIsNone(gravacoes[0].content_type)
+        self.assertEqual(gravacoes[0].content, b'{"status": "ok"}')
+
+    def test_replay_transport_velocidade_maxima(self):
+        # Arrange
+        self._gravar()
+        api = cartolafc.Api(transport=ReplayTransport(self.path))
+
+        # Act
+        primeiro = api.mercado()
+        times = api.times(query="Faly")
+        segundo = api.mercado()
+        terceiro = api.mercado()
+
+        # Assert
+        self.assertEqual(primeiro.status.id, 1)
+        self.assertEqual(times[0].id, 471815)
+        self.assertEqual(segundo.status.id, 2)
+        self.assertEqual(terceiro.status.id, 2)
+
+    def test_replay_transport_relogio_da_gravacao(self):
+        # Arrange
+        self._gravar()
+        transport = ReplayTransport(self.path, speed=1.0)
+        api = cartolafc.Api(transport=transport)
+
+        # Act
+        inicio = api.mercado()
+        time.sleep(0.05)
+        depois = api.mercado()
+
+        # Assert
+        self.assertEqual(inicio.status.id, 1)
+        self.assertEqual(depois.status.id, 2)
+        self.assertEqual(len(transport), 3)
+
+    def test_replay_transport_sem_gravacao(self):
+        # Arrange
+        self._gravar()
+        api = cartolafc.Api(transport=ReplayTransport(self.path))
+
+        # Act and Assert
+        with self.assertRaisesRegex(cartolafc.CartolaFCError, "/clubes"):
+            api.clubes()
+
+    def test_conexoes_http1(self):
+        # Arrange
+        dados = SyntheticCartola(times=8)
+        with StubServer(dados.routes()) as server:
+            api = cartolafc.Api()
+            api._api_url = server.url
+
+            # Act
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(api.time, dados.time_ids))
+
+        # Assert
+        self.assertGreater(server.connections, 2)
+
+
+@unittest.skipUnless(httpx and h2, "Requer os pacotes httpx e h2")
+class HttpxTransportTest(unittest.TestCase):
+    def setUp(self):
+        from benchmarks.h2_server import H2StubServer
+
+        self.dados = SyntheticCartola(times=40)
+        self.server = H2StubServer(self.dados.routes(), latency=0.005).start()
+        self.transport = HttpxTransport(prior_knowledge=True, max_connections=2)
+        self.api = cartolafc.Api(transport=self.transport)
+        self.api._api_url = self.server.url
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.stop()
+
+    def test_mercado(self):
+        # Act
+        mercado = self.api.mercado()
+
+        # Assert
+        self.assertEqual(mercado.rodada_atual, self.dados.rodada_atual)
+
+    def test_times_multiplexados(self):
+        # Act
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            times = list(executor.map(self.api.time, self.dados.time_ids))
+
+        # Assert
+        self.assertEqual([time.info.id for time in times], list(self.dados.time_ids))
+        self.assertLessEqual(self.server.connections, 2)
+        self.assertGreater(self.server.requests, 40)
+
+    def test_time_inexistente(self):
+        # Act and Assert
+        with self.assertRaises(cartolafc.CartolaFCError):
+            self.api.time(123)
@@ -1,9 +1,16 @@
 import json
+import logging
 import unittest
 from datetime import datetime
 
+import cartolafc
 from cartolafc.models import Mercado
-from cartolafc.util import json_default
+from cartolafc.util import (
+    PREVIEW_SIZE,
+    RateLimitedLog,
+    json_default,
+    parse_and_check_cartolafc,
+)
 
 
 class ApiAttemptsTest(unittest.TestCase):
@@ -27,3 +34,70 @@ class ApiAttemptsTest(unittest.TestCase):
         mercado = Mercado.from_dict(json.loads(self.MERCADO))
         result = json_default(mercado)
         assert isinstance(result, dict)
+
+    def test_parse_and_check_classificacao(self):
+        # Arrange
+        pagina = b"<html>" + b"Servidores sobrecarregados " * 20000 + b"</html>"
+        truncado = self.MERCADO[: len(self.MERCADO) // 2].encode("utf-8")
+        casos = [
+            (pagina, 503, "text/html", cartolafc.CartolaFCOverloadError),
+            (pagina, 200, "text/html", cartolafc.CartolaFCOverloadError),
+            (
+                truncado,
+                200,
+                "application/json",
+                cartolafc.CartolaFCMalformedResponseError,
+            ),
+            (
+                b'{"mensagem": "Time inexistente"}',
+                404,
+                None,
+                cartolafc.CartolaFCHTTPError,
+            ),
+            (b"Not Found", 404, "text/plain", cartolafc.CartolaFCHTTPError),
+            ('{"mensagem": "Erro"}', None, None, cartolafc.CartolaFCError),
+        ]
+
+        for json_data, status_code, content_type, classe in casos:
+            # Act
+            with self.assertRaises(cartolafc.CartolaFCError) as contexto:
+                parse_and_check_cartolafc(json_data, status_code, content_type)
+
+            # Assert
+            erro = contexto.exception
+            self.assertIs(type(erro), classe)
+            if erro.preview is not None:
+                self.assertLessEqual(len(erro.preview), PREVIEW_SIZE)
+                self.assertEqual(erro.size, len(json_data))
+                self.assertEqual(erro.status_code, status_code)
+        self.assertEqual(
+            parse_and_check_cartolafc(self.MERCADO.encode("utf-8"), 200),
+            json.loads(self.MERCADO),
+        )
+
+    def test_rate_limited_log(self):
+        # Arrange
+        agora = [0.0]
+        log = RateLimitedLog(
+            interval=10,
+            log=logging.getLogger("cartolafc.teste"),
+            clock=lambda: agora[0],
+        )
+
+        # Act
+        with self.assertLogs("cartolafc.teste", logging.ERROR) as logs:
+            for instante in (0.0, 1.0, 2.0, 3.0, 11.0):
+                agora[0] = instante
+                log.log(logging.ERROR, "malformado", "Resposta inválida")
+                log.log(logging.ERROR, "http", "Erro HTTP")
+
+        # Assert
+        self.assertEqual(
+            logs.output,
+            [
+                "ERROR:cartolafc.teste:Resposta inválida",
+                "ERROR:cartolafc.teste:Erro HTTP",
+                "ERROR:cartolafc.teste:Resposta inválida (3 ocorrências suprimidas)",
+                "ERROR:cartolafc.teste:Erro HTTP (3 ocorrências suprimidas)",
+            ],
+        )
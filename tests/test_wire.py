@@ -0,0 +1,131 @@
+import json
+import unittest
+
+from cartolafc import CartolaFCError
+from cartolafc.models import Atleta, Clube
+from cartolafc.util import json_default
+from cartolafc.wire import (
+    SnapshotEncoder,
+    WireSnapshot,
+    decode_columns,
+    decode_snapshot,
+    encode_delta,
+    encode_snapshot,
+)
+
+
+class WireTest(unittest.TestCase):
+    with open("tests/testdata/clubes.json", "rb") as f:
+        CLUBES = json.loads(f.read().decode("utf8"))
+    with open("tests/testdata/parciais.json", "rb") as f:
+        PARCIAIS = json.loads(f.read().decode("utf8"))
+
+    def setUp(self):
+        clubes = {int(c): Clube.from_dict(clube) for c, clube in self.CLUBES.items()}
+        self.parciais = {
+            int(i): Atleta.from_dict(a, clubes=clubes, atleta_id=int(i))
+            for i, a in self.PARCIAIS["atletas"].items()
+        }
+
+    def _atualizar(self, atleta, pontos, scout, status_id=7):
+        return Atleta(
+            atleta.id,
+            atleta.apelido,
+            pontos,
+            scout,
+            atleta.posicao.id,
+            atleta.clube,
+            status_id,
+        )
+
+    def assertMesmasParciais(self, decodificadas, esperadas):
+        def campos(atleta):
+            return (
+                atleta.apelido,
+                atleta.pontos,
+                dict(atleta.scout),
+                atleta.posicao.id,
+                atleta.clube.id,
+                atleta.clube.nome,
+                atleta.status.id if atleta.status else None,
+            )
+
+        self.assertEqual(
+            {atleta_id: campos(atleta) for atleta_id, atleta in decodificadas.items()},
+            {atleta_id: campos(atleta) for atleta_id, atleta in esperadas.items()},
+        )
+
+    def test_snapshot_completo(self):
+        # Act
+        dados = encode_snapshot(self.parciais, version=3)
+        snapshot = decode_snapshot(dados)
+
+        # Assert
+        self.assertEqual(snapshot.version, 3)
+        self.assertMesmasParciais(snapshot.parciais, self.parciais)
+        self.assertLess(
+            len(dados), len(json.dumps(self.parciais, default=json_default)) / 5
+        )
+
+    def test_delta(self):
+        # Arrange
+        juan, removido = 36540, max(self.parciais)
+        atualizadas = dict(self.parciais)
+        atualizadas[juan] = self._atualizar(
+            self.parciais[juan], 4.4, {"FS": 2, "DS": 1}
+        )
+        atualizadas[1] = Atleta(
+            1, "Estreante", 1.234, {"A": 1}, 5, self.parciais[juan].clube, 7
+        )
+        del atualizadas[removido]
+        base = WireSnapshot(1, self.parciais)
+
+        # Act
+        delta = encode_delta(self.parciais, atualizadas, 2, 1)
+        snapshot = decode_snapshot(delta, base)
+        colunas = decode_columns(delta, base)
+
+        # Assert
+        self.assertLess(len(delta), 100)
+        self.assertEqual(snapshot.version, 2)
+        self.assertMesmasParciais(snapshot.parciais, atualizadas)
+        self.assertEqual(colunas.pontos_of(juan), 4.4)
+        self.assertNotIn(removido, colunas)
+        self.assertEqual(len(self.parciais), len(base.parciais))
+
+    def test_delta_base_incorreta(self):
+        # Arrange
+        delta = encode_delta(self.parciais, self.parciais, 2, 1)
+
+        # Act and Assert
+        with self.assertRaises(CartolaFCError):
+            decode_snapshot(delta, WireSnapshot(0, self.parciais))
+        with self.assertRaises(CartolaFCError):
+            decode_snapshot(delta)
+        with self.assertRaises(CartolaFCError):
+            decode_snapshot(b"CFCW")
+
+    def test_snapshot_encoder(self):
+        # Arrange
+        encoder = SnapshotEncoder(history=2)
+        juan = self.parciais[36540]
+        versoes = [encoder.update(self.parciais), encoder.update(dict(self.parciais))]
+        historico = []
+        for pontos in (5.0, 6.0):
+            atualizadas = dict(self.parciais)
+            atualizadas[juan.id] = self._atualizar(juan, pontos, juan.scout)
+            versoes.append(encoder.update(atualizadas))
+            historico.append(atualizadas)
+
+        # Act
+        delta = encoder.encode(since=2)
+        completo = encoder.encode(since=1)
+
+        # Assert
+        self.assertEqual(versoes, [1, 1, 2, 3])
+        self.assertLess(len(delta), len(completo) / 10)
+        snapshot = decode_snapshot(delta, WireSnapshot(2, historico[0]))
+        self.assertEqual(snapshot.parciais[juan.id].pontos, 6.0)
+        self.assertEqual(decode_snapshot(completo).parciais[juan.id].pontos, 6.0)
+        with self.assertRaises(CartolaFCError):
+            SnapshotEncoder().encode()